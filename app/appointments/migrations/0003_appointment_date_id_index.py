@@ -0,0 +1,26 @@
+# Generated by Django 5.2.9 on 2026-10-17 16:17
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("appointments", "0002_appointment_uuid"),
+        ("professionals", "0003_professional_uuid"),
+    ]
+
+    operations = [
+        migrations.AlterModelOptions(
+            name="appointment",
+            options={
+                "ordering": ["-date", "-id"],
+                "verbose_name": "Consulta",
+                "verbose_name_plural": "Consultas",
+            },
+        ),
+        migrations.AddIndex(
+            model_name="appointment",
+            index=models.Index(fields=["-date", "-id"], name="appointment_date_id_idx"),
+        ),
+    ]
@@ -0,0 +1,21 @@
+# Generated by Django 5.2.9 on 2026-10-17 16:20
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("appointments", "0003_appointment_date_id_index"),
+        ("professionals", "0003_professional_uuid"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="appointment",
+            index=models.Index(
+                fields=["professional", "-date", "-id"],
+                name="appointment_prof_date_idx",
+            ),
+        ),
+    ]
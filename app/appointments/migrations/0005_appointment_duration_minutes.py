@@ -0,0 +1,27 @@
+# Generated by Django 5.2.9 on 2026-10-17 17:05
+
+import django.core.validators
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("appointments", "0004_appointment_professional_date_index"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="appointment",
+            name="duration_minutes",
+            field=models.PositiveSmallIntegerField(
+                default=30,
+                help_text="Duração da consulta em minutos",
+                validators=[
+                    django.core.validators.MinValueValidator(1),
+                    django.core.validators.MaxValueValidator(1440),
+                ],
+                verbose_name="Duração (minutos)",
+            ),
+        ),
+    ]
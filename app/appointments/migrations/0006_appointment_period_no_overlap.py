@@ -0,0 +1,101 @@
+# Generated by Django 5.2.9 on 2026-10-17 17:40
+
+from typing import Any
+
+import django.contrib.postgres.constraints
+import django.contrib.postgres.fields.ranges
+from django.contrib.postgres.operations import BtreeGistExtension
+from django.db import migrations
+
+# Cada consulta que começa antes do fim de uma anterior do mesmo profissional
+OVERLAPS_SQL = """
+    SELECT uuid, professional_id, date, duration_minutes
+    FROM (
+        SELECT
+            uuid,
+            professional_id,
+            date,
+            duration_minutes,
+            MAX(upper(period)) OVER (
+                PARTITION BY professional_id
+                ORDER BY date, id
+                ROWS BETWEEN UNBOUNDED PRECEDING AND 1 PRECEDING
+            ) AS previous_end
+        FROM appointments_appointment
+    ) AS appointments
+    WHERE previous_end > date
+    ORDER BY professional_id, date
+"""
+REPORTED_OVERLAPS = 50
+
+
+def check_overlaps(apps: Any, schema_editor: Any) -> None:
+    """
+    Interrompe a migração se já houver consultas sobrepostas.
+
+    A restrição de exclusão falharia com um erro genérico do PostgreSQL; aqui,
+    as consultas em conflito são listadas para serem remarcadas ou excluídas
+    antes de rodar a migração de novo.
+    """
+    with schema_editor.connection.cursor() as cursor:
+        cursor.execute(OVERLAPS_SQL)
+        overlaps = cursor.fetchall()
+    if not overlaps:
+        return
+
+    lines = [
+        f"- consulta {uuid} (profissional {professional_id}, {date:%Y-%m-%d %H:%M}"
+        f" UTC, {duration} min)"
+        for uuid, professional_id, date, duration in overlaps[:REPORTED_OVERLAPS]
+    ]
+    if len(overlaps) > REPORTED_OVERLAPS:
+        lines.append(f"- e mais {len(overlaps) - REPORTED_OVERLAPS}")
+    raise RuntimeError(
+        f"{len(overlaps)} consulta(s) começam antes do fim de uma consulta "
+        "anterior do mesmo profissional. Remarque ou exclua as consultas "
+        "abaixo e rode a migração de novo:\n" + "\n".join(lines)
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("appointments", "0005_appointment_duration_minutes"),
+    ]
+
+    operations = [
+        # Necessária para comparar professional_id por igualdade no índice GiST
+        BtreeGistExtension(),
+        migrations.AddField(
+            model_name="appointment",
+            name="period",
+            field=django.contrib.postgres.fields.ranges.DateTimeRangeField(
+                editable=False,
+                help_text="Intervalo ocupado pela consulta, de date até date + duração",
+                null=True,
+                verbose_name="Período",
+            ),
+        ),
+        migrations.RunSQL(
+            sql="UPDATE appointments_appointment "
+            "SET period = tstzrange(date, date + duration_minutes * interval '1 minute')",
+            reverse_sql=migrations.RunSQL.noop,
+        ),
+        migrations.RunPython(check_overlaps, migrations.RunPython.noop),
+        migrations.AlterField(
+            model_name="appointment",
+            name="period",
+            field=django.contrib.postgres.fields.ranges.DateTimeRangeField(
+                editable=False,
+                help_text="Intervalo ocupado pela consulta, de date até date + duração",
+                verbose_name="Período",
+            ),
+        ),
+        migrations.AddConstraint(
+            model_name="appointment",
+            constraint=django.contrib.postgres.constraints.ExclusionConstraint(
+                expressions=[("professional", "="), ("period", "&&")],
+                name="appointment_no_overlap",
+            ),
+        ),
+    ]
@@ -1,6 +1,15 @@
 import uuid
+from datetime import timedelta
+from typing import Any
 
+from django.contrib.postgres.constraints import ExclusionConstraint
+from django.contrib.postgres.fields import DateTimeRangeField, RangeOperators
+from django.core.validators import MaxValueValidator, MinValueValidator
 from django.db import models
+from django.db.backends.postgresql.psycopg_any import DateTimeTZRange
+
+MAX_DURATION_MINUTES = 24 * 60
+OVERLAP_CONSTRAINT = "appointment_no_overlap"
 
 
 class Appointment(models.Model):
@@ -16,6 +25,17 @@ class Appointment(models.Model):
         verbose_name="Data da Consulta",
         help_text="Data e horário da consulta",
     )
+    duration_minutes = models.PositiveSmallIntegerField(
+        default=30,
+        validators=[MinValueValidator(1), MaxValueValidator(MAX_DURATION_MINUTES)],
+        verbose_name="Duração (minutos)",
+        help_text="Duração da consulta em minutos",
+    )
+    period = DateTimeRangeField(
+        editable=False,
+        verbose_name="Período",
+        help_text="Intervalo ocupado pela consulta, de date até date + duração",
+    )
     professional = models.ForeignKey(
         "professionals.Professional",
         on_delete=models.CASCADE,
@@ -29,7 +49,39 @@ class Appointment(models.Model):
     class Meta:
         verbose_name = "Consulta"
         verbose_name_plural = "Consultas"
-        ordering = ["-date"]
+        ordering = ["-date", "-id"]
+        indexes = [
+            models.Index(fields=["-date", "-id"], name="appointment_date_id_idx"),
+            models.Index(
+                fields=["professional", "-date", "-id"],
+                name="appointment_prof_date_idx",
+            ),
+        ]
+        constraints = [
+            ExclusionConstraint(
+                name=OVERLAP_CONSTRAINT,
+                expressions=[
+                    ("professional", RangeOperators.EQUAL),
+                    ("period", RangeOperators.OVERLAPS),
+                ],
+            ),
+        ]
+
+    def get_period(self) -> DateTimeTZRange:
+        """Intervalo [date, date + duração) ocupado pela consulta."""
+        return DateTimeTZRange(
+            self.date, self.date + timedelta(minutes=self.duration_minutes)
+        )
+
+    def save(self, *args: Any, **kwargs: Any) -> None:
+        """Mantém `period` sincronizado com `date` e `duration_minutes`."""
+        self.period = self.get_period()
+        update_fields = kwargs.get("update_fields")
+        if update_fields is not None and {"date", "duration_minutes"} & set(
+            update_fields
+        ):
+            kwargs["update_fields"] = {*update_fields, "period"}
+        super().save(*args, **kwargs)
 
     def __str__(self) -> str:
         return f"Consulta com {self.professional.social_name} em {self.date}"
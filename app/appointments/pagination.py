@@ -0,0 +1,125 @@
+from base64 import urlsafe_b64decode, urlsafe_b64encode
+from datetime import datetime
+from typing import Any, NamedTuple
+
+from django.db.models import Q, QuerySet
+from django.utils.dateparse import parse_datetime
+from rest_framework.exceptions import NotFound
+from rest_framework.pagination import CursorPagination
+from rest_framework.request import Request
+from rest_framework.utils.urls import replace_query_param
+from rest_framework.views import APIView
+
+from .models import Appointment
+
+
+class KeysetCursor(NamedTuple):
+    """Posição (date, id) de referência e direção da página."""
+
+    date: datetime
+    pk: int
+    reverse: bool
+
+
+class AppointmentKeysetPagination(CursorPagination):
+    """
+    Paginação por chave composta (date, id) para consultas.
+
+    Diferente da paginação por página, não executa COUNT(*) nem OFFSET: cada
+    página filtra a partir da última posição vista, percorrendo o índice
+    (date DESC, id DESC), de modo que a página N custa o mesmo que a página 1.
+    """
+
+    ordering = ("-date", "-id")
+    invalid_cursor_message = "Cursor inválido."
+
+    def paginate_queryset(  # type: ignore[override]
+        self,
+        queryset: QuerySet[Appointment, Any],
+        request: Request,
+        view: APIView | None = None,
+    ) -> list[Any] | None:
+        page_size = self.get_page_size(request)
+        if not page_size:
+            return None
+
+        self.request = request
+        self.base_url = request.build_absolute_uri()
+        self.page_size = page_size
+        self.keyset = self.decode_cursor(request)
+
+        queryset = self.get_page_queryset(queryset, self.keyset)
+        reverse = self.keyset is not None and self.keyset.reverse
+
+        results = list(queryset[: page_size + 1])
+        has_more = len(results) > page_size
+        self.page = results[:page_size]
+
+        if reverse:
+            self.page.reverse()
+            self.has_next, self.has_previous = True, has_more
+        else:
+            self.has_next, self.has_previous = has_more, self.keyset is not None
+
+        return self.page
+
+    def get_page_queryset(
+        self, queryset: QuerySet[Appointment, Any], keyset: KeysetCursor | None
+    ) -> QuerySet[Appointment, Any]:
+        """Ordena e filtra o queryset a partir da posição do cursor."""
+        if keyset is None:
+            return queryset.order_by(*self.ordering)
+
+        # A condição redundante em `date` permite a varredura por intervalo no
+        # índice; a disjunção resolve o desempate por id.
+        if keyset.reverse:
+            return (
+                queryset.order_by("date", "id")
+                .filter(date__gte=keyset.date)
+                .filter(Q(date__gt=keyset.date) | Q(id__gt=keyset.pk))
+            )
+        return (
+            queryset.order_by(*self.ordering)
+            .filter(date__lte=keyset.date)
+            .filter(Q(date__lt=keyset.date) | Q(id__lt=keyset.pk))
+        )
+
+    def get_next_link(self) -> str | None:
+        if not self.has_next or not self.page:
+            return None
+        return self.encode_cursor(KeysetCursor(*self.position(self.page[-1]), False))
+
+    def get_previous_link(self) -> str | None:
+        if not self.has_previous or not self.page:
+            return None
+        return self.encode_cursor(KeysetCursor(*self.position(self.page[0]), True))
+
+    @staticmethod
+    def position(item: Appointment | dict[str, Any]) -> tuple[datetime, int]:
+        """(date, id) de uma consulta ou de uma linha de values()."""
+        if isinstance(item, dict):
+            return item["date"], item["id"]
+        return item.date, item.pk
+
+    def decode_cursor(self, request: Request) -> KeysetCursor | None:  # type: ignore[override]
+        encoded = request.query_params.get(self.cursor_query_param)
+        if encoded is None:
+            return None
+
+        try:
+            raw_date, raw_pk, raw_reverse = (
+                urlsafe_b64decode(encoded.encode("ascii")).decode("ascii").split("|")
+            )
+            date = parse_datetime(raw_date)
+            if date is None:
+                raise ValueError(raw_date)
+            return KeysetCursor(date, int(raw_pk), raw_reverse == "1")
+        except (TypeError, ValueError):
+            raise NotFound(self.invalid_cursor_message)
+
+    def encode_cursor(self, cursor: Any) -> str:
+        token = f"{cursor.date.isoformat()}|{cursor.pk}|{int(cursor.reverse)}"
+        encoded = urlsafe_b64encode(token.encode("ascii")).decode("ascii")
+        return replace_query_param(
+            self.base_url or "", self.cursor_query_param, encoded
+        )
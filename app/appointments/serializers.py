@@ -1,9 +1,20 @@
+from collections.abc import Sequence
+from datetime import datetime, time, timedelta
+from typing import Any
+
+from django.db.models import Prefetch, QuerySet
+from django.utils import timezone
+from django.utils.dateparse import parse_date
 from rest_framework import serializers
 
+from app.core.serializers import RowSerializer
 from app.professionals.models import Professional
-from app.professionals.serializers import ProfessionalSerializer
+from app.professionals.serializers import (
+    ProfessionalRowSerializer,
+    ProfessionalSerializer,
+)
 
-from .models import Appointment
+from .models import MAX_DURATION_MINUTES, Appointment
 
 
 class AppointmentSerializer(serializers.ModelSerializer[Appointment]):
@@ -20,6 +31,7 @@ class AppointmentSerializer(serializers.ModelSerializer[Appointment]):
         fields = [
             "uuid",
             "date",
+            "duration_minutes",
             "professional_uuid",
             "created_at",
             "updated_at",
@@ -27,18 +39,203 @@ class AppointmentSerializer(serializers.ModelSerializer[Appointment]):
         read_only_fields = ["uuid", "created_at", "updated_at"]
 
 
+class AppointmentBatchItemSerializer(serializers.ModelSerializer[Appointment]):
+    """
+    Serializador de item do agendamento em lote.
+
+    O profissional é recebido apenas como UUID; a resolução para o ID é feita
+    para o lote inteiro de uma vez, sem uma consulta por item.
+    """
+
+    professional_uuid = serializers.UUIDField()
+
+    class Meta:
+        model = Appointment
+        fields = [
+            "date",
+            "duration_minutes",
+            "professional_uuid",
+        ]
+
+
+class DateOrDateTimeField(serializers.DateTimeField):
+    """
+    Aceita data e hora ISO 8601 ou apenas a data (AAAA-MM-DD).
+
+    Uma data isolada é convertida para o início do dia no fuso horário
+    corrente ou, com `end_of_day=True`, para o último instante do dia.
+    """
+
+    def __init__(self, *, end_of_day: bool = False, **kwargs: Any) -> None:
+        self.end_of_day = end_of_day
+        super().__init__(**kwargs)
+
+    def to_internal_value(self, value: datetime | str) -> datetime:
+        if isinstance(value, str):
+            try:
+                day = parse_date(value)
+            except ValueError:
+                self.fail("invalid", format="AAAA-MM-DD")
+            if day is not None:
+                moment = time.max if self.end_of_day else time.min
+                return timezone.make_aware(datetime.combine(day, moment))
+        return super().to_internal_value(value)
+
+
+class AppointmentFilterSerializer(serializers.Serializer[Any]):
+    """Valida os filtros de período da listagem de consultas."""
+
+    date_from = DateOrDateTimeField(required=False)
+    date_to = DateOrDateTimeField(required=False, end_of_day=True)
+    upcoming = serializers.BooleanField(required=False, default=False)
+
+    def validate(self, attrs: dict[str, Any]) -> dict[str, Any]:
+        date_from, date_to = attrs.get("date_from"), attrs.get("date_to")
+        if date_from and date_to and date_from > date_to:
+            raise serializers.ValidationError(
+                {"date_to": ["A data final deve ser posterior à data inicial."]}
+            )
+        return attrs
+
+
+class AvailabilityQuerySerializer(serializers.Serializer[Any]):
+    """Valida a janela e a duração dos horários livres de um profissional."""
+
+    max_window = timedelta(days=31)
+
+    start = DateOrDateTimeField()
+    end = DateOrDateTimeField()
+    slot_minutes = serializers.IntegerField(
+        required=False, default=30, min_value=5, max_value=MAX_DURATION_MINUTES
+    )
+
+    def validate(self, attrs: dict[str, Any]) -> dict[str, Any]:
+        if attrs["start"] >= attrs["end"]:
+            raise serializers.ValidationError(
+                {"end": ["A data final deve ser posterior à data inicial."]}
+            )
+        if attrs["end"] - attrs["start"] > self.max_window:
+            raise serializers.ValidationError(
+                {"end": [f"A janela não pode exceder {self.max_window.days} dias."]}
+            )
+        return attrs
+
+
+class AvailabilitySlotSerializer(serializers.Serializer[Any]):
+    """Horário livre na agenda de um profissional."""
+
+    start = serializers.DateTimeField()
+    end = serializers.DateTimeField()
+
+
+class AvailabilitySerializer(serializers.Serializer[Any]):
+    """Horários livres de um profissional em uma janela."""
+
+    start = serializers.DateTimeField()
+    end = serializers.DateTimeField()
+    slot_minutes = serializers.IntegerField()
+    slots = AvailabilitySlotSerializer(many=True)
+
+
+class SharedProfessionalSerializer(ProfessionalSerializer):
+    """Reaproveita a representação de profissionais repetidos na mesma resposta."""
+
+    def to_representation(self, instance: Professional) -> dict[str, Any]:
+        """Serializa cada profissional uma única vez por requisição."""
+        representations = self.context.setdefault("professional_representations", {})
+        if instance.pk not in representations:
+            representations[instance.pk] = super().to_representation(instance)
+        representation: dict[str, Any] = representations[instance.pk]
+        return representation
+
+
 class AppointmentDetailSerializer(serializers.ModelSerializer[Appointment]):
     """Serializador para Consulta com detalhes do Profissional."""
 
-    professional = ProfessionalSerializer(read_only=True)
+    professional = SharedProfessionalSerializer(read_only=True)
 
     class Meta:
         model = Appointment
         fields = [
             "uuid",
             "date",
+            "duration_minutes",
             "professional",
             "created_at",
             "updated_at",
         ]
         read_only_fields = ["uuid", "created_at", "updated_at"]
+
+    @classmethod
+    def get_prefetches(cls) -> "list[Prefetch[Any]]":
+        """Prefetch das relações do profissional aninhado."""
+        return SharedProfessionalSerializer.get_prefetches("professional__")
+
+
+class AppointmentRowSerializer(RowSerializer):
+    """
+    Mesma saída do AppointmentDetailSerializer, a partir de linhas de values().
+
+    Os campos do profissional vêm na mesma consulta (JOIN) e cada profissional
+    é montado uma única vez por resposta, como no SharedProfessionalSerializer.
+    Quando `fields` não inclui o profissional, nem o JOIN nem as consultas de
+    endereço e contatos são feitos.
+    """
+
+    serializer_class = AppointmentDetailSerializer
+    professional_prefix = "professional__"
+    csv_columns = (
+        "uuid",
+        "date",
+        "duration_minutes",
+        *(
+            f"professional.{column}"
+            for column in ProfessionalRowSerializer.csv_columns
+            if column != "distance_km"
+        ),
+        "created_at",
+        "updated_at",
+    )
+
+    def values(
+        self, queryset: QuerySet[Appointment], extra: Sequence[str] = ()
+    ) -> QuerySet[Any]:
+        if not self.includes("professional"):
+            return super().values(queryset, extra)
+        rows: QuerySet[Any] = queryset.prefetch_related(None).values(
+            "id",
+            *self.sources(),
+            *extra,
+            "professional_id",
+            *(
+                f"{self.professional_prefix}{source}"
+                for source in ProfessionalRowSerializer.sources()
+            ),
+        )
+        return rows
+
+    def serialize(self, rows: list[dict[str, Any]]) -> list[dict[str, Any]]:
+        if not self.includes("professional"):
+            return super().serialize(rows)
+        professional_rows = {
+            row["professional_id"]: {
+                "id": row["professional_id"],
+                **{
+                    source: row[f"{self.professional_prefix}{source}"]
+                    for source in ProfessionalRowSerializer.sources()
+                },
+            }
+            for row in rows
+        }
+        professionals = dict(
+            zip(
+                professional_rows,
+                ProfessionalRowSerializer().serialize(list(professional_rows.values())),
+            )
+        )
+        return [
+            self.select(
+                self.build(row, {"professional": professionals[row["professional_id"]]})
+            )
+            for row in rows
+        ]
@@ -0,0 +1,84 @@
+from collections.abc import Iterator
+from datetime import datetime, timedelta
+from typing import Any
+from uuid import UUID
+
+from django.db import transaction
+from django.db.backends.postgresql.psycopg_any import DateTimeTZRange
+from django.db.models import QuerySet
+
+from app.professionals.models import Professional
+
+from .models import Appointment
+
+
+class AppointmentService:
+    """Service layer para operações de Consulta."""
+
+    @staticmethod
+    def resolve_professionals(uuids: set[UUID]) -> dict[UUID, int]:
+        """Resolve UUIDs de profissionais para seus IDs com uma única consulta IN."""
+        if not uuids:
+            return {}
+        return dict(
+            Professional.objects.filter(uuid__in=uuids).values_list("uuid", "id")
+        )
+
+    @staticmethod
+    def bulk_create(items: list[dict[str, Any]]) -> list[Appointment]:
+        """Cria várias consultas com um único INSERT em lote."""
+        appointments = [Appointment(**item) for item in items]
+        for appointment in appointments:
+            appointment.period = appointment.get_period()
+        with transaction.atomic():
+            Appointment.objects.bulk_create(appointments)
+        return appointments
+
+    @staticmethod
+    def window_queryset(
+        professional_id: int, start: datetime, end: datetime
+    ) -> QuerySet[Appointment]:
+        """
+        Consultas do profissional cujo período intercepta [start, end).
+
+        O filtro (professional_id, period &&) é atendido pelo índice GiST da
+        constraint de exclusão que impede agendamentos sobrepostos.
+        """
+        return Appointment.objects.filter(
+            professional_id=professional_id,
+            period__overlap=DateTimeTZRange(start, end),
+        ).order_by("date")
+
+    @staticmethod
+    def busy_intervals(
+        professional_id: int, start: datetime, end: datetime
+    ) -> list[tuple[datetime, datetime]]:
+        """Intervalos ocupados do profissional que interceptam [start, end)."""
+        periods = AppointmentService.window_queryset(
+            professional_id, start, end
+        ).values_list("period", flat=True)
+        return [(period.lower, period.upper) for period in periods]
+
+    @staticmethod
+    def free_slots(
+        busy: list[tuple[datetime, datetime]],
+        start: datetime,
+        end: datetime,
+        slot: timedelta,
+    ) -> Iterator[tuple[datetime, datetime]]:
+        """
+        Horários livres de duração `slot` entre os intervalos ocupados.
+
+        `busy` deve estar ordenado pelo início. Os intervalos sobrepostos são
+        mesclados em uma única passada e cada lacuna é dividida em horários
+        consecutivos a partir do seu início.
+        """
+        cursor = start
+        for busy_start, busy_end in [*busy, (end, end)]:
+            gap_end = min(busy_start, end)
+            while cursor + slot <= gap_end:
+                yield cursor, cursor + slot
+                cursor += slot
+            cursor = max(cursor, busy_end)
+            if cursor >= end:
+                return
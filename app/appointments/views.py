@@ -1,67 +1,435 @@
+import builtins
+from typing import Any
+
+from django.db import IntegrityError, transaction
 from django.db.models import QuerySet
+from django.http import StreamingHttpResponse
+from django.utils import timezone
+from drf_spectacular.types import OpenApiTypes
 from drf_spectacular.utils import OpenApiParameter, extend_schema, extend_schema_view
 from rest_framework import serializers, viewsets
+from rest_framework.decorators import action
+from rest_framework.pagination import BasePagination
+from rest_framework.request import Request
+from rest_framework.response import Response
+from rest_framework.settings import api_settings
+
+from app.core.batch import (
+    BatchResult,
+    batch_response,
+    created_result,
+    error_result,
+    validate_items,
+)
+from app.core.conditional import (
+    Validators,
+    conditional_response,
+    conditional_write,
+    row_validators,
+)
+from app.core.exceptions import Conflict, violates_constraint
+from app.core.parsers import NDJSONParser
+from app.core.serializers import BatchResponseSerializer
+from app.core.viewsets import ReplicaReadMixin, RowReadMixin
+from app.professionals.models import Professional
+from app.professionals.services import ProfessionalService
+
+from .models import OVERLAP_CONSTRAINT, Appointment
+from .pagination import AppointmentKeysetPagination
+from .serializers import (
+    AppointmentBatchItemSerializer,
+    AppointmentDetailSerializer,
+    AppointmentFilterSerializer,
+    AppointmentRowSerializer,
+    AppointmentSerializer,
+)
+from .services import AppointmentService
+
+OVERLAP_ERROR = "O profissional já tem uma consulta neste horário."
 
-from .models import Appointment
-from .serializers import AppointmentDetailSerializer, AppointmentSerializer
+# Filtros da listagem, também aceitos pela exportação
+FILTER_PARAMETERS = [
+    OpenApiParameter(
+        name="professional_uuid",
+        type=str,
+        location=OpenApiParameter.QUERY,
+        description="Filtrar consultas pelo UUID do profissional",
+        required=False,
+    ),
+    OpenApiParameter(
+        name="date_from",
+        type=OpenApiTypes.DATETIME,
+        location=OpenApiParameter.QUERY,
+        description="Consultas a partir desta data/hora (inclusive). "
+        "Aceita também apenas a data (AAAA-MM-DD), considerada desde o "
+        "início do dia",
+        required=False,
+    ),
+    OpenApiParameter(
+        name="date_to",
+        type=OpenApiTypes.DATETIME,
+        location=OpenApiParameter.QUERY,
+        description="Consultas até esta data/hora (inclusive). "
+        "Aceita também apenas a data (AAAA-MM-DD), considerada até o "
+        "fim do dia",
+        required=False,
+    ),
+    OpenApiParameter(
+        name="upcoming",
+        type=OpenApiTypes.BOOL,
+        location=OpenApiParameter.QUERY,
+        description="Com true, retorna apenas consultas a partir de agora",
+        required=False,
+    ),
+]
+
+# Sparse fieldsets da listagem e do detalhe
+FIELDS_PARAMETERS = [
+    OpenApiParameter(
+        name="fields",
+        type=str,
+        location=OpenApiParameter.QUERY,
+        description="Campos da resposta, separados por vírgula (ex: uuid,date). "
+        "O profissional só é incluído, e consultado, se listado aqui ou em "
+        "expand",
+        required=False,
+    ),
+    OpenApiParameter(
+        name="expand",
+        type=str,
+        enum=["professional"],
+        location=OpenApiParameter.QUERY,
+        description="Relações incluídas junto aos campos de fields. Sem fields, "
+        "a resposta já traz o profissional",
+        required=False,
+    ),
+]
 
 
 @extend_schema_view(
     list=extend_schema(
         summary="Listar consultas",
         description="Retorna uma lista paginada de todas as consultas. "
-        "Pode ser filtrada pelo parâmetro professional_uuid.",
+        "Pode ser filtrada por profissional (professional_uuid) e por período "
+        "(date_from, date_to, upcoming); os filtros são combinados. Com pagination=cursor, "
+        "usa paginação por cursor ordenada por data, sem contagem total e com "
+        "custo constante por página; os links next/previous já trazem o cursor. "
+        "Retorna ETag e Last-Modified; com If-None-Match atual, responde 304.",
         parameters=[
+            *FILTER_PARAMETERS,
+            *FIELDS_PARAMETERS,
             OpenApiParameter(
-                name="professional_uuid",
+                name="pagination",
                 type=str,
+                enum=["page", "cursor"],
                 location=OpenApiParameter.QUERY,
-                description="Filtrar consultas pelo UUID do profissional",
+                description="Modo de paginação (padrão: page)",
+                required=False,
+            ),
+            OpenApiParameter(
+                name="cursor",
+                type=str,
+                location=OpenApiParameter.QUERY,
+                description="Cursor da página (apenas com pagination=cursor)",
                 required=False,
             ),
         ],
     ),
     retrieve=extend_schema(
         summary="Obter detalhes da consulta",
-        description="Retorna os detalhes de uma consulta específica com informações do profissional.",
+        description="Retorna os detalhes de uma consulta específica com informações do profissional. "
+        "Retorna ETag e Last-Modified; com If-None-Match atual, responde 304.",
     ),
     create=extend_schema(
         summary="Criar consulta",
-        description="Cria uma nova consulta vinculada a um profissional.",
+        description="Cria uma nova consulta vinculada a um profissional. "
+        "Retorna 409 se o horário se sobrepõe a outra consulta do profissional.",
     ),
     update=extend_schema(
         summary="Atualizar consulta",
-        description="Atualiza todos os campos de uma consulta.",
+        description="Atualiza todos os campos de uma consulta. "
+        "Retorna 409 se o horário se sobrepõe a outra consulta do profissional "
+        "e 412 se o ETag enviado em If-Match não é o atual.",
     ),
     partial_update=extend_schema(
         summary="Atualizar parcialmente consulta",
-        description="Atualiza campos específicos de uma consulta.",
+        description="Atualiza campos específicos de uma consulta. "
+        "Retorna 409 se o horário se sobrepõe a outra consulta do profissional "
+        "e 412 se o ETag enviado em If-Match não é o atual.",
     ),
     destroy=extend_schema(
         summary="Excluir consulta",
-        description="Exclui uma consulta.",
+        description="Exclui uma consulta. "
+        "Retorna 412 se o ETag enviado em If-Match não é o atual.",
+    ),
+    batch=extend_schema(
+        summary="Agendar consultas em lote",
+        description="Cria várias consultas a partir de uma lista JSON ou de um corpo "
+        "NDJSON (application/x-ndjson). Os UUIDs de profissionais são resolvidos "
+        "com uma única consulta; itens inválidos ou com profissional inexistente "
+        "são reportados individualmente e os demais são gravados em uma única "
+        "transação. Se algum item se sobrepõe a outra consulta, os itens são "
+        "gravados um a um e apenas os conflitantes são rejeitados. Retorna 201 "
+        "quando todos são criados e 207 quando algum falha.",
+        request=AppointmentBatchItemSerializer(many=True),
+        responses={201: BatchResponseSerializer, 207: BatchResponseSerializer},
+    ),
+    export=extend_schema(
+        summary="Exportar consultas",
+        description="Transmite todas as consultas que atendem aos filtros da "
+        "listagem, sem paginação, em NDJSON (uma consulta por linha, no formato "
+        "da listagem) ou CSV (profissional em colunas professional.*). As linhas "
+        "são lidas do banco em lotes, com memória constante, e uma única "
+        "requisição substitui percorrer todas as páginas.",
+        parameters=[
+            *FILTER_PARAMETERS,
+            OpenApiParameter(
+                name="output",
+                type=str,
+                enum=["ndjson", "csv"],
+                location=OpenApiParameter.QUERY,
+                description="Formato da exportação (padrão: ndjson)",
+                required=False,
+            ),
+        ],
+        responses={
+            (200, "application/x-ndjson"): AppointmentDetailSerializer,
+            (200, "text/csv"): OpenApiTypes.STR,
+        },
     ),
 )
-class AppointmentViewSet(viewsets.ModelViewSet[Appointment]):
+class AppointmentViewSet(
+    ReplicaReadMixin, RowReadMixin, viewsets.ModelViewSet[Appointment]
+):
     """
     ViewSet para operações CRUD de Consultas.
 
-    Suporta filtro por professional_uuid via query parameter.
+    Suporta filtros por professional_uuid e por período (date_from, date_to,
+    upcoming) via query parameters. Sobreposições de horário são barradas pela
+    constraint de exclusão do banco e respondidas com 409. Listagem e detalhe
+    aceitam ?fields= e ?expand= e as leituras podem ir à réplica; `export` transmite a listagem filtrada em NDJSON ou CSV.
     """
 
-    queryset = Appointment.objects.select_related("professional").all()
+    queryset = Appointment.objects.select_related("professional").defer(
+        *(f"professional__{column}" for column in Professional.search_columns)
+    )
     lookup_field = "uuid"
+    row_serializer_classes = {
+        "list": AppointmentRowSerializer,
+        "retrieve": AppointmentRowSerializer,
+    }
+    sparse_fieldsets = True
+    expandable_fields = ("professional",)
+    cursor_pagination_class = AppointmentKeysetPagination
+    # O profissional aninhado também compõe a representação (ver ETag)
+    validator_fields = ["updated_at", "professional__updated_at"]
+    # Sem floats nas respostas, o ORJSONRenderer não as percorre
+    float_fields = ()
+
+    @property
+    def paginator(self) -> BasePagination | None:
+        """Usa a paginação por cursor quando solicitada via ?pagination=cursor."""
+        if not hasattr(self, "_paginator") and (
+            self.request.query_params.get("pagination") == "cursor"
+        ):
+            self._paginator = self.cursor_pagination_class()
+        return super().paginator
 
     def get_serializer_class(self) -> type[serializers.ModelSerializer[Appointment]]:
         """Usa serializador detalhado para retrieve, list usa básico."""
-        if self.action in ["retrieve", "list"]:
+        if self.action in ["retrieve", "list", "export"]:
             return AppointmentDetailSerializer
+        if self.action == "batch":
+            return AppointmentBatchItemSerializer
         return AppointmentSerializer
 
     def get_queryset(self) -> QuerySet[Appointment]:
-        """Filtra por professional_uuid se fornecido."""
+        """Filtra por professional_uuid se fornecido e, na listagem, por período."""
         queryset = super().get_queryset()
+        if self.action in ["retrieve", "list"]:
+            queryset = queryset.prefetch_related(
+                *AppointmentDetailSerializer.get_prefetches()
+            )
+        if self.action in ["list", "export"]:
+            queryset = self.filter_by_period(queryset)
         professional_uuid = self.request.query_params.get("professional_uuid")
         if professional_uuid:
-            queryset = queryset.filter(professional__uuid=professional_uuid)
+            professional_id = ProfessionalService.resolve_id(professional_uuid)
+            if professional_id is None:
+                return queryset.none()
+            queryset = queryset.filter(professional_id=professional_id)
         return queryset
+
+    def read_validator_fields(self) -> list[str]:
+        """Campos do ETag da leitura; sem o profissional, dispensa o JOIN."""
+        if self.get_row_serializer(self.action).includes("professional"):
+            return self.validator_fields
+        return [
+            field
+            for field in self.validator_fields
+            if not field.startswith("professional__")
+        ]
+
+    def filter_by_period(
+        self, queryset: QuerySet[Appointment]
+    ) -> QuerySet[Appointment]:
+        """Aplica date_from, date_to e upcoming como intervalo sobre `date`."""
+        filters = AppointmentFilterSerializer(data=self.request.query_params)
+        filters.is_valid(raise_exception=True)
+        params = filters.validated_data
+
+        if "date_from" in params:
+            queryset = queryset.filter(date__gte=params["date_from"])
+        if "date_to" in params:
+            queryset = queryset.filter(date__lte=params["date_to"])
+        if params["upcoming"]:
+            queryset = queryset.filter(date__gte=timezone.now())
+        return queryset
+
+    def list(self, request: Request, *args: Any, **kwargs: Any) -> Response:
+        """Responde 304 quando a página não mudou, sem serializar as consultas."""
+        return conditional_response(
+            request, *self.list_page(request, self.read_validator_fields())
+        )
+
+    def retrieve(self, request: Request, *args: Any, **kwargs: Any) -> Response:
+        """Responde 304 quando a consulta não mudou, sem serializá-la."""
+        return conditional_response(
+            request,
+            row_validators(
+                request,
+                self.get_queryset(),
+                {self.lookup_field: kwargs[self.lookup_field]},
+                self.read_validator_fields(),
+            ),
+            lambda: self.retrieve_rows(request),
+        )
+
+    def update(self, request: Request, *args: Any, **kwargs: Any) -> Response:
+        """Aplica If-Match e If-Unmodified-Since com a linha travada."""
+        return conditional_write(
+            request,
+            lambda: self.object_validators(lock=True),
+            lambda: super(AppointmentViewSet, self).update(request, *args, **kwargs),
+        )
+
+    def destroy(self, request: Request, *args: Any, **kwargs: Any) -> Response:
+        """Aplica If-Match e If-Unmodified-Since com a linha travada."""
+        return conditional_write(
+            request,
+            lambda: self.object_validators(lock=True),
+            lambda: super(AppointmentViewSet, self).destroy(request, *args, **kwargs),
+        )
+
+    def object_validators(self, lock: bool = False) -> Validators | None:
+        """ETag e Last-Modified da consulta da URL, sem serializá-la."""
+        return row_validators(
+            self.request,
+            self.get_queryset(),
+            {self.lookup_field: self.kwargs[self.lookup_field]},
+            self.validator_fields,
+            lock=lock,
+        )
+
+    def perform_create(
+        self, serializer: serializers.BaseSerializer[Appointment]
+    ) -> None:
+        self.save_without_overlap(serializer)
+
+    def perform_update(
+        self, serializer: serializers.BaseSerializer[Appointment]
+    ) -> None:
+        self.save_without_overlap(serializer)
+
+    def save_without_overlap(
+        self, serializer: serializers.BaseSerializer[Appointment]
+    ) -> None:
+        """Grava em um savepoint e converte a violação de sobreposição em 409."""
+        try:
+            with transaction.atomic():
+                serializer.save()
+        except IntegrityError as exc:
+            if not violates_constraint(exc, OVERLAP_CONSTRAINT):
+                raise
+            raise Conflict({"date": [OVERLAP_ERROR]}) from exc
+
+    @action(
+        detail=False,
+        methods=["post"],
+        parser_classes=[*api_settings.DEFAULT_PARSER_CLASSES, NDJSONParser],
+    )
+    def batch(self, request: Request) -> Response:
+        """Valida os itens, resolve os profissionais em lote e grava de uma vez."""
+        results: list[BatchResult] = []
+        valid: list[tuple[int, dict[str, Any]]] = []
+        for index, validated_data, error in validate_items(
+            request.data, self.get_serializer()
+        ):
+            if error is not None:
+                results.append(error)
+            elif validated_data is not None:
+                valid.append((index, validated_data))
+
+        professional_ids = AppointmentService.resolve_professionals(
+            {data["professional_uuid"] for _, data in valid}
+        )
+
+        indexes: list[int] = []
+        items: list[dict[str, Any]] = []
+        for index, data in valid:
+            professional_uuid = data.pop("professional_uuid")
+            professional_id = professional_ids.get(professional_uuid)
+            if professional_id is None:
+                results.append(
+                    error_result(
+                        index,
+                        {
+                            "professional_uuid": [
+                                f"Profissional com uuid={professional_uuid} "
+                                "não existe."
+                            ]
+                        },
+                    )
+                )
+                continue
+            indexes.append(index)
+            items.append({**data, "professional_id": professional_id})
+
+        results.extend(self._create_all(indexes, items))
+        return batch_response(results)
+
+    @action(detail=False, methods=["get"])
+    def export(self, request: Request) -> StreamingHttpResponse:
+        """Transmite a listagem filtrada inteira, sem paginação."""
+        return self.export_rows(request, "appointments")
+
+    def _create_all(
+        self,
+        indexes: builtins.list[int],
+        items: builtins.list[dict[str, Any]],
+    ) -> builtins.list[BatchResult]:
+        """Grava tudo de uma vez; se houver sobreposição, isola os itens um a um."""
+        try:
+            appointments = AppointmentService.bulk_create(items)
+        except IntegrityError as exc:
+            if not violates_constraint(exc, OVERLAP_CONSTRAINT):
+                raise
+            return [
+                self._create_one(index, item) for index, item in zip(indexes, items)
+            ]
+
+        return [
+            created_result(index, appointment.uuid)
+            for index, appointment in zip(indexes, appointments)
+        ]
+
+    def _create_one(self, index: int, item: dict[str, Any]) -> BatchResult:
+        """Grava um único item em seu próprio savepoint."""
+        try:
+            with transaction.atomic():
+                appointment = Appointment.objects.create(**item)
+        except IntegrityError as exc:
+            if not violates_constraint(exc, OVERLAP_CONSTRAINT):
+                raise
+            return error_result(index, {"date": [OVERLAP_ERROR]})
+        return created_result(index, appointment.uuid)
@@ -4,3 +4,6 @@ from django.apps import AppConfig
 class CoreConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "app.core"
+
+    def ready(self) -> None:
+        from . import signals  # noqa: F401
@@ -0,0 +1,119 @@
+import hashlib
+from datetime import datetime
+from typing import Any, cast
+
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.db import transaction
+from django.utils import timezone
+from oauth2_provider.contrib.rest_framework import OAuth2Authentication
+from oauth2_provider.models import AbstractAccessToken, get_access_token_model
+from rest_framework.request import Request
+
+AccessToken = get_access_token_model()
+
+
+# O django-oauth-toolkit não publica tipos, então a classe base é Any
+class CachedOAuth2Authentication(OAuth2Authentication):  # type: ignore[misc]
+    """
+    OAuth2Authentication com os tokens já validados em cache.
+
+    O `OAuth2Authentication` carrega o AccessToken (e o usuário) do banco a
+    cada requisição. Aqui, o id, os escopos, a validade e o dono do token
+    ficam no cache por até `cache_timeout`, nunca além da expiração. Revogar
+    ou alterar o token descarta a entrada (ver `signals`).
+    """
+
+    cache_timeout = 5 * 60
+
+    @staticmethod
+    def cache_key(token: str) -> str:
+        """Chave pelo SHA-256 do token, para não guardar o token em claro."""
+        return f"oauth2:token:{hashlib.sha256(token.encode()).hexdigest()}"
+
+    @classmethod
+    def invalidate(cls, token: str) -> None:
+        """
+        Descarta o token do cache, na hora e de novo após o commit.
+
+        A repetição cobre uma autenticação concorrente que tenha lido o token
+        antes de a revogação ser confirmada.
+        """
+        key = cls.cache_key(token)
+        cache.delete(key)
+        transaction.on_commit(lambda: cache.delete(key))
+
+    def authenticate(self, request: Request) -> tuple[Any, Any] | None:
+        token = self.bearer_token(request)
+        if token is None:
+            return self._authenticate(request)
+
+        key = self.cache_key(token)
+        cached = cache.get(key)
+        if cached is not None:
+            access_token = self._restore(cached)
+            if access_token is not None:
+                return access_token.user, access_token
+            cache.delete(key)
+
+        result = self._authenticate(request)
+        if result is not None:
+            self._store(key, result[1])
+        return result
+
+    def _authenticate(self, request: Request) -> tuple[Any, Any] | None:
+        """Autenticação do OAuth2Authentication, que consulta o banco."""
+        return cast(tuple[Any, Any] | None, super().authenticate(request))
+
+    @staticmethod
+    def bearer_token(request: Request) -> str | None:
+        """Token do cabeçalho Authorization (outras formas não usam o cache)."""
+        header: str = request.META.get("HTTP_AUTHORIZATION", "")
+        scheme, _, token = header.partition(" ")
+        token = token.strip()
+        if scheme.lower() != "bearer" or not token:
+            return None
+        return token
+
+    def _store(self, key: str, access_token: AbstractAccessToken) -> None:
+        """Guarda os dados do token validado por no máximo até ele expirar."""
+        expires: datetime = access_token.expires
+        timeout = min(
+            self.cache_timeout, int((expires - timezone.now()).total_seconds())
+        )
+        if timeout <= 0:
+            return
+        cache.set(
+            key,
+            {
+                "id": access_token.pk,
+                "application_id": access_token.application_id,
+                "user_id": access_token.user_id,
+                "scope": access_token.scope,
+                "expires": expires,
+            },
+            timeout,
+        )
+
+    @staticmethod
+    def _restore(data: dict[str, Any]) -> AbstractAccessToken | None:
+        """
+        Remonta o AccessToken a partir do cache, ou None se ele expirou.
+
+        Tokens do fluxo client credentials não têm usuário, então não há
+        consulta alguma; nos demais, apenas o usuário é carregado.
+        """
+        access_token = AccessToken(**data)
+        if access_token.is_expired():
+            return None
+
+        if access_token.user_id is not None:
+            user = (
+                get_user_model()
+                ._default_manager.filter(pk=access_token.user_id)
+                .first()
+            )
+            if user is None:
+                return None
+            access_token.user = user
+        return access_token
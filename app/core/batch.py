@@ -0,0 +1,55 @@
+from collections.abc import Iterable, Iterator
+from typing import Any
+from uuid import UUID
+
+from rest_framework import serializers, status
+from rest_framework.exceptions import ValidationError
+from rest_framework.response import Response
+
+BatchResult = dict[str, Any]
+
+
+def created_result(index: int, uuid: UUID) -> BatchResult:
+    """Resultado de um item gravado com sucesso."""
+    return {"index": index, "status": "created", "uuid": str(uuid)}
+
+
+def error_result(index: int, errors: Any) -> BatchResult:
+    """Resultado de um item rejeitado."""
+    return {"index": index, "status": "error", "errors": errors}
+
+
+def validate_items(
+    items: Any, serializer: serializers.BaseSerializer[Any]
+) -> Iterator[tuple[int, dict[str, Any] | None, BatchResult | None]]:
+    """
+    Valida os itens de um corpo em lote um a um.
+
+    Produz `(index, validated_data, None)` para itens válidos e
+    `(index, None, error_result)` para os inválidos. O mesmo serializador é
+    reaproveitado entre itens para evitar reconstruir os campos a cada um.
+    """
+    if isinstance(items, (dict, str, bytes)) or not isinstance(items, Iterable):
+        raise ValidationError({"non_field_errors": ["Envie uma lista de itens."]})
+
+    for index, item in enumerate(items):
+        if not isinstance(item, dict):
+            yield index, None, error_result(
+                index,
+                {"non_field_errors": ["Item inválido: esperado um objeto JSON."]},
+            )
+            continue
+        try:
+            yield index, serializer.run_validation(item), None
+        except ValidationError as exc:
+            yield index, None, error_result(index, exc.detail)
+
+
+def batch_response(results: list[BatchResult]) -> Response:
+    """Resposta 201 quando todos os itens foram gravados, 207 caso contrário."""
+    results.sort(key=lambda result: result["index"])
+    failed = sum(1 for result in results if result["status"] == "error")
+    return Response(
+        {"created": len(results) - failed, "failed": failed, "results": results},
+        status=status.HTTP_207_MULTI_STATUS if failed else status.HTTP_201_CREATED,
+    )
@@ -0,0 +1,162 @@
+import hashlib
+import json
+from collections.abc import Callable, Mapping, Sequence
+from datetime import datetime
+from typing import Any
+
+from django.core.exceptions import ValidationError as DjangoValidationError
+from django.db import transaction
+from django.db.models import QuerySet
+from django.utils.cache import get_conditional_response
+from django.utils.http import http_date, quote_etag
+from rest_framework import status
+from rest_framework.request import Request
+from rest_framework.response import Response
+
+from .exceptions import PreconditionFailed
+
+# ETag forte e Last-Modified de uma resposta
+Validators = tuple[str, datetime | None]
+
+PRECONDITION_HEADERS = (
+    "HTTP_IF_MATCH",
+    "HTTP_IF_NONE_MATCH",
+    "HTTP_IF_UNMODIFIED_SINCE",
+)
+
+
+def make_validators(
+    request: Request, state: str, timestamps: Sequence[datetime | None]
+) -> Validators:
+    """
+    Monta o ETag e o Last-Modified a partir de `state` e dos `updated_at`.
+
+    A URL entra no ETag porque a página e os filtros mudam o corpo sem que os
+    registros mudem; `state` cobre o que mais distingue o corpo (ids das
+    linhas, total e links da paginação).
+    """
+    parts = [
+        request.get_full_path(),
+        state,
+        *(timestamp.isoformat() if timestamp else "" for timestamp in timestamps),
+    ]
+    digest = hashlib.sha256("|".join(parts).encode()).hexdigest()
+    last_modified = max(
+        (timestamp for timestamp in timestamps if timestamp is not None),
+        default=None,
+    )
+    return quote_etag(digest), last_modified
+
+
+def page_validators(
+    request: Request,
+    rows: Sequence[Mapping[str, Any]],
+    fields: Sequence[str],
+    envelope: Mapping[str, Any] | None = None,
+) -> Validators:
+    """
+    Validadores de uma página a partir das próprias linhas, já lidas.
+
+    O ETag cobre o id e os `fields` de cada linha, na ordem, e o `envelope`
+    da paginação (total e links), que muda sem que as linhas da página mudem.
+    Nenhuma consulta percorre a listagem inteira além da paginação.
+    """
+    state = json.dumps(
+        {"envelope": envelope, "ids": [row["id"] for row in rows]},
+        sort_keys=True,
+        default=str,
+    )
+    return make_validators(
+        request, state, [row[field] for row in rows for field in fields]
+    )
+
+
+def row_validators(
+    request: Request,
+    queryset: QuerySet[Any],
+    lookup: dict[str, Any],
+    fields: Sequence[str],
+    lock: bool = False,
+) -> Validators | None:
+    """
+    Validadores de um único registro, ou None se ele não existe.
+
+    Com `lock`, a linha fica travada (SELECT ... FOR UPDATE) até o fim da
+    transação, para que nenhuma outra escrita aconteça entre a verificação
+    das pré-condições e a gravação.
+    """
+    try:
+        queryset = queryset.filter(**lookup)
+    except (TypeError, ValueError, DjangoValidationError):
+        return None
+
+    queryset = queryset.prefetch_related(None)
+    if lock:
+        queryset = queryset.select_for_update(of=("self",))
+    row = queryset.values_list(*fields).first()
+    if row is None:
+        return None
+    return make_validators(request, "1", row)
+
+
+def _failed_precondition(request: Request, validators: Validators) -> int | None:
+    """Status da pré-condição que falhou (304 ou 412), ou None se todas passam."""
+    etag, last_modified = validators
+    response = get_conditional_response(
+        request._request,
+        etag=etag,
+        last_modified=int(last_modified.timestamp()) if last_modified else None,
+    )
+    return None if response is None else response.status_code
+
+
+def conditional_response(
+    request: Request, validators: Validators | None, build: Callable[[], Response]
+) -> Response:
+    """
+    Responde 304 se o cliente já tem a versão atual, sem chamar `build`.
+
+    Avalia If-None-Match, If-Modified-Since, If-Match e If-Unmodified-Since.
+    As respostas 200 e 304 levam os cabeçalhos ETag e Last-Modified. Sem
+    validadores (registro inexistente), apenas monta a resposta.
+    """
+    if validators is None:
+        return build()
+
+    failed = _failed_precondition(request, validators)
+    if failed == status.HTTP_412_PRECONDITION_FAILED:
+        raise PreconditionFailed()
+
+    if failed is None:
+        response = build()
+    else:
+        response = Response(status=status.HTTP_304_NOT_MODIFIED)
+
+    if response.status_code in (status.HTTP_200_OK, status.HTTP_304_NOT_MODIFIED):
+        etag, last_modified = validators
+        response["ETag"] = etag
+        if last_modified is not None:
+            response["Last-Modified"] = http_date(last_modified.timestamp())
+    return response
+
+
+def conditional_write(
+    request: Request,
+    validators: Callable[[], Validators | None],
+    write: Callable[[], Response],
+) -> Response:
+    """
+    Executa a escrita apenas se If-Match e If-Unmodified-Since conferem.
+
+    Sem cabeçalhos condicionais, a escrita segue direto. Com eles, a
+    verificação e a escrita rodam na mesma transação; `validators` deve travar
+    a linha para que a concorrência otimista não tenha janela de corrida.
+    """
+    if not any(header in request.META for header in PRECONDITION_HEADERS):
+        return write()
+
+    with transaction.atomic():
+        current = validators()
+        if current is not None and _failed_precondition(request, current):
+            raise PreconditionFailed()
+        return write()
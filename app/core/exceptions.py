@@ -0,0 +1,25 @@
+from django.db import IntegrityError
+from rest_framework import status
+from rest_framework.exceptions import APIException
+
+
+class Conflict(APIException):
+    """A requisição conflita com o estado atual do recurso."""
+
+    status_code = status.HTTP_409_CONFLICT
+    default_detail = "A requisição conflita com o estado atual do recurso."
+    default_code = "conflict"
+
+
+class PreconditionFailed(APIException):
+    """A versão informada em If-Match ou If-Unmodified-Since não é a atual."""
+
+    status_code = status.HTTP_412_PRECONDITION_FAILED
+    default_detail = "O recurso foi alterado desde a versão informada."
+    default_code = "precondition_failed"
+
+
+def violates_constraint(exc: IntegrityError, name: str) -> bool:
+    """Indica se o IntegrityError foi causado pela constraint `name`."""
+    diag = getattr(exc.__cause__, "diag", None)
+    return getattr(diag, "constraint_name", None) == name
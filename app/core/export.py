@@ -0,0 +1,175 @@
+import csv
+import functools
+import io
+from collections.abc import AsyncIterator, Generator, Iterable
+from itertools import batched
+from typing import Any
+
+import orjson
+from asgiref.sync import sync_to_async
+from django.core.handlers.asgi import ASGIRequest
+from django.db.models import QuerySet
+from django.http import StreamingHttpResponse
+from rest_framework.request import Request
+
+from .renderers import ORJSONRenderer
+from .routers import reading_from_replica, set_replica_reads
+from .serializers import RowSerializer
+
+EXPORT_CONTENT_TYPES = {
+    "ndjson": "application/x-ndjson",
+    "csv": "text/csv; charset=utf-8",
+}
+
+json_renderer = ORJSONRenderer()
+
+# Planilhas interpretam como fórmula células que começam com estes caracteres;
+# o apóstrofo entra para que o prefixo possa ser removido sem ambiguidade
+CSV_ESCAPED_PREFIXES = ("=", "+", "-", "@", "\t", "\r", "'")
+
+
+def export_response(
+    request: Request,
+    rows: QuerySet[Any],
+    row_serializer: RowSerializer,
+    output: str,
+    filename: str,
+    chunk_size: int,
+) -> StreamingHttpResponse:
+    """
+    Resposta que transmite as linhas em NDJSON ou CSV, sem paginação.
+
+    As linhas são lidas com um cursor no servidor, `chunk_size` por vez, e
+    cada lote é serializado e enviado antes de ler o próximo, então a memória
+    não cresce com o total exportado. Sob ASGI, cada lote é lido em uma
+    thread e entregue por um iterador assíncrono.
+    """
+    chunks = (
+        row_serializer.serialize(list(chunk))
+        for chunk in batched(rows.iterator(chunk_size=chunk_size), chunk_size)
+    )
+    if output == "csv":
+        parts = csv_parts(chunks, row_serializer.csv_columns)
+    else:
+        parts = ndjson_parts(chunks)
+
+    # ReplicaReadMixin desfaz a marca ao finalizar a resposta, antes da leitura
+    content = read_with_replica(parts, reading_from_replica())
+    response = StreamingHttpResponse(
+        aiterate(content) if isinstance(request._request, ASGIRequest) else content,
+        content_type=EXPORT_CONTENT_TYPES[output],
+    )
+    response["Content-Disposition"] = f'attachment; filename="{filename}.{output}"'
+    return response
+
+
+def ndjson_parts(
+    chunks: Iterable[list[dict[str, Any]]],
+) -> Generator[bytes, None, None]:
+    """Um objeto JSON por linha, com a mesma codificação das respostas."""
+    for representations in chunks:
+        yield b"".join(json_renderer.render(item) + b"\n" for item in representations)
+
+
+def csv_parts(
+    chunks: Iterable[list[dict[str, Any]]], columns: tuple[str, ...]
+) -> Generator[bytes, None, None]:
+    """
+    Cabeçalho e uma linha por representação, nas colunas informadas.
+
+    Colunas com ponto (ex: "address.city") percorrem os objetos aninhados;
+    listas, como os contatos, vão para a célula como JSON.
+    """
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow(columns)
+    for representations in chunks:
+        writer.writerows(
+            [csv_cell(item, column) for column in columns] for item in representations
+        )
+        yield buffer.getvalue().encode()
+        buffer.seek(0)
+        buffer.truncate()
+    if buffer.tell():
+        # Só o cabeçalho, quando não há linhas
+        yield buffer.getvalue().encode()
+
+
+def csv_cell(representation: dict[str, Any], column: str) -> Any:
+    """
+    Valor da coluna na representação; vazio quando ausente ou nulo.
+
+    Textos que uma planilha executaria como fórmula (ex: "=HYPERLINK(...)")
+    recebem um apóstrofo na frente, removido por `csv_record`.
+    """
+    value: Any = representation
+    for key in column.split("."):
+        value = value.get(key) if isinstance(value, dict) else None
+    if isinstance(value, (dict, list)):
+        return json_renderer.render(value).decode()
+    if isinstance(value, str) and value.startswith(CSV_ESCAPED_PREFIXES):
+        return f"'{value}"
+    return "" if value is None else value
+
+
+def csv_record(row: dict[str, str]) -> dict[str, Any]:
+    """
+    Inverso de `csv_cell`: monta a representação a partir de uma linha do CSV.
+
+    Colunas com ponto viram objetos aninhados, células com uma lista ou um
+    objeto JSON são decodificadas, o apóstrofo de escape é removido e células
+    vazias são omitidas.
+    """
+    record: dict[str, Any] = {}
+    for column, cell in row.items():
+        if not column or not cell:
+            continue
+        value: Any = cell
+        if cell[0] == "'" and cell[1:].startswith(CSV_ESCAPED_PREFIXES):
+            value = cell[1:]
+        elif cell[0] in "[{":
+            try:
+                value = orjson.loads(cell)
+            except orjson.JSONDecodeError:
+                pass
+        *parents, key = column.split(".")
+        target = record
+        for parent in parents:
+            target = target.setdefault(parent, {})
+        target[key] = value
+    return record
+
+
+def read_with_replica(
+    parts: Generator[bytes, None, None], replica: bool
+) -> Generator[bytes, None, None]:
+    """Lê cada parte com as leituras na réplica, se habilitadas na requisição."""
+    try:
+        while True:
+            set_replica_reads(replica)
+            try:
+                part = next(parts, None)
+            finally:
+                set_replica_reads(False)
+            if part is None:
+                return
+            yield part
+    finally:
+        parts.close()
+
+
+async def aiterate(parts: Generator[bytes, None, None]) -> AsyncIterator[bytes]:
+    """
+    Consome o gerador síncrono parte a parte, em uma thread.
+
+    Com um iterador síncrono, o Django sob ASGI leria a exportação inteira
+    para a memória antes de enviá-la. As chamadas são thread-sensitive, então
+    o cursor no servidor fica na conexão de uma mesma thread.
+    """
+    read = sync_to_async(functools.partial(next, parts, None))
+    try:
+        while (part := await read()) is not None:
+            yield part
+    finally:
+        # Fecha o cursor quando o cliente desconecta no meio da exportação
+        await sync_to_async(parts.close)()
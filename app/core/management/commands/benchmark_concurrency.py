@@ -0,0 +1,69 @@
+import statistics
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any
+from urllib.error import HTTPError
+from urllib.request import Request, urlopen
+
+from django.core.management.base import BaseCommand, CommandError, CommandParser
+
+
+class Command(BaseCommand):
+    help = (
+        "Dispara requisições GET concorrentes contra um servidor em execução e "
+        "mostra a vazão e a latência, para comparar os modos WSGI e ASGI."
+    )
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        parser.add_argument("url", help="URL completa do endpoint a medir.")
+        parser.add_argument(
+            "--concurrency",
+            type=int,
+            default=50,
+            help="Requisições simultâneas (padrão: 50).",
+        )
+        parser.add_argument(
+            "--requests",
+            type=int,
+            default=1000,
+            help="Total de requisições (padrão: 1000).",
+        )
+        parser.add_argument(
+            "--token",
+            help="Access token OAuth2 enviado como Bearer.",
+        )
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        headers: dict[str, str] = {}
+        if options["token"]:
+            headers["Authorization"] = f"Bearer {options['token']}"
+
+        def fetch(_: int) -> tuple[int, float]:
+            start = time.perf_counter()
+            try:
+                with urlopen(Request(options["url"], headers=headers)) as response:
+                    response.read()
+                    code = response.status
+            except HTTPError as exc:
+                code = exc.code
+            return code, (time.perf_counter() - start) * 1000
+
+        fetch(0)  # aquece conexões e caches fora da medição
+        start = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=options["concurrency"]) as executor:
+            results = list(executor.map(fetch, range(options["requests"])))
+        elapsed = time.perf_counter() - start
+
+        failures = sum(1 for code, _ in results if code != 200)
+        if failures == len(results):
+            raise CommandError(f"Nenhuma resposta 200 (status {results[0][0]}).")
+
+        timings = [timing for _, timing in results]
+        self.stdout.write(
+            f"{len(results)} requisições, {options['concurrency']} simultâneas: "
+            f"{len(results) / elapsed:.1f} req/s, "
+            f"mediana {statistics.median(timings):.1f} ms, "
+            f"p95 {statistics.quantiles(timings, n=20)[-1]:.1f} ms"
+        )
+        if failures:
+            self.stdout.write(self.style.WARNING(f"{failures} respostas não-200"))
@@ -0,0 +1,88 @@
+import statistics
+import time
+from collections.abc import Callable
+from typing import Any
+
+import psycopg
+from django.core.management.base import BaseCommand, CommandError, CommandParser
+from django.db import close_old_connections, connection
+
+
+def measure(run: Callable[[], None], total: int) -> list[float]:
+    """Tempo de cada execução de `run`, em milissegundos."""
+    timings = []
+    for _ in range(total):
+        start = time.perf_counter()
+        run()
+        timings.append((time.perf_counter() - start) * 1000)
+    return timings
+
+
+class Command(BaseCommand):
+    help = (
+        "Mede o custo de banco por requisição abrindo uma conexão nova a cada vez "
+        "e com a configuração atual (conexão persistente ou pool) e mostra a "
+        "economia por requisição."
+    )
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        parser.add_argument(
+            "--requests",
+            type=int,
+            default=200,
+            help="Número de requisições simuladas em cada modo (padrão: 200).",
+        )
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        if connection.vendor != "postgresql":
+            raise CommandError("Este comando requer PostgreSQL.")
+        if connection.in_atomic_block:
+            raise CommandError("Execute fora de uma transação.")
+
+        total = options["requests"]
+        params = connection.get_connection_params()
+
+        def new_connection() -> None:
+            # Handshake TCP + autenticação, consulta e fechamento
+            # Direto no psycopg: com o pool, get_new_connection pegaria uma dele
+            raw = psycopg.connect(**params)
+            with raw.cursor() as cursor:
+                cursor.execute("SELECT 1")
+            raw.close()
+
+        def configured() -> None:
+            # Ciclo de uma requisição: request_started e request_finished
+            # chamam close_old_connections, que fecha, verifica ou devolve a
+            # conexão conforme CONN_MAX_AGE, CONN_HEALTH_CHECKS e o pool
+            close_old_connections()
+            with connection.cursor() as cursor:
+                cursor.execute("SELECT 1")
+            close_old_connections()
+
+        configured()  # abre a conexão (ou o pool) fora da medição
+        baseline = measure(new_connection, total)
+        current = measure(configured, total)
+
+        settings = connection.settings_dict
+        if settings["OPTIONS"].get("pool"):
+            mode = "pool do psycopg"
+        elif settings["CONN_MAX_AGE"]:
+            mode = f"persistente, CONN_MAX_AGE={settings['CONN_MAX_AGE']}"
+        else:
+            mode = "CONN_MAX_AGE=0"
+
+        self.report("Conexão nova por requisição", baseline)
+        self.report(f"Configuração atual ({mode})", current)
+        saved = statistics.median(baseline) - statistics.median(current)
+        self.stdout.write(
+            self.style.SUCCESS(f"Economia por requisição (mediana): {saved:.2f} ms")
+        )
+
+    def report(self, name: str, timings: list[float]) -> None:
+        p95 = (
+            statistics.quantiles(timings, n=20)[-1] if len(timings) > 1 else timings[0]
+        )
+        self.stdout.write(
+            f"{name}: mediana {statistics.median(timings):.2f} ms, "
+            f"p95 {p95:.2f} ms ({len(timings)} requisições)"
+        )
@@ -0,0 +1,123 @@
+import statistics
+import time
+from collections.abc import Callable, Sized
+from typing import Any
+
+from django.core.management.base import BaseCommand, CommandError, CommandParser
+from django.db import connection
+
+from app.appointments.models import Appointment
+from app.appointments.serializers import (
+    AppointmentDetailSerializer,
+    AppointmentRowSerializer,
+)
+from app.professionals.models import Professional
+from app.professionals.serializers import (
+    ProfessionalRowSerializer,
+    ProfessionalSerializer,
+)
+
+
+class QueryTimer:
+    """execute_wrapper que soma o tempo gasto no banco."""
+
+    def __init__(self) -> None:
+        self.elapsed = 0.0
+
+    def __call__(
+        self,
+        execute: Callable[..., Any],
+        sql: str,
+        params: Any,
+        many: bool,
+        context: Any,
+    ) -> Any:
+        start = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            self.elapsed += time.perf_counter() - start
+
+
+def measure(build: Callable[[], Sized], repeat: int) -> tuple[float, int]:
+    """Mediana do tempo fora do banco, em segundos, e o número de linhas."""
+    timings = []
+    rows = 0
+    for _ in range(repeat):
+        timer = QueryTimer()
+        with connection.execute_wrapper(timer):
+            start = time.perf_counter()
+            rows = len(build())
+            timings.append(time.perf_counter() - start - timer.elapsed)
+    return statistics.median(timings), rows
+
+
+class Command(BaseCommand):
+    help = (
+        "Compara o tempo por linha da serialização das listagens com os "
+        "serializers do DRF e com os RowSerializer, descontando o tempo gasto "
+        "no banco."
+    )
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        parser.add_argument(
+            "--rows",
+            type=int,
+            default=200,
+            help="Linhas serializadas por execução (padrão: 200).",
+        )
+        parser.add_argument(
+            "--repeat",
+            type=int,
+            default=20,
+            help="Execuções de cada modo (padrão: 20).",
+        )
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        total, repeat = options["rows"], options["repeat"]
+        professionals = Professional.objects.defer(*Professional.search_columns)
+        appointments = (
+            Appointment.objects.select_related("professional")
+            .defer(*(f"professional__{c}" for c in Professional.search_columns))
+            .order_by("-date", "-id")
+        )
+        professional_rows = ProfessionalRowSerializer()
+        appointment_rows = AppointmentRowSerializer()
+
+        cases: list[tuple[str, Callable[[], Sized], Callable[[], Sized]]] = [
+            (
+                "profissionais",
+                lambda: ProfessionalSerializer(
+                    professionals.prefetch_related(
+                        *ProfessionalSerializer.get_prefetches()
+                    )[:total],
+                    many=True,
+                ).data,
+                lambda: professional_rows.serialize(
+                    list(professional_rows.values(professionals)[:total])
+                ),
+            ),
+            (
+                "consultas",
+                lambda: AppointmentDetailSerializer(
+                    appointments.prefetch_related(
+                        *AppointmentDetailSerializer.get_prefetches()
+                    )[:total],
+                    many=True,
+                ).data,
+                lambda: appointment_rows.serialize(
+                    list(appointment_rows.values(appointments)[:total])
+                ),
+            ),
+        ]
+
+        for name, drf, fast in cases:
+            drf_seconds, rows = measure(drf, repeat)
+            if not rows:
+                raise CommandError(f"Sem {name} no banco para medir.")
+            fast_seconds, _ = measure(fast, repeat)
+            self.stdout.write(
+                f"{name}: DRF {drf_seconds / rows * 1e6:.1f} µs/linha, "
+                f"RowSerializer {fast_seconds / rows * 1e6:.1f} µs/linha "
+                f"({drf_seconds / fast_seconds:.1f}x mais rápido, {rows} linhas)"
+            )
@@ -0,0 +1,208 @@
+from collections.abc import Mapping
+from datetime import timedelta
+from typing import Any
+from urllib.parse import urlencode
+
+from django.core.management.base import BaseCommand, CommandError, CommandParser
+from django.db import connection, transaction
+from django.db.models import QuerySet
+from django.http import HttpRequest, QueryDict
+from django.test.utils import CaptureQueriesContext
+from rest_framework.request import Request
+from rest_framework.settings import api_settings
+
+from app.appointments.models import Appointment
+from app.appointments.pagination import AppointmentKeysetPagination, KeysetCursor
+from app.appointments.services import AppointmentService
+from app.appointments.views import AppointmentViewSet
+from app.core.viewsets import RowReadMixin
+from app.professionals.views import ProfessionalViewSet
+
+
+def find_seq_scans(plan: str) -> list[str]:
+    """Retorna as linhas do plano que contêm varredura sequencial."""
+    return [line.strip() for line in plan.splitlines() if "Seq Scan" in line]
+
+
+class Command(BaseCommand):
+    help = (
+        "Executa EXPLAIN ANALYZE nas principais consultas de listagem e busca e falha "
+        "quando alguma delas usa varredura sequencial."
+    )
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        parser.add_argument(
+            "--planner-defaults",
+            action="store_true",
+            help="Mantém enable_seqscan ligado. Por padrão a varredura "
+            "sequencial é desligada, pois em bases pequenas o planejador a "
+            "prefere mesmo quando existe um índice adequado.",
+        )
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        if connection.vendor != "postgresql":
+            raise CommandError("Este comando requer PostgreSQL.")
+
+        sample = (
+            Appointment.objects.order_by("-date", "-id")
+            .values("id", "date", "professional_id", "professional__uuid")
+            .first()
+        )
+        if sample is None:
+            self.stdout.write("Nenhuma consulta cadastrada; nada a verificar.")
+            return
+
+        failures: list[str] = []
+        with transaction.atomic():
+            if not options["planner_defaults"]:
+                with connection.cursor() as cursor:
+                    cursor.execute("SET LOCAL enable_seqscan = off")
+
+            plans = [
+                *(
+                    (name, queryset.explain(analyze=True))
+                    for name, queryset in self.get_querysets(sample)
+                ),
+                *(
+                    (f"{name} (contagem)", self.explain_count(queryset))
+                    for name, queryset in self.get_count_querysets(sample)
+                ),
+            ]
+            for name, plan in plans:
+                if options["verbosity"] >= 2:
+                    self.stdout.write(f"{name}:\n{plan}\n")
+                seq_scans = find_seq_scans(plan)
+                if seq_scans:
+                    failures.append(name)
+                    self.stdout.write(self.style.ERROR(f"SEQ SCAN  {name}"))
+                    for line in seq_scans:
+                        self.stdout.write(f"    {line}")
+                else:
+                    self.stdout.write(self.style.SUCCESS(f"OK        {name}"))
+
+        if failures:
+            raise CommandError(
+                f"Varredura sequencial em {len(failures)} consulta(s): "
+                + ", ".join(failures)
+            )
+
+    def get_querysets(
+        self, sample: Mapping[str, Any]
+    ) -> list[tuple[str, QuerySet[Any]]]:
+        """Monta as consultas pelos mesmos caminhos da API."""
+        page_size = api_settings.PAGE_SIZE or 20
+        keyset = KeysetCursor(sample["date"], sample["id"], reverse=False)
+        pagination = AppointmentKeysetPagination()
+        by_professional = {"professional_uuid": str(sample["professional__uuid"])}
+        week = {
+            "date_from": (sample["date"] - timedelta(days=7)).isoformat(),
+            "date_to": sample["date"].isoformat(),
+        }
+
+        return [
+            ("consultas: lista", self.list_rows({})[:page_size]),
+            (
+                "consultas: lista por profissional",
+                self.list_rows(by_professional)[:page_size],
+            ),
+            ("consultas: período", self.list_rows(week)[:page_size]),
+            (
+                "consultas: período por profissional",
+                self.list_rows({**week, **by_professional})[:page_size],
+            ),
+            (
+                "consultas: página por cursor",
+                pagination.get_page_queryset(self.list_rows({}), keyset)[
+                    : page_size + 1
+                ],
+            ),
+            (
+                "consultas: página por cursor por profissional",
+                pagination.get_page_queryset(self.list_rows(by_professional), keyset)[
+                    : page_size + 1
+                ],
+            ),
+            (
+                "profissionais: horários livres",
+                AppointmentService.window_queryset(
+                    sample["professional_id"],
+                    sample["date"] - timedelta(days=7),
+                    sample["date"],
+                ),
+            ),
+            (
+                "profissionais: busca",
+                self.list_rows({"search": "psicóloga em Recife"}, ProfessionalViewSet)[
+                    :page_size
+                ],
+            ),
+            (
+                "profissionais: proximidade",
+                self.list_rows(
+                    {"near": "-23.55,-46.63", "radius_km": "50"}, ProfessionalViewSet
+                )[:page_size],
+            ),
+        ]
+
+    def get_count_querysets(
+        self, sample: Mapping[str, Any]
+    ) -> list[tuple[str, QuerySet[Any]]]:
+        """Listagens cujo COUNT(*) a paginação por página executa."""
+        by_professional = {"professional_uuid": str(sample["professional__uuid"])}
+        week = {
+            "date_from": (sample["date"] - timedelta(days=7)).isoformat(),
+            "date_to": sample["date"].isoformat(),
+        }
+        return [
+            ("consultas: lista por profissional", self.list_queryset(by_professional)),
+            ("consultas: período", self.list_queryset(week)),
+            (
+                "consultas: período por profissional",
+                self.list_queryset({**week, **by_professional}),
+            ),
+        ]
+
+    @staticmethod
+    def explain_count(queryset: QuerySet[Any]) -> str:
+        """EXPLAIN ANALYZE do COUNT(*) que `queryset.count()` executa."""
+        with CaptureQueriesContext(connection) as context:
+            queryset.count()
+        with connection.cursor() as cursor:
+            cursor.execute(f"EXPLAIN ANALYZE {context.captured_queries[-1]['sql']}")
+            return "\n".join(row[0] for row in cursor.fetchall())
+
+    @staticmethod
+    def list_view(
+        params: dict[str, str],
+        viewset_class: type[RowReadMixin] = AppointmentViewSet,
+    ) -> RowReadMixin:
+        """Instancia o viewset na action list com a query string informada."""
+        http_request = HttpRequest()
+        http_request.method = "GET"
+        http_request.GET = QueryDict(urlencode(params))
+        return viewset_class(
+            action="list",
+            request=Request(http_request),
+            args=(),
+            kwargs={},
+            format_kwarg=None,
+        )
+
+    def list_queryset(
+        self,
+        params: dict[str, str],
+        viewset_class: type[RowReadMixin] = AppointmentViewSet,
+    ) -> QuerySet[Any]:
+        """Obtém o queryset da action list do viewset."""
+        return self.list_view(params, viewset_class).get_queryset()
+
+    def list_rows(
+        self,
+        params: dict[str, str],
+        viewset_class: type[RowReadMixin] = AppointmentViewSet,
+    ) -> QuerySet[Any]:
+        """Linhas de values() que a listagem lê, com as colunas do ETag."""
+        view = self.list_view(params, viewset_class)
+        return view.get_row_serializer("list").values(
+            view.get_queryset(), view.validator_fields
+        )
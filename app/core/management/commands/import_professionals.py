@@ -0,0 +1,181 @@
+import csv
+import json
+import time
+from collections.abc import Iterator
+from itertools import batched, islice
+from pathlib import Path
+from typing import Any
+from uuid import UUID, uuid4
+
+import orjson
+from django.core.management.base import BaseCommand, CommandError, CommandParser
+from django.db import connection
+
+from app.core.batch import BatchResult, error_result, validate_items
+from app.core.export import csv_record
+from app.core.parsers import NDJSONParser
+from app.professionals.models import Professional
+from app.professionals.serializers import ProfessionalSerializer
+from app.professionals.services import ProfessionalService
+
+FORMATS = ["csv", "ndjson"]
+
+
+def read_records(path: Path, file_format: str) -> Iterator[Any]:
+    """Registros do arquivo, lidos um a um; linhas NDJSON inválidas viram None."""
+    if file_format == "csv":
+        with path.open(newline="", encoding="utf-8-sig") as file:
+            yield from (csv_record(row) for row in csv.DictReader(file))
+    else:
+        with path.open("rb") as file:
+            yield from NDJSONParser().parse(file)
+
+
+def resume_position(state_path: Path) -> int:
+    """
+    Quantos registros uma execução anterior interrompida já processou.
+
+    Antes de gravar um lote com UUIDs gerados, o progresso registra o
+    primeiro deles; se ele existe no banco, o lote foi gravado e a execução
+    parou antes de salvar o progresso.
+    """
+    if not state_path.exists():
+        return 0
+    state = json.loads(state_path.read_text())
+    pending = state.get("pending")
+    if pending and Professional.objects.filter(uuid=pending["marker"]).exists():
+        return int(pending["position"])
+    return int(state["position"])
+
+
+def save_state(state_path: Path, state: dict[str, Any]) -> None:
+    """Grava o progresso de forma atômica (arquivo temporário e rename)."""
+    temporary = state_path.with_name(f"{state_path.name}.tmp")
+    temporary.write_text(json.dumps(state))
+    temporary.replace(state_path)
+
+
+class Command(BaseCommand):
+    help = (
+        "Importa profissionais de um arquivo CSV ou NDJSON no formato da exportação "
+        "(GET /api/v1/professionals/export/). Cada registro é validado como na "
+        "API e os válidos são gravados em lotes via COPY em tabelas temporárias. "
+        "O progresso é salvo após cada lote; executar de novo retoma do ponto em "
+        "que parou."
+    )
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        parser.add_argument("path", help="Arquivo .csv ou .ndjson a importar.")
+        parser.add_argument(
+            "--format",
+            choices=FORMATS,
+            help="Formato do arquivo (padrão: pela extensão).",
+        )
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=10000,
+            help="Registros por lote, cada um em uma transação (padrão: 10000).",
+        )
+        parser.add_argument(
+            "--restart",
+            action="store_true",
+            help="Ignora o progresso salvo e começa do primeiro registro.",
+        )
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        if connection.vendor != "postgresql":
+            raise CommandError("Este comando requer PostgreSQL.")
+
+        path = Path(options["path"])
+        if not path.is_file():
+            raise CommandError(f"Arquivo não encontrado: {path}")
+        file_format = options["format"] or path.suffix.lstrip(".").lower()
+        if file_format not in FORMATS:
+            raise CommandError("Informe o formato com --format csv ou ndjson.")
+
+        state_path = path.with_name(f"{path.name}.import-state")
+        errors_path = path.with_name(f"{path.name}.errors.ndjson")
+        start = 0 if options["restart"] else resume_position(state_path)
+        if start:
+            self.stdout.write(f"Retomando após {start} registros já processados.")
+
+        serializer = ProfessionalSerializer()
+        position = start
+        created = skipped = rejected = 0
+        began = time.perf_counter()
+        records = islice(read_records(path, file_format), start, None)
+        with errors_path.open("ab" if start else "wb") as errors_file:
+            for batch in batched(records, options["batch_size"]):
+                items, errors, marker = self.prepare_batch(batch, serializer)
+                for error in errors:
+                    error["index"] += position
+                    errors_file.write(orjson.dumps(error) + b"\n")
+                errors_file.flush()
+                rejected += len(errors)
+
+                next_position = position + len(batch)
+                if marker is not None:
+                    # UUIDs gerados não se repetem entre execuções: registra o
+                    # lote em curso para saber, ao retomar, se ele foi gravado
+                    save_state(
+                        state_path,
+                        {
+                            "position": position,
+                            "pending": {"position": next_position, "marker": marker},
+                        },
+                    )
+                inserted = ProfessionalService.copy_create(items) if items else 0
+                created += inserted
+                skipped += len(items) - inserted
+                position = next_position
+                save_state(state_path, {"position": position})
+
+                rate = (position - start) / (time.perf_counter() - began)
+                self.stdout.write(
+                    f"{position} registros processados: {created} criados, "
+                    f"{skipped} já existentes, {rejected} rejeitados "
+                    f"({rate:.0f} registros/s)"
+                )
+
+        state_path.unlink(missing_ok=True)
+        if not start and not rejected:
+            errors_path.unlink()
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Importação concluída: {created} criados, "
+                f"{skipped} já existentes, {rejected} rejeitados."
+            )
+        )
+        if rejected:
+            self.stdout.write(f"Registros rejeitados e seus erros: {errors_path}")
+
+    @staticmethod
+    def prepare_batch(
+        batch: tuple[Any, ...], serializer: ProfessionalSerializer
+    ) -> tuple[list[dict[str, Any]], list[BatchResult], str | None]:
+        """
+        Valida os registros do lote como na API e resolve o UUID de cada um.
+
+        Registros com `uuid` (como os da exportação) o mantêm; os demais
+        recebem um novo, e o primeiro deles é devolvido como marca do lote.
+        """
+        items: list[dict[str, Any]] = []
+        errors: list[BatchResult] = []
+        marker: str | None = None
+        for index, validated_data, error in validate_items(batch, serializer):
+            if validated_data is None:
+                if error is not None:
+                    errors.append(error)
+                continue
+            # O uuid é somente leitura no serializer; vem do registro original
+            raw_uuid = batch[index].get("uuid")
+            try:
+                item_uuid = UUID(str(raw_uuid)) if raw_uuid else uuid4()
+            except ValueError:
+                errors.append(error_result(index, {"uuid": ["UUID inválido."]}))
+                continue
+            if not raw_uuid:
+                marker = marker or str(item_uuid)
+            items.append({**validated_data, "uuid": item_uuid})
+        return items, errors, marker
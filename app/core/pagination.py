@@ -0,0 +1,26 @@
+from typing import Any
+
+from django.core.paginator import Paginator
+from django.db.models import QuerySet
+from rest_framework.pagination import PageNumberPagination
+from rest_framework.request import Request
+
+
+class RowPageNumberPagination(PageNumberPagination):
+    """
+    Paginação por página que conta o total em uma consulta informada pela view.
+
+    As linhas de `values()` de uma listagem trazem os JOINs das colunas da
+    saída, que o COUNT(*) não precisa. Com `count_queryset`, o total é contado
+    sobre ela; sem, conta as próprias linhas, como o PageNumberPagination.
+    """
+
+    count_queryset: QuerySet[Any] | None = None
+
+    def get_page_number(
+        self, request: Request, paginator: "Paginator[Any]"
+    ) -> int | str:
+        # Único ponto do DRF que recebe o paginator antes da contagem
+        if self.count_queryset is not None:
+            paginator.count = self.count_queryset.count()
+        return super().get_page_number(request, paginator)
@@ -0,0 +1,71 @@
+from collections.abc import Iterator
+from typing import IO, Any, Mapping
+
+import orjson
+from django.conf import settings
+from rest_framework.exceptions import ParseError
+from rest_framework.parsers import BaseParser, JSONParser
+
+
+class ORJSONParser(JSONParser):
+    """
+    JSONParser que decodifica com orjson.
+
+    Aceita os mesmos corpos que o JSONParser estrito do DRF: NaN e Infinity
+    são recusados, e o erro é o mesmo `ParseError`. A exceção são os números
+    fora do alcance de um float, como 1e400: o JSONParser os decodifica como
+    infinito e o orjson os recusa, o que evita um Infinity que a resposta
+    estrita não conseguiria codificar.
+    """
+
+    def parse(
+        self,
+        stream: IO[Any],
+        media_type: str | None = None,
+        parser_context: Mapping[str, Any] | None = None,
+    ) -> Any:
+        encoding = (parser_context or {}).get("encoding", settings.DEFAULT_CHARSET)
+        try:
+            body = stream.read()
+            if encoding.lower().replace("-", "") != "utf8":
+                body = body.decode(encoding)
+            return orjson.loads(body)
+        except ValueError as exc:
+            raise ParseError(f"JSON parse error - {exc}")
+
+
+class NDJSONParser(BaseParser):
+    """
+    Parser para corpos NDJSON (um objeto JSON por linha).
+
+    Retorna um gerador que decodifica as linhas sob demanda, permitindo
+    validar e gravar itens em lotes sem carregar o corpo inteiro. Linhas que
+    não são JSON válido, ou que não decodificam no charset da requisição, são
+    entregues como `None` para que o chamador possa reportar o erro no item
+    correspondente sem abortar os demais.
+    """
+
+    media_type = "application/x-ndjson"
+
+    def parse(
+        self,
+        stream: IO[Any],
+        media_type: str | None = None,
+        parser_context: Mapping[str, Any] | None = None,
+    ) -> Any:
+        encoding = (parser_context or {}).get("encoding") or "utf-8"
+        return self._iter_lines(stream, encoding)
+
+    @staticmethod
+    def _iter_lines(stream: IO[Any], encoding: str) -> Iterator[Any]:
+        if stream is None:
+            return
+        for raw_line in stream:
+            try:
+                line = raw_line.decode(encoding).strip()
+                if not line:
+                    continue
+                yield orjson.loads(line)
+            except ValueError:
+                # Inclui o UnicodeDecodeError de uma linha fora do charset
+                yield None
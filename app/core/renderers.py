@@ -0,0 +1,129 @@
+import math
+from collections.abc import Mapping, Sequence
+from datetime import date, datetime, time
+from decimal import Decimal
+from typing import Any
+from uuid import UUID
+
+import orjson
+from rest_framework.renderers import JSONRenderer
+
+# Folhas que nunca contêm floats, puladas sem chamada recursiva
+_LEAVES = frozenset({str, int, bool, type(None), datetime, date, time, UUID, Decimal})
+
+
+def _has_divergent_float(value: Any) -> bool:
+    """
+    Se `value` contém um float que o orjson codificaria diferente do `json`.
+
+    São os NaN e infinitos, que o orjson troca por null e o `json` estrito
+    recusa, e os menores que 1e-4 em módulo, que o `json` escreve com o
+    expoente de `repr()` (1e-07) e o orjson não (1e-7, 0.000015). Nos demais,
+    a saída dos dois é a mesma.
+    """
+    if isinstance(value, dict):
+        value = value.values()
+    elif not isinstance(value, (list, tuple)):
+        return _is_divergent_float(value)
+    for item in value:
+        if item.__class__ not in _LEAVES and _has_divergent_float(item):
+            return True
+    return False
+
+
+def _is_divergent_float(value: Any) -> bool:
+    return isinstance(value, float) and not (
+        value == 0 or 1e-4 <= abs(value) < math.inf
+    )
+
+
+def _has_divergent_field(data: Any, float_fields: Sequence[str]) -> bool:
+    """
+    Como `_has_divergent_float`, olhando apenas `float_fields` de cada item.
+
+    Os itens são os `results` de uma página, os de uma lista ou o próprio
+    objeto, no caso do detalhe e dos erros.
+    """
+    if not float_fields:
+        return False
+    if isinstance(data, dict) and isinstance(data.get("results"), list):
+        data = data["results"]
+    items = data if isinstance(data, list) else [data]
+    return any(
+        _is_divergent_float(item.get(name))
+        for item in items
+        if isinstance(item, dict)
+        for name in float_fields
+    )
+
+
+class _Delegate(Exception):
+    """Interrompe o orjson para que o JSONRenderer codifique os dados."""
+
+
+class ORJSONRenderer(JSONRenderer):
+    """
+    JSONRenderer que codifica com orjson.
+
+    A saída é a mesma, byte a byte, do JSONRenderer do DRF com as
+    configurações do projeto (JSON compacto, UTF-8 e estrito). UUIDs e
+    datetimes, inclusive em America/Sao_Paulo, são codificados pelo orjson no
+    formato de `isoformat()`, com o offset zero como "Z"; os demais tipos,
+    como Decimal, passam pelo encoder do DRF. Com `indent` no Accept,
+    configurações diferentes das do projeto ou dados que o orjson recusa ou
+    codificaria diferente (chaves que não são str, inteiros além de 64 bits,
+    NaN e floats muito pequenos), delega ao JSONRenderer.
+
+    Encontrar esses floats exige percorrer os dados em Python, o que custa
+    cerca de metade da renderização de uma página. Views que declaram
+    `float_fields`, os únicos campos dos itens que podem ser floats, têm
+    apenas esses campos verificados; nas demais, os dados são percorridos
+    inteiros.
+    """
+
+    option = orjson.OPT_UTC_Z
+
+    def render(
+        self,
+        data: Any,
+        accepted_media_type: str | None = None,
+        renderer_context: Mapping[str, Any] | None = None,
+    ) -> bytes:
+        if data is None:
+            return b""
+
+        indent = self.get_indent(accepted_media_type or "", renderer_context or {})
+        # Fora do modo estrito, NaN e Infinity viram literais no JSONRenderer e
+        # null no orjson
+        delegate = self.ensure_ascii or not self.compact or not self.strict
+        view = (renderer_context or {}).get("view")
+        float_fields = getattr(view, "float_fields", None)
+        if float_fields is None:
+            divergent = _has_divergent_float(data)
+        else:
+            divergent = _has_divergent_field(data, float_fields)
+        if indent is not None or delegate or divergent:
+            rendered: bytes = super().render(
+                data, accepted_media_type, renderer_context
+            )
+            return rendered
+
+        encoder = self.encoder_class()
+
+        def default(value: Any) -> Any:
+            # Decimal e iteráveis viram floats e listas no encoder do DRF
+            encoded = encoder.default(value)
+            if _has_divergent_float(encoded):
+                raise _Delegate
+            return encoded
+
+        try:
+            ret = orjson.dumps(data, default=default, option=self.option)
+        except orjson.JSONEncodeError:
+            rendered = super().render(data, accepted_media_type, renderer_context)
+            return rendered
+        # Como no JSONRenderer: U+2028 e U+2029 são válidos em JSON, mas não
+        # em JavaScript
+        return ret.replace(b"\xe2\x80\xa8", b"\\u2028").replace(
+            b"\xe2\x80\xa9", b"\\u2029"
+        )
@@ -0,0 +1,72 @@
+from contextvars import ContextVar
+from typing import Any
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import DEFAULT_DB_ALIAS
+from django.db.models import Model
+
+REPLICA_ALIAS = "replica"
+
+# Ligado pelo ReplicaReadMixin durante as leituras que podem ir à réplica
+_replica_reads: ContextVar[bool] = ContextVar("replica_reads", default=False)
+
+
+def replica_configured() -> bool:
+    """Se há uma réplica de leitura configurada (DB_REPLICA_HOST)."""
+    return REPLICA_ALIAS in settings.DATABASES
+
+
+def reading_from_replica() -> bool:
+    """Se as leituras do contexto atual vão para a réplica."""
+    return _replica_reads.get() and replica_configured()
+
+
+def set_replica_reads(enabled: bool) -> None:
+    """Habilita ou desabilita as leituras na réplica no contexto atual."""
+    _replica_reads.set(enabled)
+
+
+def pin_to_primary(name: str) -> None:
+    """
+    Faz as leituras marcadas com `name` irem ao primário por um tempo.
+
+    A janela (`DB_REPLICA_PIN_SECONDS`) cobre o atraso de replicação, para
+    que uma leitura logo após a escrita não veja o estado anterior a ela.
+    """
+    if replica_configured():
+        cache.set(f"db:primary:{name}", True, settings.DB_REPLICA_PIN_SECONDS)
+
+
+def is_pinned(*names: str) -> bool:
+    """Se alguma das marcas ainda está na janela de leitura do primário."""
+    return bool(cache.get_many([f"db:primary:{name}" for name in names]))
+
+
+class PrimaryReplicaRouter:
+    """
+    Envia leituras à réplica quando configurada e habilitada no contexto.
+
+    Escritas e migrações ficam sempre no primário; fora das leituras
+    habilitadas pelo ReplicaReadMixin, tudo vai ao primário, então sem
+    DB_REPLICA_HOST o comportamento é o de um único banco.
+    """
+
+    def db_for_read(self, model: type[Model], **hints: Any) -> str | None:
+        return REPLICA_ALIAS if reading_from_replica() else None
+
+    def db_for_write(self, model: type[Model], **hints: Any) -> str:
+        # Explícito: sem roteador, o Django gravaria no banco de onde a
+        # instância foi lida, que pode ser a réplica
+        return DEFAULT_DB_ALIAS
+
+    def allow_relation(self, obj1: Model, obj2: Model, **hints: Any) -> bool | None:
+        databases = {DEFAULT_DB_ALIAS, REPLICA_ALIAS}
+        if {obj1._state.db, obj2._state.db} <= databases:
+            return True
+        return None
+
+    def allow_migrate(
+        self, db: str, app_label: str, model_name: str | None = None, **hints: Any
+    ) -> bool:
+        return db != REPLICA_ALIAS
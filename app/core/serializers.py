@@ -0,0 +1,198 @@
+from collections.abc import Callable, Collection, Sequence
+from typing import Any, cast
+
+from django.db.models import QuerySet
+from rest_framework import serializers
+
+
+class BatchResultSerializer(serializers.Serializer[Any]):
+    """Resultado de um item de uma operação em lote."""
+
+    index = serializers.IntegerField()
+    status = serializers.ChoiceField(choices=["created", "error"])
+    uuid = serializers.UUIDField(required=False)
+
+    def get_fields(self) -> dict[str, serializers.Field[Any, Any, Any, Any]]:
+        # "errors" não pode ser declarado como atributo sem sobrescrever
+        # a propriedade Serializer.errors.
+        fields = super().get_fields()
+        fields["errors"] = serializers.DictField(required=False)
+        return fields
+
+
+class BatchResponseSerializer(serializers.Serializer[Any]):
+    """Resposta de uma operação em lote."""
+
+    created = serializers.IntegerField()
+    failed = serializers.IntegerField()
+    results = BatchResultSerializer(many=True)
+
+
+class ExportQuerySerializer(serializers.Serializer[Any]):
+    """Valida o formato de saída de uma exportação."""
+
+    output = serializers.ChoiceField(
+        choices=["ndjson", "csv"], required=False, default="ndjson"
+    )
+
+
+class SparseFieldsQuerySerializer(serializers.Serializer[Any]):
+    """
+    Valida ?fields= e ?expand=, listas de campos separadas por vírgula.
+
+    Os nomes aceitos vêm do contexto: `field_names` para fields e `expandable`
+    para expand. Sem fields, a saída tem todos os campos (None); com ele, os
+    campos listados mais as relações de expand.
+    """
+
+    expand = serializers.CharField(required=False, allow_blank=True)
+
+    def get_fields(self) -> dict[str, serializers.Field[Any, Any, Any, Any]]:
+        # "fields" não pode ser declarado como atributo sem sobrescrever
+        # a propriedade Serializer.fields.
+        fields = super().get_fields()
+        fields["fields"] = serializers.CharField(required=False)
+        return fields
+
+    def validate_fields(self, value: str) -> frozenset[str]:
+        return self.parse(value, self.context["field_names"])
+
+    def validate_expand(self, value: str) -> frozenset[str]:
+        return self.parse(value, self.context["expandable"])
+
+    def validate(self, attrs: dict[str, Any]) -> dict[str, Any]:
+        if "fields" not in attrs:
+            return {"fields": None}
+        return {"fields": attrs["fields"] | attrs.get("expand", frozenset())}
+
+    @staticmethod
+    def parse(value: str, choices: Collection[str]) -> frozenset[str]:
+        names = frozenset(name.strip() for name in value.split(",") if name.strip())
+        unknown = sorted(names - set(choices))
+        if unknown:
+            raise serializers.ValidationError(
+                f"Campos desconhecidos: {', '.join(unknown)}. "
+                f"Opções: {', '.join(choices)}."
+            )
+        return names
+
+
+Converter = Callable[[Any], Any]
+# Nome na saída, chave na linha de values() e conversor (None para aninhados)
+CompiledField = tuple[str, str, Converter | None]
+
+
+def field_converter(field: serializers.Field[Any, Any, Any, Any]) -> Converter:
+    """
+    Função com a mesma saída de `field.to_representation` para valores não nulos.
+
+    Texto, UUID e inteiros viram chamadas diretas de `str` e `int`; os demais
+    tipos (datas, escolhas) usam o método do próprio campo, criado uma vez.
+    """
+    if isinstance(field, serializers.CharField):
+        return str
+    if isinstance(field, serializers.UUIDField) and field.uuid_format == "hex_verbose":
+        return str
+    if isinstance(field, serializers.IntegerField):
+        return int
+    return field.to_representation
+
+
+_compiled_fields: dict[type[serializers.Serializer[Any]], tuple[CompiledField, ...]] = (
+    {}
+)
+
+
+def compile_fields(
+    serializer_class: type[serializers.Serializer[Any]],
+) -> tuple[CompiledField, ...]:
+    """Campos legíveis do serializer, na ordem da saída, com seus conversores."""
+    if serializer_class in _compiled_fields:
+        return _compiled_fields[serializer_class]
+
+    compiled: list[CompiledField] = []
+    for name, field in serializer_class().fields.items():
+        if field.write_only:
+            continue
+        # Depois do bind, source é sempre o nome do atributo
+        source = cast(str, field.source)
+        if isinstance(field, serializers.BaseSerializer):
+            compiled.append((name, source, None))
+        else:
+            compiled.append((name, source, field_converter(field)))
+    _compiled_fields[serializer_class] = tuple(compiled)
+    return _compiled_fields[serializer_class]
+
+
+class RowSerializer:
+    """
+    Serialização somente leitura a partir de linhas de `values()`.
+
+    Produz a mesma saída de `serializer_class` sem instanciar modelos nem
+    serializadores por linha: os campos do serializer são compilados uma vez
+    em conversores e aplicados a cada dicionário. Campos aninhados são
+    montados pelas subclasses e entregues a `build` já prontos. Com `fields`,
+    a saída traz apenas esses campos (sparse fieldset).
+    """
+
+    serializer_class: type[serializers.Serializer[Any]]
+    # Colunas da exportação em CSV; com ponto, acessam objetos aninhados
+    csv_columns: tuple[str, ...] = ()
+
+    def __init__(self, fields: Collection[str] | None = None) -> None:
+        self.fields = None if fields is None else frozenset(fields)
+
+    @classmethod
+    def field_names(cls) -> list[str]:
+        """Nomes dos campos da saída, na ordem do serializer."""
+        return [name for name, _, _ in compile_fields(cls.serializer_class)]
+
+    def includes(self, name: str) -> bool:
+        """Se o campo entra na saída; aninhados fora dela não são consultados."""
+        return self.fields is None or name in self.fields
+
+    def select(self, representation: dict[str, Any]) -> dict[str, Any]:
+        """A representação apenas com os campos pedidos."""
+        if self.fields is None:
+            return representation
+        return {
+            name: value for name, value in representation.items() if name in self.fields
+        }
+
+    @classmethod
+    def sources(cls) -> list[str]:
+        """Chaves de values() dos campos simples."""
+        return [
+            source
+            for _, source, converter in compile_fields(cls.serializer_class)
+            if converter is not None
+        ]
+
+    @classmethod
+    def build(
+        cls, row: dict[str, Any], nested: dict[str, Any] | None = None
+    ) -> dict[str, Any]:
+        """Monta a representação de uma linha, na ordem dos campos."""
+        nested = nested or {}
+        representation: dict[str, Any] = {}
+        for name, source, converter in compile_fields(cls.serializer_class):
+            if converter is None:
+                representation[name] = nested.get(name)
+            else:
+                value = row[source]
+                representation[name] = None if value is None else converter(value)
+        return representation
+
+    def values(
+        self, queryset: QuerySet[Any], extra: Sequence[str] = ()
+    ) -> QuerySet[Any]:
+        """
+        Consulta das linhas, sem os prefetches do queryset de modelos.
+
+        `extra` acrescenta colunas fora da saída, como as dos validadores HTTP.
+        """
+        return queryset.prefetch_related(None).values("id", *self.sources(), *extra)
+
+    def serialize(self, rows: list[dict[str, Any]]) -> list[dict[str, Any]]:
+        """Representações das linhas, na mesma ordem."""
+        return [self.select(self.build(row)) for row in rows]
@@ -0,0 +1,15 @@
+from typing import Any
+
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+from oauth2_provider.models import AbstractAccessToken, get_access_token_model
+
+from .authentication import CachedOAuth2Authentication
+
+
+@receiver([post_save, post_delete], sender=get_access_token_model())
+def invalidate_access_token(
+    sender: Any, instance: AbstractAccessToken, **kwargs: Any
+) -> None:
+    """Descarta o token revogado ou alterado do cache de autenticação."""
+    CachedOAuth2Authentication.invalidate(instance.token)
@@ -0,0 +1,119 @@
+from typing import TYPE_CHECKING, cast
+
+from rest_framework.permissions import SAFE_METHODS
+from rest_framework.request import Request
+from rest_framework.throttling import SimpleRateThrottle
+
+if TYPE_CHECKING:
+    # rest_framework.views importa as classes de throttling ao ser carregado
+    from rest_framework.views import APIView
+
+
+class SlidingWindowRateThrottle(SimpleRateThrottle):
+    """
+    Limite de requisições por janela deslizante aproximada.
+
+    Em vez da lista de timestamps do `SimpleRateThrottle` (O(taxa) em CPU e
+    memória por verificação), guarda um contador por janela fixa e estima a
+    janela deslizante ponderando a janela anterior pela fração que ainda se
+    sobrepõe a ela. São três operações de cache, todas O(1), e o incremento é
+    atômico no Redis, então o limite vale para todos os workers e slots que
+    compartilham o backend.
+    """
+
+    cache_format = "throttle:%(scope)s:%(ident)s"
+
+    num_requests: int
+    duration: int
+
+    def allow_request(self, request: Request, view: "APIView") -> bool:
+        if self.rate is None:
+            return True
+
+        self.key = self.get_cache_key(request, view)
+        if self.key is None:
+            return True
+
+        self.now = self.timer()
+        window, self.elapsed = divmod(self.now / self.duration, 1)
+        previous: int = self.cache.get(f"{self.key}:{int(window) - 1}", 0)
+        current = f"{self.key}:{int(window)}"
+        self.count = self._increment(current)
+        self.estimate = previous * (1 - self.elapsed) + self.count
+
+        if self.estimate > self.num_requests:
+            # Só as requisições aceitas contam para a janela
+            self._decrement(current)
+            return self.throttle_failure()
+        return self.throttle_success()
+
+    def _increment(self, key: str) -> int:
+        """Incrementa o contador da janela, que expira após duas janelas."""
+        self.cache.add(key, 0, self.duration * 2)
+        try:
+            return int(self.cache.incr(key))
+        except ValueError:
+            # A chave expirou entre o add e o incr
+            self.cache.set(key, 1, self.duration * 2)
+            return 1
+
+    def _decrement(self, key: str) -> None:
+        """Desfaz o incremento de uma requisição recusada."""
+        try:
+            self.cache.decr(key)
+        except ValueError:
+            # A chave expirou e, com ela, o incremento
+            pass
+
+    def throttle_success(self) -> bool:
+        return True
+
+    def wait(self) -> float | None:
+        """
+        Segundos até a estimativa voltar ao limite.
+
+        Dentro da janela atual, basta o peso da anterior cair o suficiente; se
+        a atual sozinha já excede o limite, é preciso esperar a virada e que
+        ela, agora como anterior, perca peso.
+        """
+        if self.count < self.num_requests:
+            previous = self.estimate - self.count
+            needed = 1 - (self.num_requests - self.count) / previous
+            return max(0.0, needed * (1 - self.elapsed)) * self.duration
+        remaining = 1 - self.elapsed
+        return (remaining + 1 - self.num_requests / self.count) * self.duration
+
+
+class UserReadWriteThrottle(SlidingWindowRateThrottle):
+    """
+    Limita cada usuário com taxas separadas para leitura e escrita.
+
+    GET, HEAD e OPTIONS usam o escopo `read` e os demais métodos, o escopo
+    `write` (`DEFAULT_THROTTLE_RATES`). Requisições anônimas são identificadas
+    pelo IP.
+    """
+
+    read_scope = "read"
+    write_scope = "write"
+
+    def __init__(self) -> None:
+        # A taxa depende do método da requisição e é resolvida em allow_request
+        self.rate = None
+
+    def allow_request(self, request: Request, view: "APIView") -> bool:
+        self.scope = (
+            self.read_scope if request.method in SAFE_METHODS else self.write_scope
+        )
+        self.rate = self.get_rate()
+        # get_rate exige a taxa do escopo, então parse_rate não devolve None
+        self.num_requests, self.duration = cast(
+            tuple[int, int], self.parse_rate(self.rate)
+        )
+        return super().allow_request(request, view)
+
+    def get_cache_key(self, request: Request, view: "APIView") -> str | None:
+        if request.user and request.user.is_authenticated:
+            ident = str(request.user.pk)
+        else:
+            ident = self.get_ident(request)
+        return self.cache_format % {"scope": self.scope, "ident": ident}
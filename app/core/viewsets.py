@@ -0,0 +1,148 @@
+from collections.abc import Callable, Sequence
+from typing import Any
+
+from django.http import StreamingHttpResponse
+from rest_framework.generics import GenericAPIView, get_object_or_404
+from rest_framework.permissions import SAFE_METHODS
+from rest_framework.request import Request
+from rest_framework.response import Response
+from rest_framework.throttling import BaseThrottle
+from rest_framework.views import APIView
+
+from .conditional import Validators, page_validators
+from .export import export_response
+from .pagination import RowPageNumberPagination
+from .routers import is_pinned, pin_to_primary, replica_configured, set_replica_reads
+from .serializers import (
+    ExportQuerySerializer,
+    RowSerializer,
+    SparseFieldsQuerySerializer,
+)
+
+
+class ReplicaReadMixin(APIView):
+    """
+    Envia à réplica de leitura as consultas de GET, HEAD e OPTIONS.
+
+    Cada escrita marca o cliente (usuário ou IP) para ler do primário durante
+    `DB_REPLICA_PIN_SECONDS` (read-your-writes). `primary_pins` lista marcas
+    compartilhadas que também forçam o primário, como a de quem invalida um
+    cache de respostas. Sem réplica configurada, não faz nada.
+    """
+
+    primary_pins: tuple[str, ...] = ()
+
+    def initial(self, request: Request, *args: Any, **kwargs: Any) -> None:
+        super().initial(request, *args, **kwargs)
+        if not replica_configured():
+            return
+
+        client = f"client:{self.client_ident(request)}"
+        if request.method in SAFE_METHODS:
+            set_replica_reads(not is_pinned(client, *self.primary_pins))
+        else:
+            pin_to_primary(client)
+
+    def finalize_response(
+        self, request: Request, response: Response, *args: Any, **kwargs: Any
+    ) -> Response:
+        # A thread (WSGI) é reaproveitada entre requisições
+        set_replica_reads(False)
+        return super().finalize_response(request, response, *args, **kwargs)
+
+    @staticmethod
+    def client_ident(request: Request) -> str:
+        """Usuário autenticado ou, sem ele, o IP (como no throttling)."""
+        if request.user and request.user.is_authenticated:
+            return f"user:{request.user.pk}"
+        return f"ip:{BaseThrottle().get_ident(request)}"
+
+
+class RowReadMixin(GenericAPIView[Any]):
+    """
+    Monta a listagem e o detalhe com um RowSerializer, sem instâncias.
+
+    `row_serializer_classes` mapeia "list" e "retrieve" ao RowSerializer de
+    cada ação. A consulta, os filtros, a paginação, o 404 e as permissões são
+    os mesmos de `list` e `retrieve` do DRF; só a serialização muda. A
+    exportação usa o RowSerializer da listagem, sem paginação.
+
+    Com `sparse_fieldsets`, listagem e detalhe aceitam ?fields= (campos da
+    resposta) e ?expand= (relações de `expandable_fields` somadas a fields).
+    """
+
+    row_serializer_classes: dict[str, type[RowSerializer]] = {}
+    pagination_class = RowPageNumberPagination
+    # Colunas de updated_at que compõem o ETag e o Last-Modified
+    validator_fields: list[str] = ["updated_at"]
+    export_chunk_size = 2000
+    sparse_fieldsets = False
+    expandable_fields: tuple[str, ...] = ()
+
+    def get_row_serializer(self, action: str) -> RowSerializer:
+        """RowSerializer da ação, restrito aos campos pedidos na query."""
+        row_serializer_class = self.row_serializer_classes[action]
+        if not self.sparse_fieldsets:
+            return row_serializer_class()
+        query = SparseFieldsQuerySerializer(
+            data=self.request.query_params,
+            context={
+                "field_names": row_serializer_class.field_names(),
+                "expandable": self.expandable_fields,
+            },
+        )
+        query.is_valid(raise_exception=True)
+        return row_serializer_class(query.validated_data["fields"])
+
+    def list_page(
+        self, request: Request, validator_fields: Sequence[str]
+    ) -> tuple[Validators, Callable[[], Response]]:
+        """
+        Lê a página e devolve seus validadores e a montagem da resposta.
+
+        O ETag e o Last-Modified vêm das linhas da página (com as colunas de
+        `validator_fields`) e do envelope da paginação, sem consulta sobre a
+        listagem inteira. A serialização, com as consultas de relações, só
+        acontece se a resposta for montada.
+        """
+        row_serializer = self.get_row_serializer("list")
+        queryset = self.filter_queryset(self.get_queryset())
+        rows = row_serializer.values(queryset, validator_fields)
+        if isinstance(self.paginator, RowPageNumberPagination):
+            # O COUNT(*) da paginação não precisa dos JOINs das colunas da saída
+            self.paginator.count_queryset = queryset
+        paginated = self.paginate_queryset(rows)
+        page = list(rows) if paginated is None else paginated
+        envelope = None if paginated is None else self.get_paginated_response([]).data
+
+        def build() -> Response:
+            data = row_serializer.serialize(page)
+            if paginated is None:
+                return Response(data)
+            return self.get_paginated_response(data)
+
+        return page_validators(request, page, validator_fields, envelope), build
+
+    def retrieve_rows(self, request: Request) -> Response:
+        row_serializer = self.get_row_serializer("retrieve")
+        lookup_url_kwarg = self.lookup_url_kwarg or self.lookup_field
+        row = get_object_or_404(
+            row_serializer.values(self.filter_queryset(self.get_queryset())),
+            **{self.lookup_field: self.kwargs[lookup_url_kwarg]},
+        )
+        self.check_object_permissions(request, row)
+        return Response(row_serializer.serialize([row])[0])
+
+    def export_rows(self, request: Request, filename: str) -> StreamingHttpResponse:
+        """Transmite todas as linhas filtradas no formato de `?output=`."""
+        query = ExportQuerySerializer(data=request.query_params)
+        query.is_valid(raise_exception=True)
+        row_serializer = self.row_serializer_classes["list"]()
+        return export_response(
+            request,
+            row_serializer.values(self.filter_queryset(self.get_queryset())),
+            row_serializer,
+            query.validated_data["output"],
+            filename,
+            self.export_chunk_size,
+        )
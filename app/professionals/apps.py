@@ -4,3 +4,6 @@ from django.apps import AppConfig
 class ProfessionalsConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "app.professionals"
+
+    def ready(self) -> None:
+        from . import signals  # noqa: F401
@@ -0,0 +1,140 @@
+import hashlib
+from collections.abc import Callable
+from uuid import UUID, uuid4
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+from rest_framework.request import Request
+from rest_framework.response import Response
+
+from app.core.conditional import Validators, conditional_response
+from app.core.routers import pin_to_primary
+
+Build = Callable[[], Response]
+
+
+class ProfessionalCache:
+    """
+    Cache das respostas de leitura de profissionais.
+
+    O detalhe é guardado por UUID. As páginas da listagem são guardadas pela
+    query string sob uma versão; invalidar a listagem troca a versão, o que
+    descarta todas as páginas de uma vez sem precisar enumerá-las.
+    """
+
+    detail_timeout = 60 * 60
+    list_timeout = 5 * 60
+    list_version_key = "professionals:list:version"
+    # Marca de leitura no primário enquanto a réplica pode estar atrasada
+    primary_pin = "professionals"
+
+    @staticmethod
+    def enabled() -> bool:
+        """
+        Se as respostas vão para o cache.
+
+        Só com um cache compartilhado (`SHARED_CACHE`): num cache local a cada
+        worker, a invalidação feita por um deles não alcança os demais.
+        """
+        return bool(settings.SHARED_CACHE)
+
+    @staticmethod
+    def detail_key(professional_uuid: UUID | str) -> str:
+        """Chave pelo UUID normalizado (ValueError se o valor não é um UUID)."""
+        return f"professionals:detail:{UUID(str(professional_uuid))}"
+
+    @classmethod
+    def list_key(cls, request: Request) -> str:
+        """Chave da página pela versão atual, host e parâmetros ordenados."""
+        query = "&".join(
+            f"{name}={value}"
+            for name, values in sorted(request.query_params.lists())
+            for value in values
+        )
+        digest = hashlib.sha256(f"{request.get_host()}?{query}".encode()).hexdigest()
+        return f"professionals:list:{cls._list_version()}:{digest}"
+
+    @classmethod
+    def _list_version(cls) -> str:
+        version: str | None = cache.get(cls.list_version_key)
+        if version is None:
+            cache.add(cls.list_version_key, uuid4().hex, None)
+            version = cache.get(cls.list_version_key, "")
+        return str(version)
+
+    @classmethod
+    def cached_response(
+        cls,
+        request: Request,
+        kind: str,
+        key: str,
+        timeout: int,
+        read: Callable[[], tuple[Validators | None, Build]],
+    ) -> Response:
+        """
+        Devolve o payload em cache ou monta a resposta e guarda o payload.
+
+        O ETag e o Last-Modified são guardados junto com o payload, então um
+        acerto responde 304 ou 200 sem consultar o banco. Em uma falha, `read`
+        devolve os validadores e a montagem do corpo; os validadores são
+        calculados antes do corpo, para que nunca sejam mais novos que ele.
+        Apenas respostas 200 são guardadas. O cabeçalho X-Cache indica HIT ou
+        MISS e os contadores de `stats` são incrementados.
+        """
+        entry = cache.get(key)
+        if entry is not None:
+            cls._count(kind, "hits")
+            data, cached_validators = entry
+            response = conditional_response(
+                request, cached_validators, lambda: Response(data)
+            )
+            response["X-Cache"] = "HIT"
+            return response
+
+        cls._count(kind, "misses")
+        current, build = read()
+        response = conditional_response(request, current, build)
+        if response.status_code == 200:
+            cache.set(key, (response.data, current), timeout)
+        response["X-Cache"] = "MISS"
+        return response
+
+    @staticmethod
+    def _count(kind: str, outcome: str) -> None:
+        key = f"professionals:cache:{kind}:{outcome}"
+        try:
+            cache.incr(key)
+        except ValueError:
+            cache.set(key, 1, None)
+
+    @staticmethod
+    def stats() -> dict[str, dict[str, int]]:
+        """Contadores de acertos e falhas do cache de detalhe e de listagem."""
+        return {
+            kind: {
+                outcome: cache.get(f"professionals:cache:{kind}:{outcome}", 0)
+                for outcome in ("hits", "misses")
+            }
+            for kind in ("detail", "list")
+        }
+
+    @classmethod
+    def invalidate(cls, professional_uuid: UUID | str | None = None) -> None:
+        """
+        Descarta o detalhe do profissional (se informado) e todas as páginas.
+
+        A invalidação é feita na hora e repetida após o commit, para que uma
+        leitura concorrente que tenha guardado o estado anterior à transação
+        também seja descartada. Com réplica de leitura, as próximas montagens
+        leem do primário até a réplica alcançar a escrita.
+        """
+
+        def drop() -> None:
+            if professional_uuid is not None:
+                cache.delete(cls.detail_key(professional_uuid))
+            cache.set(cls.list_version_key, uuid4().hex, None)
+            pin_to_primary(cls.primary_pin)
+
+        drop()
+        transaction.on_commit(drop)
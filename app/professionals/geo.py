@@ -0,0 +1,75 @@
+import csv
+import math
+from functools import lru_cache
+from pathlib import Path
+
+from django.db.models import F, FloatField, Value
+from django.db.models.expressions import CombinedExpression
+from django.db.models.functions import ASin, Cos, Power, Radians, Sin, Sqrt
+
+CEP_PREFIXES_PATH = Path(__file__).resolve().parent / "data" / "cep_prefixes.csv"
+EARTH_RADIUS_KM = 6371.0
+KM_PER_DEGREE = 111.32
+
+Coordinates = tuple[float, float]
+
+
+@lru_cache(maxsize=1)
+def load_cep_prefixes() -> dict[str, Coordinates]:
+    """Carrega a tabela offline de prefixos de CEP para coordenadas."""
+    with CEP_PREFIXES_PATH.open(encoding="utf-8") as file:
+        return {
+            row["prefix"]: (float(row["latitude"]), float(row["longitude"]))
+            for row in csv.DictReader(file)
+        }
+
+
+def coordinates_for_cep(zip_code: str | None) -> Coordinates | None:
+    """
+    Coordenadas aproximadas de um CEP pelo prefixo mais longo conhecido.
+
+    A tabela cobre todas as regiões postais (primeiro dígito) e refina para
+    sub-regiões e capitais, então qualquer CEP válido recebe ao menos o
+    centro aproximado da sua região.
+    """
+    if not zip_code:
+        return None
+    prefixes = load_cep_prefixes()
+    for length in range(len(zip_code), 0, -1):
+        coordinates = prefixes.get(zip_code[:length])
+        if coordinates is not None:
+            return coordinates
+    return None
+
+
+def bounding_box(
+    latitude: float, longitude: float, radius_km: float
+) -> tuple[Coordinates, Coordinates]:
+    """Retângulo (lat, lng) mínimo e máximo que contém o raio informado."""
+    lat_delta = radius_km / KM_PER_DEGREE
+    cos_lat = math.cos(math.radians(latitude))
+    lng_delta = (
+        180.0 if cos_lat < 1e-6 else min(radius_km / (KM_PER_DEGREE * cos_lat), 180.0)
+    )
+    return (
+        (latitude - lat_delta, longitude - lng_delta),
+        (latitude + lat_delta, longitude + lng_delta),
+    )
+
+
+def haversine_km(
+    latitude_field: str, longitude_field: str, origin: Coordinates
+) -> CombinedExpression:
+    """Expressão SQL da distância em km entre os campos e a origem (haversine)."""
+    latitude, longitude = origin
+    half_dlat = Radians(F(latitude_field) - Value(latitude)) / Value(2.0)
+    half_dlng = Radians(F(longitude_field) - Value(longitude)) / Value(2.0)
+    return ASin(
+        Sqrt(
+            Power(Sin(half_dlat), 2)
+            + Cos(Radians(Value(latitude)))
+            * Cos(Radians(F(latitude_field)))
+            * Power(Sin(half_dlng), 2)
+        ),
+        output_field=FloatField(),
+    ) * Value(2 * EARTH_RADIUS_KM)
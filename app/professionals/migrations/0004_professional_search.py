@@ -0,0 +1,91 @@
+# Generated by Django 5.2.9 on 2026-10-17 18:10
+
+import django.contrib.postgres.indexes
+import django.contrib.postgres.search
+from django.contrib.postgres.operations import TrigramExtension, UnaccentExtension
+from django.db import migrations, models
+
+SEARCH_VECTOR = (
+    django.contrib.postgres.search.SearchVector(
+        "social_name", weight="A", config="portuguese_unaccent"
+    )
+    + django.contrib.postgres.search.SearchVector(
+        "profession", weight="B", config="portuguese_unaccent"
+    )
+    + django.contrib.postgres.search.SearchVector(
+        "search_document", weight="C", config="portuguese_unaccent"
+    )
+)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("professionals", "0003_professional_uuid"),
+    ]
+
+    operations = [
+        UnaccentExtension(),
+        TrigramExtension(),
+        migrations.RunSQL(
+            sql=[
+                "CREATE TEXT SEARCH CONFIGURATION portuguese_unaccent "
+                "(COPY = portuguese)",
+                "ALTER TEXT SEARCH CONFIGURATION portuguese_unaccent "
+                "ALTER MAPPING FOR hword, hword_part, word "
+                "WITH unaccent, portuguese_stem",
+            ],
+            reverse_sql="DROP TEXT SEARCH CONFIGURATION portuguese_unaccent",
+        ),
+        migrations.AddField(
+            model_name="professional",
+            name="search_document",
+            field=models.TextField(
+                default="",
+                editable=False,
+                help_text="Nome, profissão, bairro e cidade sem acentos e em minúsculas",
+                verbose_name="Documento de busca",
+            ),
+        ),
+        migrations.RunSQL(
+            sql="""
+                UPDATE professionals_professional AS p
+                SET search_document = lower(unaccent(concat_ws(
+                    ' ',
+                    p.social_name,
+                    p.profession,
+                    (
+                        SELECT concat_ws(' ', a.neighborhood, a.city)
+                        FROM professionals_address AS a
+                        WHERE a.professional_id = p.id
+                        ORDER BY a.street
+                        LIMIT 1
+                    )
+                )))
+            """,
+            reverse_sql=migrations.RunSQL.noop,
+        ),
+        migrations.AddField(
+            model_name="professional",
+            name="search_vector",
+            field=models.GeneratedField(
+                db_persist=True,
+                expression=SEARCH_VECTOR,
+                output_field=django.contrib.postgres.search.SearchVectorField(),
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="professional",
+            index=django.contrib.postgres.indexes.GinIndex(
+                fields=["search_vector"], name="professional_search_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="professional",
+            index=django.contrib.postgres.indexes.GinIndex(
+                fields=["search_document"],
+                name="professional_search_trgm_idx",
+                opclasses=["gin_trgm_ops"],
+            ),
+        ),
+    ]
@@ -0,0 +1,196 @@
+# Generated by Django 5.2.9 on 2026-10-17 18:45
+
+from typing import Any
+
+from django.db import migrations, models
+
+# Cópia congelada de data/cep_prefixes.csv e de geo.coordinates_for_cep, para
+# que a migração continue reproduzindo o mesmo preenchimento mesmo que a
+# tabela ou a busca mudem depois
+CEP_PREFIXES = {
+    "0": (-23.5505, -46.6333),  # Grande São Paulo
+    "01": (-23.5505, -46.6333),  # São Paulo
+    "02": (-23.5505, -46.6333),  # São Paulo
+    "03": (-23.5505, -46.6333),  # São Paulo
+    "04": (-23.5505, -46.6333),  # São Paulo
+    "05": (-23.5505, -46.6333),  # São Paulo
+    "06": (-23.5329, -46.792),  # Osasco
+    "07": (-23.4628, -46.5333),  # Guarulhos
+    "08": (-23.5505, -46.6333),  # São Paulo
+    "09": (-23.6639, -46.5383),  # Santo André
+    "1": (-22.3246, -49.0871),  # Interior de São Paulo
+    "11": (-23.9608, -46.3336),  # Santos
+    "12": (-23.1896, -45.8841),  # São José dos Campos
+    "13": (-22.9056, -47.0608),  # Campinas
+    "14": (-21.1775, -47.8103),  # Ribeirão Preto
+    "15": (-20.8113, -49.3758),  # São José do Rio Preto
+    "16": (-21.7845, -48.178),  # Araraquara
+    "17": (-22.3246, -49.0871),  # Bauru
+    "18": (-23.5015, -47.4526),  # Sorocaba
+    "19": (-22.1256, -51.3889),  # Presidente Prudente
+    "2": (-22.9068, -43.1729),  # Rio de Janeiro e Espírito Santo
+    "20": (-22.9068, -43.1729),  # Rio de Janeiro
+    "21": (-22.9068, -43.1729),  # Rio de Janeiro
+    "22": (-22.9068, -43.1729),  # Rio de Janeiro
+    "23": (-22.9068, -43.1729),  # Rio de Janeiro
+    "24": (-22.8832, -43.1034),  # Niterói
+    "25": (-22.5112, -43.1779),  # Petrópolis
+    "26": (-22.7556, -43.4603),  # Nova Iguaçu
+    "27": (-22.5219, -44.1042),  # Volta Redonda
+    "28": (-21.7545, -41.3244),  # Campos dos Goytacazes
+    "29": (-20.3155, -40.3128),  # Espírito Santo
+    "290": (-20.3155, -40.3128),  # Vitória
+    "3": (-19.9167, -43.9345),  # Minas Gerais
+    "30": (-19.9167, -43.9345),  # Belo Horizonte
+    "31": (-19.9167, -43.9345),  # Belo Horizonte
+    "32": (-19.9317, -44.0536),  # Contagem
+    "35": (-19.4684, -44.2469),  # Sete Lagoas
+    "36": (-21.7642, -43.3496),  # Juiz de Fora
+    "37": (-21.5556, -45.4364),  # Varginha
+    "38": (-18.9186, -48.2772),  # Uberlândia
+    "39": (-16.735, -43.8617),  # Montes Claros
+    "4": (-12.9714, -38.5014),  # Bahia e Sergipe
+    "40": (-12.9714, -38.5014),  # Salvador
+    "41": (-12.9714, -38.5014),  # Salvador
+    "44": (-12.2664, -38.9663),  # Feira de Santana
+    "45": (-14.8615, -40.8442),  # Vitória da Conquista
+    "46": (-13.2513, -43.4183),  # Bom Jesus da Lapa
+    "47": (-12.1428, -44.9968),  # Barreiras
+    "48": (-9.4162, -40.5033),  # Juazeiro
+    "49": (-10.9472, -37.0731),  # Sergipe
+    "490": (-10.9472, -37.0731),  # Aracaju
+    "5": (-8.0476, -34.877),  # Nordeste Oriental
+    "50": (-8.0476, -34.877),  # Recife
+    "51": (-8.0476, -34.877),  # Recife
+    "52": (-8.0476, -34.877),  # Recife
+    "53": (-8.0089, -34.8553),  # Olinda
+    "55": (-8.276, -35.9819),  # Caruaru
+    "56": (-9.3891, -40.503),  # Petrolina
+    "57": (-9.6658, -35.7353),  # Alagoas
+    "570": (-9.6658, -35.7353),  # Maceió
+    "58": (-7.1195, -34.845),  # Paraíba
+    "580": (-7.1195, -34.845),  # João Pessoa
+    "581": (-7.2307, -35.8817),  # Campina Grande
+    "59": (-5.7945, -35.211),  # Rio Grande do Norte
+    "590": (-5.7945, -35.211),  # Natal
+    "596": (-5.1878, -37.3441),  # Mossoró
+    "6": (-3.7319, -38.5267),  # Norte e Nordeste Ocidental
+    "60": (-3.7319, -38.5267),  # Fortaleza
+    "61": (-3.7319, -38.5267),  # Fortaleza
+    "62": (-3.688, -40.3497),  # Sobral
+    "63": (-7.2131, -39.3151),  # Juazeiro do Norte
+    "64": (-5.0892, -42.8019),  # Piauí
+    "640": (-5.0892, -42.8019),  # Teresina
+    "65": (-2.5297, -44.3028),  # Maranhão
+    "650": (-2.5297, -44.3028),  # São Luís
+    "659": (-5.5263, -47.4916),  # Imperatriz
+    "66": (-1.4558, -48.4902),  # Belém
+    "67": (-1.3656, -48.3722),  # Ananindeua
+    "68": (-2.443, -54.7082),  # Santarém
+    "685": (-5.3686, -49.1179),  # Marabá
+    "689": (0.0349, -51.0694),  # Macapá
+    "69": (-3.119, -60.0217),  # Amazonas
+    "690": (-3.119, -60.0217),  # Manaus
+    "693": (2.8235, -60.6758),  # Boa Vista
+    "699": (-9.9747, -67.8243),  # Rio Branco
+    "7": (-15.7939, -47.8828),  # Centro-Oeste
+    "70": (-15.7939, -47.8828),  # Brasília
+    "71": (-15.7939, -47.8828),  # Brasília
+    "72": (-15.833, -48.0562),  # Taguatinga
+    "73": (-15.6536, -47.7885),  # Sobradinho
+    "74": (-16.6869, -49.2648),  # Goiânia
+    "75": (-16.3285, -48.9534),  # Anápolis
+    "76": (-16.2523, -49.6222),  # Goiás
+    "768": (-8.7612, -63.9004),  # Porto Velho
+    "769": (-10.8805, -61.9517),  # Ji-Paraná
+    "77": (-10.184, -48.3336),  # Palmas
+    "78": (-15.6014, -56.0979),  # Cuiabá
+    "787": (-16.4673, -54.6372),  # Rondonópolis
+    "79": (-20.4697, -54.6201),  # Campo Grande
+    "798": (-22.2231, -54.812),  # Dourados
+    "8": (-25.4284, -49.2733),  # Sul (PR e SC)
+    "80": (-25.4284, -49.2733),  # Curitiba
+    "81": (-25.4284, -49.2733),  # Curitiba
+    "82": (-25.4284, -49.2733),  # Curitiba
+    "83": (-25.535, -49.2064),  # Região Metropolitana de Curitiba
+    "84": (-25.0916, -50.1668),  # Ponta Grossa
+    "85": (-25.3935, -51.4562),  # Guarapuava
+    "86": (-23.3045, -51.1696),  # Londrina
+    "87": (-23.421, -51.9331),  # Maringá
+    "88": (-27.5954, -48.548),  # Santa Catarina
+    "880": (-27.5954, -48.548),  # Florianópolis
+    "89": (-26.3045, -48.8487),  # Joinville
+    "9": (-30.0346, -51.2177),  # Rio Grande do Sul
+    "90": (-30.0346, -51.2177),  # Porto Alegre
+    "91": (-30.0346, -51.2177),  # Porto Alegre
+    "92": (-29.9178, -51.1836),  # Canoas
+    "93": (-29.7604, -51.1472),  # São Leopoldo
+    "95": (-29.1678, -51.1794),  # Caxias do Sul
+    "96": (-31.7654, -52.3376),  # Pelotas
+    "97": (-29.6842, -53.8069),  # Santa Maria
+    "98": (-28.262, -52.4064),  # Passo Fundo
+    "99": (-28.262, -52.4064),  # Passo Fundo
+}
+
+
+def coordinates_for_cep(zip_code: str | None) -> tuple[float, float] | None:
+    """Coordenadas do prefixo mais longo conhecido do CEP."""
+    if not zip_code:
+        return None
+    for length in range(len(zip_code), 0, -1):
+        coordinates = CEP_PREFIXES.get(zip_code[:length])
+        if coordinates is not None:
+            return coordinates
+    return None
+
+
+def fill_coordinates(apps: Any, schema_editor: Any) -> None:
+    """Preenche as coordenadas dos endereços existentes a partir do CEP."""
+    Address = apps.get_model("professionals", "Address")
+    batch = []
+    for address in Address.objects.only("id", "zip_code").iterator(chunk_size=1000):
+        coordinates = coordinates_for_cep(address.zip_code)
+        address.latitude, address.longitude = coordinates or (None, None)
+        batch.append(address)
+        if len(batch) >= 1000:
+            Address.objects.bulk_update(batch, ["latitude", "longitude"])
+            batch = []
+    if batch:
+        Address.objects.bulk_update(batch, ["latitude", "longitude"])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("professionals", "0004_professional_search"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="address",
+            name="latitude",
+            field=models.FloatField(
+                editable=False,
+                help_text="Latitude aproximada, derivada do prefixo do CEP",
+                null=True,
+                verbose_name="Latitude",
+            ),
+        ),
+        migrations.AddField(
+            model_name="address",
+            name="longitude",
+            field=models.FloatField(
+                editable=False,
+                help_text="Longitude aproximada, derivada do prefixo do CEP",
+                null=True,
+                verbose_name="Longitude",
+            ),
+        ),
+        migrations.RunPython(fill_coordinates, migrations.RunPython.noop),
+        migrations.AddIndex(
+            model_name="address",
+            index=models.Index(
+                fields=["latitude", "longitude"], name="address_coordinates_idx"
+            ),
+        ),
+    ]
@@ -1,6 +1,10 @@
+from typing import Any
+
 from django.core.validators import RegexValidator
 from django.db import models
 
+from ..geo import coordinates_for_cep
+
 
 class Address(models.Model):
     """Modelo de Endereço do Profissional."""
@@ -58,6 +62,18 @@ class Address(models.Model):
         verbose_name="CEP",
         help_text="CEP com 8 dígitos (apenas números)",
     )
+    latitude = models.FloatField(
+        null=True,
+        editable=False,
+        verbose_name="Latitude",
+        help_text="Latitude aproximada, derivada do prefixo do CEP",
+    )
+    longitude = models.FloatField(
+        null=True,
+        editable=False,
+        verbose_name="Longitude",
+        help_text="Longitude aproximada, derivada do prefixo do CEP",
+    )
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
@@ -65,6 +81,24 @@ class Address(models.Model):
         verbose_name = "Endereço"
         verbose_name_plural = "Endereços"
         ordering = ["street"]
+        indexes = [
+            models.Index(
+                fields=["latitude", "longitude"], name="address_coordinates_idx"
+            ),
+        ]
+
+    def refresh_coordinates(self) -> None:
+        """Preenche latitude e longitude a partir da tabela offline de CEPs."""
+        coordinates = coordinates_for_cep(self.zip_code)
+        self.latitude, self.longitude = coordinates or (None, None)
+
+    def save(self, *args: Any, **kwargs: Any) -> None:
+        """Mantém as coordenadas sincronizadas com o CEP."""
+        self.refresh_coordinates()
+        update_fields = kwargs.get("update_fields")
+        if update_fields is not None and "zip_code" in update_fields:
+            kwargs["update_fields"] = {*update_fields, "latitude", "longitude"}
+        super().save(*args, **kwargs)
 
     def __str__(self) -> str:
         return f"{self.street}, {self.number or 's/n'} - {self.city}/{self.state}"
@@ -1,7 +1,12 @@
 import uuid
 
+from django.contrib.postgres.indexes import GinIndex
+from django.contrib.postgres.search import SearchVector, SearchVectorField
 from django.db import models
 
+# Configuração "portuguese" com unaccent antes do stemming (criada na migração 0004)
+SEARCH_CONFIG = "portuguese_unaccent"
+
 
 class Professional(models.Model):
     """Modelo de Profissional de Saúde."""
@@ -22,13 +27,37 @@ class Professional(models.Model):
         verbose_name="Profissão",
         help_text="Ocupação profissional (ex: Médico, Enfermeiro, Psicólogo)",
     )
+    search_document = models.TextField(
+        default="",
+        editable=False,
+        verbose_name="Documento de busca",
+        help_text="Nome, profissão, bairro e cidade sem acentos e em minúsculas",
+    )
+    search_vector = models.GeneratedField(
+        expression=SearchVector("social_name", weight="A", config=SEARCH_CONFIG)
+        + SearchVector("profession", weight="B", config=SEARCH_CONFIG)
+        + SearchVector("search_document", weight="C", config=SEARCH_CONFIG),
+        output_field=SearchVectorField(),
+        db_persist=True,
+    )
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
+    # Colunas usadas apenas pela busca, adiadas nas leituras da API
+    search_columns = ["search_document", "search_vector"]
+
     class Meta:
         verbose_name = "Profissional"
         verbose_name_plural = "Profissionais"
         ordering = ["social_name"]
+        indexes = [
+            GinIndex(fields=["search_vector"], name="professional_search_idx"),
+            GinIndex(
+                fields=["search_document"],
+                name="professional_search_trgm_idx",
+                opclasses=["gin_trgm_ops"],
+            ),
+        ]
 
     def __str__(self) -> str:
         return f"{self.social_name} - {self.profession}"
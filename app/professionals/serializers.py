@@ -1,7 +1,13 @@
-from typing import Any
+from collections import defaultdict
+from collections.abc import Sequence
+from typing import Any, cast
 
+from django.db.models import Model, Prefetch, QuerySet
 from rest_framework import serializers
 
+from app.core.serializers import RowSerializer
+
+from .geo import Coordinates
 from .models import Address, Contact, Professional
 from .services import ProfessionalService
 
@@ -52,6 +58,48 @@ class ProfessionalSerializer(serializers.ModelSerializer[Professional]):
         ]
         read_only_fields = ["uuid"]
 
+    # Relações lidas em to_representation fora dos campos aninhados declarados.
+    representation_relations = ["addresses"]
+
+    @classmethod
+    def get_prefetches(cls, prefix: str = "") -> "list[Prefetch[Any]]":
+        """
+        Monta os Prefetch necessários para serializar sem consultas N+1.
+
+        As relações são extraídas dos campos aninhados de leitura e de
+        `representation_relations`, ordenadas conforme o Meta de cada modelo.
+        O `prefix` permite reutilizar o plano a partir de outro modelo
+        (ex: "professional__" em consultas).
+        """
+        # source é sempre o nome de uma relação nos campos aninhados
+        relations = [
+            cast(str, field.source) or name
+            for name, field in cls._declared_fields.items()
+            if isinstance(field, serializers.ListSerializer) and not field.write_only
+        ]
+        relations += [
+            name for name in cls.representation_relations if name not in relations
+        ]
+
+        prefetches: list[Prefetch[Any]] = []
+        for name in relations:
+            related_model = cast(
+                type[Model], Professional._meta.get_field(name).related_model
+            )
+            ordering = related_model._meta.ordering or []
+            prefetches.append(
+                Prefetch(
+                    f"{prefix}{name}",
+                    queryset=related_model._default_manager.order_by(*ordering),
+                )
+            )
+        return prefetches
+
+    def validate(self, attrs: dict[str, Any]) -> dict[str, Any]:
+        """Aplica as regras do service já na validação."""
+        ProfessionalService.validate(attrs)
+        return attrs
+
     def create(self, validated_data: dict[str, Any]) -> Professional:
         """Delega criação para o service."""
         return ProfessionalService.create(validated_data)
@@ -65,10 +113,14 @@ class ProfessionalSerializer(serializers.ModelSerializer[Professional]):
     def to_representation(self, instance: Professional) -> dict[str, Any]:
         """Customiza a representação para retornar address como objeto único."""
         representation: dict[str, Any] = super().to_representation(instance)
-        addresses = instance.addresses.all()
+        # Lê do cache de prefetch quando disponível (uma única consulta sem ele)
+        addresses = list(instance.addresses.all())
         representation["address"] = (
-            AddressSerializer(addresses.first()).data if addresses.exists() else None
+            AddressSerializer(addresses[0]).data if addresses else None
         )
+        # Presente apenas quando a listagem foi filtrada por proximidade
+        if hasattr(instance, "distance_km"):
+            representation["distance_km"] = round(instance.distance_km, 1)
         return representation
 
 
@@ -81,3 +133,134 @@ class ProfessionalDetailSerializer(ProfessionalSerializer):
             "updated_at",
         ]
         read_only_fields = ["uuid", "created_at", "updated_at"]
+
+
+class AddressRowSerializer(RowSerializer):
+    """Mesma saída do AddressSerializer, a partir de linhas."""
+
+    serializer_class = AddressSerializer
+
+
+class ContactRowSerializer(RowSerializer):
+    """Mesma saída do ContactSerializer, a partir de linhas."""
+
+    serializer_class = ContactSerializer
+
+
+class ProfessionalRowSerializer(RowSerializer):
+    """
+    Mesma saída do ProfessionalSerializer, a partir de linhas de values().
+
+    Endereços e contatos são lidos em uma consulta cada, como nos prefetches,
+    e agrupados por profissional.
+    """
+
+    serializer_class = ProfessionalSerializer
+    csv_columns = (
+        "uuid",
+        "social_name",
+        "profession",
+        *(f"address.{name}" for name in AddressSerializer.Meta.fields),
+        "contacts",
+        "distance_km",
+    )
+
+    def values(
+        self, queryset: QuerySet[Professional], extra: Sequence[str] = ()
+    ) -> QuerySet[Any]:
+        fields = ["id", *self.sources(), *extra]
+        if "distance_km" in queryset.query.annotations:
+            fields.append("distance_km")
+        rows: QuerySet[Any] = queryset.prefetch_related(None).values(*fields)
+        return rows
+
+    def serialize(self, rows: list[dict[str, Any]]) -> list[dict[str, Any]]:
+        ids = [row["id"] for row in rows]
+        addresses: dict[int, dict[str, Any]] = {}
+        contacts: defaultdict[int, list[dict[str, Any]]] = defaultdict(list)
+        if ids:
+            for row in self.related_rows(Address, ids, AddressRowSerializer):
+                # Como em to_representation, vale o primeiro endereço
+                addresses.setdefault(row["professional_id"], row)
+            for row in self.related_rows(Contact, ids, ContactRowSerializer):
+                contacts[row["professional_id"]].append(ContactRowSerializer.build(row))
+
+        representations = []
+        for row in rows:
+            representation = self.build(row, {"contacts": contacts[row["id"]]})
+            address = addresses.get(row["id"])
+            representation["address"] = (
+                AddressRowSerializer.build(address) if address else None
+            )
+            if "distance_km" in row:
+                representation["distance_km"] = round(row["distance_km"], 1)
+            representations.append(representation)
+        return representations
+
+    @staticmethod
+    def related_rows(
+        model: type[Model], ids: list[int], row_serializer: type[RowSerializer]
+    ) -> QuerySet[Any]:
+        """Linhas de endereço ou contato dos profissionais, na ordem do Meta."""
+        return (
+            model._default_manager.filter(professional_id__in=ids)
+            .order_by(*(model._meta.ordering or []))
+            .values("professional_id", *row_serializer.sources())
+        )
+
+
+class ProfessionalDetailRowSerializer(ProfessionalRowSerializer):
+    """Mesma saída do ProfessionalDetailSerializer, a partir de linhas."""
+
+    serializer_class = ProfessionalDetailSerializer
+
+
+class NearQuerySerializer(serializers.Serializer[Any]):
+    """Valida o filtro de proximidade da listagem de profissionais."""
+
+    near = serializers.CharField()
+    radius_km = serializers.FloatField(
+        required=False, default=10, min_value=0.1, max_value=500
+    )
+
+    def validate_near(self, value: str) -> Coordinates:
+        """Converte "lat,lng" em coordenadas válidas."""
+        try:
+            latitude, longitude = (float(part) for part in value.split(","))
+        except ValueError:
+            raise serializers.ValidationError(
+                'Informe as coordenadas no formato "latitude,longitude".'
+            )
+        if not (-90 <= latitude <= 90 and -180 <= longitude <= 180):
+            raise serializers.ValidationError("Coordenadas fora do intervalo válido.")
+        return latitude, longitude
+
+
+class FacetCountSerializer(serializers.Serializer[Any]):
+    """Valor de uma faceta e quantos profissionais o possuem."""
+
+    value = serializers.CharField()
+    count = serializers.IntegerField()
+
+
+class FacetsSerializer(serializers.Serializer[Any]):
+    """Contagens de profissionais por profissão, cidade, estado e tipo de contato."""
+
+    profession = FacetCountSerializer(many=True)
+    city = FacetCountSerializer(many=True)
+    state = FacetCountSerializer(many=True)
+    kind = FacetCountSerializer(many=True)
+
+
+class CacheCountersSerializer(serializers.Serializer[Any]):
+    """Acertos e falhas de um cache."""
+
+    hits = serializers.IntegerField()
+    misses = serializers.IntegerField()
+
+
+class CacheStatsSerializer(serializers.Serializer[Any]):
+    """Contadores do cache de leitura de profissionais."""
+
+    detail = CacheCountersSerializer()
+    list = CacheCountersSerializer()
@@ -1,13 +1,45 @@
+import unicodedata
 from typing import Any
+from uuid import UUID
 
+from django.conf import settings
+from django.contrib.postgres.search import (
+    SearchQuery,
+    SearchRank,
+    TrigramStrictWordSimilarity,
+)
+from django.core.cache import cache
+from django.db import connection, transaction
+from django.db.models import Exists, F, Min, OuterRef, Q, QuerySet
+from django.utils import timezone
 from rest_framework.exceptions import ValidationError
 
+from .cache import ProfessionalCache
+from .geo import Coordinates, bounding_box, coordinates_for_cep, haversine_km
 from .models import Address, Contact, Professional
+from .models.professional import SEARCH_CONFIG
+
+# Colunas do endereço gravadas pela importação em massa (copy_create)
+IMPORT_ADDRESS_FIELDS = [
+    "street",
+    "number",
+    "neighborhood",
+    "complement",
+    "city",
+    "state",
+    "zip_code",
+]
 
 
 class ProfessionalService:
     """Service layer para operações de Profissional."""
 
+    id_cache_timeout = 60 * 60
+    facets_cache_key = "professionals:facets"
+    facets_cache_timeout = 5 * 60
+    # Facetas na ordem em que aparecem no GROUPING SETS
+    facet_names = ["profession", "city", "state", "kind"]
+
     @staticmethod
     def validate(data: dict[str, Any]) -> None:
         """Valida dados do profissional."""
@@ -29,6 +61,200 @@ class ProfessionalService:
         if errors:
             raise ValidationError(errors)
 
+    @classmethod
+    def resolve_id(cls, professional_uuid: str | UUID) -> int | None:
+        """
+        Converte o UUID público do profissional na chave primária interna.
+
+        O mapeamento é imutável, então fica em cache e as listagens filtradas
+        consultam `professional_id` diretamente, sem JOIN. Retorna None para
+        UUIDs inválidos ou inexistentes (que não são mantidos em cache).
+        """
+        try:
+            professional_uuid = UUID(str(professional_uuid))
+        except ValueError:
+            return None
+
+        key = f"professionals:id:{professional_uuid}"
+        professional_id: int | None = cache.get(key)
+        if professional_id is None:
+            professional_id = (
+                Professional.objects.filter(uuid=professional_uuid)
+                .values_list("id", flat=True)
+                .first()
+            )
+            if professional_id is not None:
+                cache.set(key, professional_id, cls.id_cache_timeout)
+        return professional_id
+
+    @staticmethod
+    def normalize_search_text(text: str) -> str:
+        """Remove acentos e converte para minúsculas, como o `unaccent` do banco."""
+        decomposed = unicodedata.normalize("NFKD", text)
+        return "".join(
+            char for char in decomposed if not unicodedata.combining(char)
+        ).lower()
+
+    @staticmethod
+    def build_search_document(
+        social_name: str, profession: str, address_data: dict[str, Any]
+    ) -> str:
+        """Monta o texto indexado para busca a partir do profissional e endereço."""
+        parts = [
+            social_name,
+            profession,
+            address_data.get("neighborhood"),
+            address_data.get("city"),
+        ]
+        return ProfessionalService.normalize_search_text(
+            " ".join(part for part in parts if part)
+        )
+
+    @staticmethod
+    def search(queryset: QuerySet[Professional], term: str) -> QuerySet[Professional]:
+        """
+        Filtra e ordena profissionais por relevância para o termo informado.
+
+        Combina busca textual em português sem acentos (stemming, índice GIN
+        em `search_vector`) com similaridade de trigramas sobre
+        `search_document` (índice GIN trigram), que tolera erros de digitação.
+        """
+        normalized = ProfessionalService.normalize_search_text(term)
+        query = SearchQuery(term, config=SEARCH_CONFIG, search_type="websearch")
+        return (
+            queryset.filter(
+                Q(search_vector=query)
+                | Q(search_document__trigram_strict_word_similar=normalized)
+            )
+            .annotate(
+                rank=SearchRank(F("search_vector"), query)
+                + TrigramStrictWordSimilarity(normalized, "search_document")
+            )
+            .order_by("-rank", "social_name", "id")
+        )
+
+    @staticmethod
+    def near(
+        queryset: QuerySet[Professional], origin: Coordinates, radius_km: float
+    ) -> QuerySet[Professional]:
+        """
+        Filtra profissionais a até `radius_km` da origem, ordenados por distância.
+
+        O retângulo envolvente do raio é resolvido pelo índice
+        (latitude, longitude) do endereço; a distância exata (haversine) só é
+        calculada para os endereços dentro dele. Com vários endereços no raio,
+        o profissional aparece uma vez, na distância do mais próximo. Após a
+        busca, a relevância desempata profissionais à mesma distância, comum
+        com as coordenadas aproximadas pelo CEP.
+        """
+        (min_lat, min_lng), (max_lat, max_lng) = bounding_box(*origin, radius_km)
+        ordering = ["distance_km", "id"]
+        if "rank" in queryset.query.annotations:
+            ordering[1:1] = ["-rank", "social_name"]
+        return (
+            queryset.filter(
+                addresses__latitude__range=(min_lat, max_lat),
+                addresses__longitude__range=(min_lng, max_lng),
+            )
+            .annotate(
+                distance_km=Min(
+                    haversine_km("addresses__latitude", "addresses__longitude", origin)
+                )
+            )
+            .filter(distance_km__lte=radius_km)
+            .order_by(*ordering)
+        )
+
+    @staticmethod
+    def filter_by_facets(
+        queryset: QuerySet[Professional], filters: dict[str, str]
+    ) -> QuerySet[Professional]:
+        """
+        Filtra por valores exatos de profession, city, state e kind.
+
+        Endereço e contatos são filtrados com EXISTS, sem JOIN, para que um
+        profissional com vários contatos do mesmo tipo não se repita.
+        """
+        if "profession" in filters:
+            queryset = queryset.filter(profession=filters["profession"])
+        address_filters = {
+            field: filters[field] for field in ("city", "state") if field in filters
+        }
+        if address_filters:
+            queryset = queryset.filter(
+                Exists(
+                    Address.objects.filter(
+                        professional=OuterRef("pk"), **address_filters
+                    )
+                )
+            )
+        if "kind" in filters:
+            queryset = queryset.filter(
+                Exists(
+                    Contact.objects.filter(
+                        professional=OuterRef("pk"), kind=filters["kind"]
+                    )
+                )
+            )
+        return queryset
+
+    @classmethod
+    def facets(cls) -> dict[str, list[dict[str, Any]]]:
+        """
+        Contagens por faceta, em cache até a próxima escrita de profissionais.
+
+        Sem `SHARED_CACHE`, conta a cada chamada (ver `ProfessionalCache.enabled`).
+        """
+        if not settings.SHARED_CACHE:
+            return cls._count_facets()
+        facets: dict[str, list[dict[str, Any]]] | None = cache.get(cls.facets_cache_key)
+        if facets is None:
+            facets = cls._count_facets()
+            cache.set(cls.facets_cache_key, facets, cls.facets_cache_timeout)
+        return facets
+
+    @classmethod
+    def invalidate_facets(cls) -> None:
+        """Descarta as contagens em cache após o commit da escrita."""
+        if not settings.SHARED_CACHE:
+            return
+        transaction.on_commit(lambda: cache.delete(cls.facets_cache_key))
+
+    @classmethod
+    def _count_facets(cls) -> dict[str, list[dict[str, Any]]]:
+        """
+        Conta profissionais por faceta em uma única consulta agregada.
+
+        GROUPING SETS agrupa por cada coluna separadamente na mesma varredura;
+        COUNT(DISTINCT) evita contar o profissional uma vez por contato.
+        """
+        sql = f"""
+            SELECT
+                CASE
+                    WHEN GROUPING(p.profession) = 0 THEN 0
+                    WHEN GROUPING(a.city) = 0 THEN 1
+                    WHEN GROUPING(a.state) = 0 THEN 2
+                    ELSE 3
+                END AS facet,
+                COALESCE(p.profession, a.city, a.state, c.kind) AS value,
+                COUNT(DISTINCT p.id) AS total
+            FROM {Professional._meta.db_table} AS p
+            LEFT JOIN {Address._meta.db_table} AS a ON a.professional_id = p.id
+            LEFT JOIN {Contact._meta.db_table} AS c ON c.professional_id = p.id
+            GROUP BY GROUPING SETS ((p.profession), (a.city), (a.state), (c.kind))
+        """
+        with connection.cursor() as cursor:
+            cursor.execute(sql)
+            rows = cursor.fetchall()
+
+        facets: dict[str, list[dict[str, Any]]] = {name: [] for name in cls.facet_names}
+        for facet, value, total in rows:
+            if value is not None:
+                facets[cls.facet_names[facet]].append({"value": value, "count": total})
+        for counts in facets.values():
+            counts.sort(key=lambda count: (-count["count"], count["value"]))
+        return facets
+
     @staticmethod
     def create(validated_data: dict[str, Any]) -> Professional:
         """Cria profissional com endereço e contatos."""
@@ -36,16 +262,161 @@ class ProfessionalService:
 
         address_data = validated_data.pop("address")
         contacts_data = validated_data.pop("contacts")
+        validated_data["search_document"] = ProfessionalService.build_search_document(
+            validated_data["social_name"], validated_data["profession"], address_data
+        )
 
-        professional = Professional.objects.create(**validated_data)
+        with transaction.atomic():
+            professional = Professional.objects.create(**validated_data)
 
-        Address.objects.create(professional=professional, **address_data)
+            Address.objects.create(professional=professional, **address_data)
 
-        for contact_data in contacts_data:
-            Contact.objects.create(professional=professional, **contact_data)
+            Contact.objects.bulk_create(
+                Contact(professional=professional, **contact_data)
+                for contact_data in contacts_data
+            )
+            ProfessionalService.invalidate_facets()
 
         return professional
 
+    @staticmethod
+    def bulk_create(items: list[dict[str, Any]]) -> list[Professional]:
+        """
+        Cria vários profissionais com três INSERTs em lote.
+
+        Profissionais, endereços e contatos são inseridos com um bulk_create
+        por tabela dentro de uma única transação.
+        """
+        for item in items:
+            ProfessionalService.validate(item)
+
+        professionals = [
+            Professional(
+                **{
+                    attr: value
+                    for attr, value in item.items()
+                    if attr not in ("address", "contacts")
+                },
+                search_document=ProfessionalService.build_search_document(
+                    item["social_name"], item["profession"], item["address"]
+                ),
+            )
+            for item in items
+        ]
+
+        with transaction.atomic():
+            Professional.objects.bulk_create(professionals)
+            addresses = [
+                Address(professional=professional, **item["address"])
+                for professional, item in zip(professionals, items)
+            ]
+            for address in addresses:
+                address.refresh_coordinates()
+            Address.objects.bulk_create(addresses)
+            Contact.objects.bulk_create(
+                Contact(professional=professional, **contact_data)
+                for professional, item in zip(professionals, items)
+                for contact_data in item["contacts"]
+            )
+            ProfessionalService.invalidate_facets()
+            # bulk_create não dispara post_save; invalida a listagem explicitamente
+            ProfessionalCache.invalidate()
+
+        return professionals
+
+    @staticmethod
+    def copy_create(items: list[dict[str, Any]]) -> int:
+        """
+        Cria profissionais em massa com COPY em tabelas temporárias.
+
+        Os itens, já validados e com `uuid`, são copiados para tabelas de
+        staging e gravados com um INSERT ... SELECT por tabela, em uma única
+        transação. UUIDs que já existem são ignorados (com seu endereço e
+        contatos), o que torna a carga repetível. Retorna quantos profissionais
+        foram criados.
+        """
+        unique: dict[UUID, dict[str, Any]] = {}
+        for item in items:
+            unique.setdefault(item["uuid"], item)
+
+        address_columns = ", ".join(IMPORT_ADDRESS_FIELDS)
+        with transaction.atomic(), connection.cursor() as cursor:
+            cursor.execute(
+                f"""
+                CREATE TEMP TABLE import_professional (
+                    uuid uuid, social_name text, profession text,
+                    search_document text,
+                    {", ".join(f"{field} text" for field in IMPORT_ADDRESS_FIELDS)},
+                    latitude double precision, longitude double precision
+                )
+                """
+            )
+            cursor.execute(
+                "CREATE TEMP TABLE import_contact (uuid uuid, kind text, value text)"
+            )
+            with cursor.copy("COPY import_professional FROM STDIN") as copy:
+                for item in unique.values():
+                    address = item["address"]
+                    copy.write_row(
+                        (
+                            item["uuid"],
+                            item["social_name"],
+                            item["profession"],
+                            ProfessionalService.build_search_document(
+                                item["social_name"], item["profession"], address
+                            ),
+                            *(address.get(field) for field in IMPORT_ADDRESS_FIELDS),
+                            *(coordinates_for_cep(address["zip_code"]) or (None, None)),
+                        )
+                    )
+            with cursor.copy("COPY import_contact FROM STDIN") as copy:
+                for item in unique.values():
+                    for contact in item["contacts"]:
+                        copy.write_row(
+                            (item["uuid"], contact["kind"], contact["value"])
+                        )
+
+            # Comandos de escrita no WITH rodam uma vez, mesmo sem serem lidos
+            cursor.execute(
+                f"""
+                WITH professionals AS (
+                    INSERT INTO {Professional._meta.db_table} (
+                        uuid, social_name, profession, search_document,
+                        created_at, updated_at
+                    )
+                    SELECT uuid, social_name, profession, search_document,
+                        %(now)s, %(now)s
+                    FROM import_professional
+                    ON CONFLICT (uuid) DO NOTHING
+                    RETURNING id, uuid
+                ), addresses AS (
+                    INSERT INTO {Address._meta.db_table} (
+                        professional_id, {address_columns}, latitude, longitude,
+                        created_at, updated_at
+                    )
+                    SELECT p.id, {address_columns}, latitude, longitude,
+                        %(now)s, %(now)s
+                    FROM import_professional JOIN professionals AS p USING (uuid)
+                ), contacts AS (
+                    INSERT INTO {Contact._meta.db_table} (
+                        professional_id, kind, value, created_at, updated_at
+                    )
+                    SELECT p.id, kind, value, %(now)s, %(now)s
+                    FROM import_contact JOIN professionals AS p USING (uuid)
+                )
+                SELECT COUNT(*) FROM professionals
+                """,
+                {"now": timezone.now()},
+            )
+            (created,) = cursor.fetchone()
+            # Remove as tabelas para que outra carga na mesma sessão as recrie
+            cursor.execute("DROP TABLE import_professional, import_contact")
+            # Sem post_save: descarta as contagens e a listagem explicitamente
+            ProfessionalService.invalidate_facets()
+            ProfessionalCache.invalidate()
+
+        return int(created)
+
     @staticmethod
     def update(instance: Professional, validated_data: dict[str, Any]) -> Professional:
         """Atualiza profissional com endereço e contatos."""
@@ -54,18 +425,94 @@ class ProfessionalService:
         address_data = validated_data.pop("address")
         contacts_data = validated_data.pop("contacts")
 
-        # Atualiza campos do profissional
-        for attr, value in validated_data.items():
-            setattr(instance, attr, value)
-        instance.save()
+        with transaction.atomic():
+            # Sempre salvo: o updated_at (e o ETag) cobre também endereço e contatos
+            for attr, value in validated_data.items():
+                setattr(instance, attr, value)
+            instance.search_document = ProfessionalService.build_search_document(
+                instance.social_name, instance.profession, address_data
+            )
+            instance.save()
 
-        # Atualiza endereço
-        instance.addresses.all().delete()
-        Address.objects.create(professional=instance, **address_data)
+            ProfessionalService._upsert_address(instance, address_data)
+            ProfessionalService._upsert_contacts(instance, contacts_data)
+            ProfessionalService.invalidate_facets()
 
-        # Atualiza contatos
-        instance.contacts.all().delete()
+        return instance
+
+    @staticmethod
+    def delete(instance: Professional) -> None:
+        """Exclui o profissional (endereço e contatos em cascata)."""
+        with transaction.atomic():
+            instance.delete()
+            ProfessionalService.invalidate_facets()
+
+    @staticmethod
+    def _upsert_address(instance: Professional, address_data: dict[str, Any]) -> None:
+        """Atualiza o endereço apenas se algum campo mudou."""
+        addresses = list(instance.addresses.all())
+        if not addresses:
+            Address.objects.create(professional=instance, **address_data)
+            return
+
+        address, extras = addresses[0], addresses[1:]
+        if extras:
+            Address.objects.filter(pk__in=[extra.pk for extra in extras]).delete()
+
+        changed = [
+            field
+            for field, value in address_data.items()
+            if getattr(address, field) != value
+        ]
+        if changed:
+            for field in changed:
+                setattr(address, field, address_data[field])
+            address.save(update_fields=[*changed, "updated_at"])
+
+    @staticmethod
+    def _upsert_contacts(
+        instance: Professional, contacts_data: list[dict[str, Any]]
+    ) -> None:
+        """
+        Sincroniza contatos por diferença.
+
+        Contatos idênticos são mantidos, contatos remanescentes são
+        reaproveitados para os novos valores e apenas o excedente é
+        inserido ou removido.
+        """
+        existing = list(instance.contacts.all())
+        pending: list[dict[str, Any]] = []
         for contact_data in contacts_data:
-            Contact.objects.create(professional=instance, **contact_data)
+            match = next(
+                (
+                    contact
+                    for contact in existing
+                    if contact.kind == contact_data["kind"]
+                    and contact.value == contact_data["value"]
+                ),
+                None,
+            )
+            if match is None:
+                pending.append(contact_data)
+            else:
+                existing.remove(match)
 
-        return instance
+        reused = existing[: len(pending)]
+        if reused:
+            now = timezone.now()
+            for contact, contact_data in zip(reused, pending):
+                contact.kind = contact_data["kind"]
+                contact.value = contact_data["value"]
+                contact.updated_at = now
+            Contact.objects.bulk_update(reused, ["kind", "value", "updated_at"])
+
+        stale = existing[len(pending) :]
+        if stale:
+            Contact.objects.filter(pk__in=[contact.pk for contact in stale]).delete()
+
+        created = pending[len(reused) :]
+        if created:
+            Contact.objects.bulk_create(
+                Contact(professional=instance, **contact_data)
+                for contact_data in created
+            )
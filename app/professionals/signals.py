@@ -0,0 +1,19 @@
+from typing import Any
+
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from .cache import ProfessionalCache
+from .models import Professional
+
+
+@receiver([post_save, post_delete], sender=Professional)
+def invalidate_professional(sender: Any, instance: Professional, **kwargs: Any) -> None:
+    """
+    Descarta as respostas em cache do profissional alterado.
+
+    Endereço e contatos são gravados pelo ProfessionalService, que sempre
+    salva o profissional junto; sem receptores neles, a exclusão de um
+    profissional os apaga em cascata com um DELETE por tabela.
+    """
+    ProfessionalCache.invalidate(instance.uuid)
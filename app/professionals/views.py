@@ -1,18 +1,117 @@
-from drf_spectacular.utils import extend_schema, extend_schema_view
-from rest_framework import serializers, viewsets
+import builtins
+from datetime import timedelta
+from typing import Any
+from uuid import UUID
 
+from django.db import DatabaseError, transaction
+from django.db.models import QuerySet
+from django.http import StreamingHttpResponse
+from drf_spectacular.types import OpenApiTypes
+from drf_spectacular.utils import OpenApiParameter, extend_schema, extend_schema_view
+from rest_framework import viewsets
+from rest_framework.decorators import action
+from rest_framework.exceptions import NotFound
+from rest_framework.request import Request
+from rest_framework.response import Response
+from rest_framework.settings import api_settings
+
+from app.appointments.serializers import (
+    AvailabilityQuerySerializer,
+    AvailabilitySerializer,
+)
+from app.appointments.services import AppointmentService
+from app.core.batch import (
+    BatchResult,
+    batch_response,
+    created_result,
+    error_result,
+    validate_items,
+)
+from app.core.conditional import (
+    Validators,
+    conditional_response,
+    conditional_write,
+    row_validators,
+)
+from app.core.parsers import NDJSONParser
+from app.core.serializers import BatchResponseSerializer
+from app.core.viewsets import ReplicaReadMixin, RowReadMixin
+
+from .cache import Build, ProfessionalCache
 from .models import Professional
-from .serializers import ProfessionalDetailSerializer, ProfessionalSerializer
+from .serializers import (
+    CacheStatsSerializer,
+    FacetsSerializer,
+    NearQuerySerializer,
+    ProfessionalDetailRowSerializer,
+    ProfessionalDetailSerializer,
+    ProfessionalRowSerializer,
+    ProfessionalSerializer,
+)
+from .services import ProfessionalService
+
+# Filtros e buscas da listagem, também aceitos pela exportação
+FILTER_PARAMETERS = [
+    *(
+        OpenApiParameter(
+            name=name,
+            type=str,
+            location=OpenApiParameter.QUERY,
+            description=description,
+            required=False,
+        )
+        for name, description in [
+            ("profession", "Filtrar pela profissão (valor exato)"),
+            ("city", "Filtrar pela cidade do endereço (valor exato)"),
+            ("state", "Filtrar pelo estado do endereço (valor exato)"),
+            ("kind", "Filtrar pelo tipo de contato (ex: whatsapp)"),
+        ]
+    ),
+    OpenApiParameter(
+        name="near",
+        type=str,
+        location=OpenApiParameter.QUERY,
+        description='Coordenadas de origem no formato "latitude,longitude" '
+        '(ex: "-8.05,-34.88")',
+        required=False,
+    ),
+    OpenApiParameter(
+        name="radius_km",
+        type=float,
+        location=OpenApiParameter.QUERY,
+        description="Raio da busca por proximidade em km (padrão: 10, máximo: 500)",
+        required=False,
+    ),
+    OpenApiParameter(
+        name="search",
+        type=str,
+        location=OpenApiParameter.QUERY,
+        description="Busca textual sem acentos e tolerante a erros de "
+        'digitação (ex: "psicóloga em Recife")',
+        required=False,
+    ),
+]
 
 
 @extend_schema_view(
     list=extend_schema(
         summary="Listar profissionais",
-        description="Retorna uma lista paginada de todos os profissionais de saúde.",
+        description="Retorna uma lista paginada de todos os profissionais de saúde. "
+        "As páginas ficam em cache por query string (cabeçalho X-Cache). "
+        "Com search, retorna apenas os que correspondem ao termo em nome social, "
+        "profissão, bairro ou cidade, ordenados por relevância. Pode ser filtrada "
+        "por profession, city, state e kind (tipo de contato). Com near, retorna "
+        "apenas os que estão a até radius_km das coordenadas, do mais próximo ao "
+        "mais distante (a localização do profissional é aproximada pelo CEP). "
+        "Retorna ETag e Last-Modified; com If-None-Match atual, responde 304.",
+        parameters=FILTER_PARAMETERS,
     ),
     retrieve=extend_schema(
         summary="Obter detalhes do profissional",
-        description="Retorna os detalhes de um profissional de saúde específico.",
+        description="Retorna os detalhes de um profissional de saúde específico. "
+        "A resposta fica em cache até o profissional, seu endereço ou seus "
+        "contatos mudarem (cabeçalho X-Cache). Retorna ETag e Last-Modified; com "
+        "If-None-Match atual, responde 304.",
     ),
     create=extend_schema(
         summary="Criar profissional",
@@ -20,31 +119,340 @@ from .serializers import ProfessionalDetailSerializer, ProfessionalSerializer
     ),
     update=extend_schema(
         summary="Atualizar profissional",
-        description="Atualiza todos os campos de um profissional de saúde.",
+        description="Atualiza todos os campos de um profissional de saúde. "
+        "Retorna 412 se o ETag enviado em If-Match não é o atual.",
     ),
     partial_update=extend_schema(
         summary="Atualizar parcialmente profissional",
-        description="Atualiza campos específicos de um profissional de saúde.",
+        description="Atualiza campos específicos de um profissional de saúde. "
+        "Retorna 412 se o ETag enviado em If-Match não é o atual.",
     ),
     destroy=extend_schema(
         summary="Excluir profissional",
-        description="Exclui um profissional de saúde.",
+        description="Exclui um profissional de saúde. "
+        "Retorna 412 se o ETag enviado em If-Match não é o atual.",
+    ),
+    batch=extend_schema(
+        summary="Criar profissionais em lote",
+        description="Cria vários profissionais a partir de uma lista JSON ou de um "
+        "corpo NDJSON (application/x-ndjson). Cada item é validado individualmente "
+        "e os válidos são gravados em lotes; itens inválidos não interrompem os "
+        "demais. Retorna 201 quando todos são criados e 207 quando algum falha.",
+        request=ProfessionalSerializer(many=True),
+        responses={
+            201: BatchResponseSerializer,
+            207: BatchResponseSerializer,
+        },
+    ),
+    facets=extend_schema(
+        summary="Contagens por faceta",
+        description="Retorna quantos profissionais existem por profissão, cidade, "
+        "estado e tipo de contato, calculados em uma única consulta agregada. As "
+        "contagens ficam em cache e são descartadas quando profissionais são "
+        "criados, atualizados ou excluídos. Os valores podem ser usados nos "
+        "filtros de mesmo nome da listagem.",
+        responses=FacetsSerializer,
+    ),
+    cache_stats=extend_schema(
+        summary="Estatísticas do cache de leitura",
+        description="Retorna os contadores de acertos (hits) e falhas (misses) do "
+        "cache de respostas do detalhe e da listagem de profissionais.",
+        responses=CacheStatsSerializer,
+    ),
+    availability=extend_schema(
+        summary="Horários livres do profissional",
+        description="Calcula no servidor os horários livres do profissional entre "
+        "start e end, com duração slot_minutes, descontando as consultas já "
+        "agendadas (cada uma ocupa de date até date + duration_minutes). A janela "
+        "é limitada a 31 dias.",
+        parameters=[
+            OpenApiParameter(
+                name="start",
+                type=OpenApiTypes.DATETIME,
+                location=OpenApiParameter.QUERY,
+                description="Início da janela (inclusive). Aceita também apenas "
+                "a data (AAAA-MM-DD), considerada desde o início do dia",
+                required=True,
+            ),
+            OpenApiParameter(
+                name="end",
+                type=OpenApiTypes.DATETIME,
+                location=OpenApiParameter.QUERY,
+                description="Fim da janela (exclusivo). Aceita também apenas a "
+                "data (AAAA-MM-DD), considerada desde o início do dia",
+                required=True,
+            ),
+            OpenApiParameter(
+                name="slot_minutes",
+                type=int,
+                location=OpenApiParameter.QUERY,
+                description="Duração de cada horário em minutos (padrão: 30)",
+                required=False,
+            ),
+        ],
+        responses=AvailabilitySerializer,
+    ),
+    export=extend_schema(
+        summary="Exportar profissionais",
+        description="Transmite todos os profissionais que atendem aos filtros da "
+        "listagem, sem paginação, em NDJSON (um profissional por linha, no formato "
+        "da listagem) ou CSV (endereço em colunas address.* e contatos em JSON). "
+        "As linhas são lidas do banco em lotes, com memória constante.",
+        parameters=[
+            *FILTER_PARAMETERS,
+            OpenApiParameter(
+                name="output",
+                type=str,
+                enum=["ndjson", "csv"],
+                location=OpenApiParameter.QUERY,
+                description="Formato da exportação (padrão: ndjson)",
+                required=False,
+            ),
+        ],
+        responses={
+            (200, "application/x-ndjson"): ProfessionalSerializer,
+            (200, "text/csv"): OpenApiTypes.STR,
+        },
     ),
 )
-class ProfessionalViewSet(viewsets.ModelViewSet[Professional]):
+class ProfessionalViewSet(
+    ReplicaReadMixin, RowReadMixin, viewsets.ModelViewSet[Professional]
+):
     """
     ViewSet para operações CRUD de Profissionais de Saúde.
 
     Fornece ações de listar, criar, detalhar, atualizar e excluir.
-    Endereço e contatos são gerenciados como objetos aninhados.
+    Endereço e contatos são gerenciados como objetos aninhados. A listagem
+    aceita filtros por faceta (`profession`, `city`, `state`, `kind`), busca
+    por relevância (`search`) e por proximidade (`near`, `radius_km`) via
+    query parameters; `export` transmite a listagem filtrada em NDJSON ou CSV.
+    As leituras podem ir à réplica.
     """
 
     queryset = Professional.objects.all()
     serializer_class = ProfessionalSerializer
+    row_serializer_classes = {
+        "list": ProfessionalRowSerializer,
+        "retrieve": ProfessionalDetailRowSerializer,
+    }
     lookup_field = "uuid"
+    batch_chunk_size = 500
+    # Endereço e contatos renovam o updated_at do profissional (ver o service)
+    validator_fields = ["updated_at"]
+    # Após uma invalidação, o cache é remontado a partir do primário
+    primary_pins = (ProfessionalCache.primary_pin,)
+    # Único float das respostas, verificado pelo ORJSONRenderer
+    float_fields = ("distance_km",)
 
-    def get_serializer_class(self) -> type[serializers.ModelSerializer[Professional]]:
+    def get_serializer_class(self) -> type[ProfessionalSerializer]:
         """Usa serializador detalhado para retrieve."""
         if self.action == "retrieve":
             return ProfessionalDetailSerializer
         return ProfessionalSerializer
+
+    def get_queryset(self) -> QuerySet[Professional]:
+        """Pré-carrega as relações aninhadas e, na listagem, aplica a busca."""
+        queryset = super().get_queryset()
+        if self.action == "destroy":
+            return queryset
+        if self.action in ["retrieve", "list", "export"]:
+            queryset = queryset.defer(*Professional.search_columns)
+        if self.action in ["list", "export"]:
+            filters = {
+                name: value
+                for name in ProfessionalService.facet_names
+                if (value := self.request.query_params.get(name))
+            }
+            queryset = ProfessionalService.filter_by_facets(queryset, filters)
+            search = self.request.query_params.get("search", "").strip()
+            if search:
+                queryset = ProfessionalService.search(queryset, search)
+            # Depois da busca: com near, a distância ordena e a relevância desempata
+            queryset = self.filter_by_location(queryset)
+        serializer_class = self.get_serializer_class()
+        return queryset.prefetch_related(*serializer_class.get_prefetches())
+
+    def list(self, request: Request, *args: Any, **kwargs: Any) -> Response:
+        """Serve a página do cache, se ligado, quando a query string já foi montada."""
+
+        def read() -> tuple[Validators, Build]:
+            return self.list_page(request, self.validator_fields)
+
+        if not ProfessionalCache.enabled():
+            return conditional_response(request, *read())
+        return ProfessionalCache.cached_response(
+            request,
+            "list",
+            ProfessionalCache.list_key(request),
+            ProfessionalCache.list_timeout,
+            read,
+        )
+
+    def retrieve(self, request: Request, *args: Any, **kwargs: Any) -> Response:
+        """Serve o detalhe do cache por UUID, se ligado; 404 para UUID inválido."""
+        try:
+            professional_uuid = UUID(str(kwargs[self.lookup_field]))
+        except ValueError:
+            raise NotFound()
+
+        def read() -> tuple[Validators | None, Build]:
+            validators = row_validators(
+                request,
+                self.get_queryset(),
+                {self.lookup_field: professional_uuid},
+                self.validator_fields,
+            )
+            return validators, lambda: self.retrieve_rows(request)
+
+        if not ProfessionalCache.enabled():
+            return conditional_response(request, *read())
+        return ProfessionalCache.cached_response(
+            request,
+            "detail",
+            ProfessionalCache.detail_key(professional_uuid),
+            ProfessionalCache.detail_timeout,
+            read,
+        )
+
+    def update(self, request: Request, *args: Any, **kwargs: Any) -> Response:
+        """Aplica If-Match e If-Unmodified-Since com a linha travada."""
+        return conditional_write(
+            request,
+            lambda: self.object_validators(lock=True),
+            lambda: super(ProfessionalViewSet, self).update(request, *args, **kwargs),
+        )
+
+    def destroy(self, request: Request, *args: Any, **kwargs: Any) -> Response:
+        """Aplica If-Match e If-Unmodified-Since com a linha travada."""
+        return conditional_write(
+            request,
+            lambda: self.object_validators(lock=True),
+            lambda: super(ProfessionalViewSet, self).destroy(request, *args, **kwargs),
+        )
+
+    def object_validators(self, lock: bool = False) -> Validators | None:
+        """ETag e Last-Modified do profissional da URL, sem serializá-lo."""
+        return row_validators(
+            self.request,
+            self.get_queryset(),
+            {self.lookup_field: self.kwargs[self.lookup_field]},
+            self.validator_fields,
+            lock=lock,
+        )
+
+    def perform_destroy(self, instance: Professional) -> None:
+        ProfessionalService.delete(instance)
+
+    def filter_by_location(
+        self, queryset: QuerySet[Professional]
+    ) -> QuerySet[Professional]:
+        """Aplica near e radius_km quando near é informado."""
+        if "near" not in self.request.query_params:
+            return queryset
+        params = NearQuerySerializer(data=self.request.query_params)
+        params.is_valid(raise_exception=True)
+        return ProfessionalService.near(
+            queryset,
+            params.validated_data["near"],
+            params.validated_data["radius_km"],
+        )
+
+    @action(
+        detail=False,
+        methods=["post"],
+        parser_classes=[*api_settings.DEFAULT_PARSER_CLASSES, NDJSONParser],
+    )
+    def batch(self, request: Request) -> Response:
+        """Valida item a item e grava os válidos em lotes de `batch_chunk_size`."""
+        results: list[BatchResult] = []
+        chunk: list[tuple[int, dict[str, Any]]] = []
+        for index, validated_data, error in validate_items(
+            request.data, self.get_serializer()
+        ):
+            if error is not None:
+                results.append(error)
+            elif validated_data is not None:
+                chunk.append((index, validated_data))
+
+            if len(chunk) >= self.batch_chunk_size:
+                results.extend(self._create_chunk(chunk))
+                chunk = []
+
+        if chunk:
+            results.extend(self._create_chunk(chunk))
+
+        return batch_response(results)
+
+    def _create_chunk(
+        self, chunk: builtins.list[tuple[int, dict[str, Any]]]
+    ) -> builtins.list[BatchResult]:
+        """Grava um lote; se o lote falhar no banco, isola os itens um a um."""
+        try:
+            with transaction.atomic():
+                professionals = ProfessionalService.bulk_create(
+                    [data for _, data in chunk]
+                )
+        except DatabaseError:
+            return [self._create_one(index, data) for index, data in chunk]
+
+        return [
+            created_result(index, professional.uuid)
+            for (index, _), professional in zip(chunk, professionals)
+        ]
+
+    def _create_one(self, index: int, data: dict[str, Any]) -> BatchResult:
+        """Grava um único item em seu próprio savepoint."""
+        try:
+            with transaction.atomic():
+                professional = ProfessionalService.create(dict(data))
+        except DatabaseError:
+            return error_result(
+                index, {"non_field_errors": ["Falha ao gravar o profissional."]}
+            )
+        return created_result(index, professional.uuid)
+
+    @action(detail=False, methods=["get"])
+    def export(self, request: Request) -> StreamingHttpResponse:
+        """Transmite a listagem filtrada inteira, sem paginação nem cache."""
+        return self.export_rows(request, "professionals")
+
+    @action(detail=False, methods=["get"])
+    def facets(self, request: Request) -> Response:
+        """Devolve as contagens por faceta do service (em cache)."""
+        return Response(FacetsSerializer(ProfessionalService.facets()).data)
+
+    @action(detail=False, methods=["get"], url_path="cache-stats")
+    def cache_stats(self, request: Request) -> Response:
+        """Devolve os contadores de acertos e falhas do cache de leitura."""
+        return Response(ProfessionalCache.stats())
+
+    @action(detail=True, methods=["get"])
+    def availability(self, request: Request, uuid: str | None = None) -> Response:
+        """Mescla as consultas da janela e devolve as lacunas como horários."""
+        professional_id = ProfessionalService.resolve_id(uuid or "")
+        if professional_id is None:
+            raise NotFound()
+
+        query = AvailabilityQuerySerializer(data=request.query_params)
+        query.is_valid(raise_exception=True)
+        start = query.validated_data["start"]
+        end = query.validated_data["end"]
+        slot_minutes = query.validated_data["slot_minutes"]
+
+        busy = AppointmentService.busy_intervals(professional_id, start, end)
+        slots = AppointmentService.free_slots(
+            busy, start, end, timedelta(minutes=slot_minutes)
+        )
+        return Response(
+            AvailabilitySerializer(
+                {
+                    "start": start,
+                    "end": end,
+                    "slot_minutes": slot_minutes,
+                    "slots": [
+                        {"start": slot_start, "end": slot_end}
+                        for slot_start, slot_end in slots
+                    ],
+                }
+            ).data
+        )
@@ -2,6 +2,7 @@
 Django settings for Lacrei Saúde API.
 """
 
+from copy import deepcopy
 from pathlib import Path
 
 from decouple import Csv, config
@@ -27,6 +28,7 @@ INSTALLED_APPS = [
     "django.contrib.sessions",
     "django.contrib.messages",
     "django.contrib.staticfiles",
+    "django.contrib.postgres",
     # Third party apps
     "rest_framework",
     "oauth2_provider",
@@ -70,6 +72,12 @@ TEMPLATES = [
 WSGI_APPLICATION = "app.wsgi.application"
 
 # Database
+# Por padrão, cada worker mantém sua conexão aberta por DB_CONN_MAX_AGE segundos
+# e a verifica antes de reutilizá-la, evitando o handshake TCP + autenticação a
+# cada requisição. Com DB_POOL=true (indicado para ASGI, em que as requisições
+# rodam em threads diferentes e a conexão persistente não é reaproveitada),
+# usa o pool do psycopg 3; o pool não admite conexões persistentes.
+DB_POOL = config("DB_POOL", default=False, cast=bool)
 DATABASES = {
     "default": {
         "ENGINE": "django.db.backends.postgresql",
@@ -78,9 +86,61 @@ DATABASES = {
         "PASSWORD": config("DB_PASSWORD", default="lacrei_password"),
         "HOST": config("DB_HOST", default="localhost"),
         "PORT": config("DB_PORT", default="5432"),
+        "CONN_MAX_AGE": (
+            0 if DB_POOL else config("DB_CONN_MAX_AGE", default=60, cast=int)
+        ),
+        "CONN_HEALTH_CHECKS": not DB_POOL,
+        "OPTIONS": (
+            {
+                "pool": {
+                    "min_size": config("DB_POOL_MIN_SIZE", default=2, cast=int),
+                    "max_size": config("DB_POOL_MAX_SIZE", default=10, cast=int),
+                    "timeout": config("DB_POOL_TIMEOUT", default=10, cast=float),
+                }
+            }
+            if DB_POOL
+            else {}
+        ),
     }
 }
 
+# Réplica de leitura opcional, com o mesmo banco e credenciais do primário.
+# Com DB_REPLICA_HOST, as leituras (GET, HEAD, OPTIONS) dos viewsets vão para
+# a réplica, exceto por DB_REPLICA_PIN_SECONDS após uma escrita do mesmo
+# cliente; sem ela, tudo continua no primário (ver app/core/routers.py).
+DB_REPLICA_HOST = config("DB_REPLICA_HOST", default="")
+if DB_REPLICA_HOST:
+    DATABASES["replica"] = {
+        **deepcopy(DATABASES["default"]),
+        "HOST": DB_REPLICA_HOST,
+        "PORT": config("DB_REPLICA_PORT", default=DATABASES["default"]["PORT"]),
+        "TEST": {"MIRROR": "default"},
+    }
+DATABASE_ROUTERS = ["app.core.routers.PrimaryReplicaRouter"]
+DB_REPLICA_PIN_SECONDS = config("DB_REPLICA_PIN_SECONDS", default=5, cast=int)
+
+# Cache
+# O LocMemCache padrão (usado nos testes) é local a cada worker; com vários
+# workers do gunicorn, use o Redis para que a invalidação e o rate limiting
+# alcancem todos eles (CACHE_BACKEND=django.core.cache.backends.redis.RedisCache,
+# CACHE_LOCATION=redis://host:6379/0).
+CACHE_BACKEND = config(
+    "CACHE_BACKEND", default="django.core.cache.backends.locmem.LocMemCache"
+)
+CACHES = {
+    "default": {
+        "BACKEND": CACHE_BACKEND,
+        "LOCATION": config("CACHE_LOCATION", default="lacrei"),
+    }
+}
+# Os caches que dependem de invalidação (tokens, respostas e facetas) só são
+# ligados com um backend compartilhado: num cache local, a invalidação de um
+# worker não alcança os demais
+SHARED_CACHE = CACHE_BACKEND not in {
+    "django.core.cache.backends.locmem.LocMemCache",
+    "django.core.cache.backends.dummy.DummyCache",
+}
+
 # Password validation
 AUTH_PASSWORD_VALIDATORS = [
     {
@@ -116,22 +176,29 @@ REST_FRAMEWORK = {
     "DEFAULT_PAGINATION_CLASS": "rest_framework.pagination.PageNumberPagination",
     "PAGE_SIZE": 20,
     "DEFAULT_RENDERER_CLASSES": [
-        "rest_framework.renderers.JSONRenderer",
+        "app.core.renderers.ORJSONRenderer",
     ],
     "DEFAULT_PARSER_CLASSES": [
-        "rest_framework.parsers.JSONParser",
+        "app.core.parsers.ORJSONParser",
     ],
     "DEFAULT_AUTHENTICATION_CLASSES": [
-        "oauth2_provider.contrib.rest_framework.OAuth2Authentication",
+        (
+            "app.core.authentication.CachedOAuth2Authentication"
+            if SHARED_CACHE
+            else "oauth2_provider.contrib.rest_framework.OAuth2Authentication"
+        ),
     ],
     "DEFAULT_PERMISSION_CLASSES": [
         "oauth2_provider.contrib.rest_framework.TokenHasReadWriteScope",
     ],
+    # Contadores no cache padrão: use o Redis para que o limite valha para
+    # todos os workers e slots
     "DEFAULT_THROTTLE_CLASSES": [
-        "rest_framework.throttling.UserRateThrottle",
+        "app.core.throttling.UserReadWriteThrottle",
     ],
     "DEFAULT_THROTTLE_RATES": {
-        "user": "300/second",  # Authenticated users: 300 requests per second
+        "read": config("THROTTLE_READ_RATE", default="300/second"),
+        "write": config("THROTTLE_WRITE_RATE", default="60/second"),
     },
 }
 
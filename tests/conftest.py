@@ -26,3 +26,11 @@ def override_rest_framework_permissions(settings):
             "rest_framework.permissions.AllowAny",
         ],
     }
+
+
+@pytest.fixture(autouse=True)
+def clear_cache():
+    """Limpa o cache entre os testes (respostas, contadores e UUIDs)."""
+    from django.core.cache import cache
+
+    cache.clear()
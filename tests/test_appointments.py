@@ -1,6 +1,13 @@
 from datetime import datetime, timedelta, timezone
+from io import StringIO
+from urllib.parse import urlencode
 
 from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.core.management import call_command
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.utils.timezone import localtime
 from rest_framework import status
 from rest_framework.test import APITestCase
 
@@ -370,3 +377,772 @@ class TestAppointmentErrors(AppointmentAPITestCase):
         """Testa que buscar com formato de UUID inválido retorna 404."""
         response = self.client.get("/api/v1/appointments/invalid-uuid/")
         self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+
+class TestAppointmentQueryCount(AppointmentAPITestCase):
+    """Testes de regressão para o número de consultas ao banco por requisição."""
+
+    def create_appointments(self, total, professionals):
+        """
+        Cria consultas em horários distintos, alternando os profissionais.
+
+        Os horários começam uma hora após o padrão de `create_appointment`,
+        para não sobrepor a consulta criada por ele.
+        """
+        for index in range(total):
+            self.create_appointment(
+                professional=professionals[index % len(professionals)],
+                date=self.tomorrow_datetime + timedelta(hours=index + 1),
+            )
+
+    def test_list_appointments_runs_constant_queries(self):
+        """Testa que a listagem executa o mesmo número de consultas para 1 ou 20 itens."""
+        self.create_appointment()
+        with self.assertNumQueries(4):
+            self.client.get("/api/v1/appointments/")
+
+        professionals = [self.professional] + [
+            self.create_professional() for _ in range(2)
+        ]
+        self.create_appointments(24, professionals)
+        with self.assertNumQueries(4):
+            response = self.client.get("/api/v1/appointments/")
+
+        self.assertEqual(len(response.json()["results"]), 20)
+
+    def test_list_appointments_shares_repeated_professionals(self):
+        """Testa que profissionais repetidos na página têm a mesma representação."""
+        self.create_appointments(3, [self.professional])
+        response = self.client.get("/api/v1/appointments/")
+
+        professionals = [r["professional"] for r in response.json()["results"]]
+        self.assertEqual(len(professionals), 3)
+        self.assertTrue(all(p == professionals[0] for p in professionals))
+        self.assertEqual(professionals[0]["address"]["street"], "Av. Paulista")
+        self.assertEqual(len(professionals[0]["contacts"]), 1)
+
+    def test_retrieve_appointment_runs_constant_queries(self):
+        """Testa que o detalhe executa um número fixo de consultas."""
+        appointment = self.create_appointment()
+        with self.assertNumQueries(4):
+            self.client.get(f"/api/v1/appointments/{appointment.uuid}/")
+
+
+class TestAppointmentProfessionalFilter(AppointmentAPITestCase):
+    """Testes para o filtro por profissional e o plano das consultas de listagem."""
+
+    def setUp(self):
+        """Cria consultas para dois profissionais e limpa o cache de UUIDs."""
+        super().setUp()
+        cache.clear()
+        self.other = self.create_professional()
+        for hours in range(3):
+            self.create_appointment(
+                date=self.tomorrow_datetime + timedelta(hours=hours)
+            )
+        self.create_appointment(
+            professional=self.other,
+            date=self.tomorrow_datetime + timedelta(days=1),
+        )
+
+    def test_filter_resolves_professional_uuid_once(self):
+        """Testa que o UUID é resolvido uma vez e depois servido pelo cache."""
+        url = f"/api/v1/appointments/?professional_uuid={self.professional.uuid}"
+        with self.assertNumQueries(5):
+            response = self.client.get(url)
+        self.assertEqual(response.json()["count"], 3)
+
+        with self.assertNumQueries(4):
+            response = self.client.get(url)
+        self.assertEqual(response.json()["count"], 3)
+
+    def test_filter_queries_appointments_without_join(self):
+        """Testa que a listagem filtra por professional_id, sem JOIN no filtro."""
+        url = f"/api/v1/appointments/?professional_uuid={self.professional.uuid}"
+        with CaptureQueriesContext(connection) as context:
+            self.client.get(url)
+
+        count_sql = next(q["sql"] for q in context if "COUNT(*)" in q["sql"])
+        self.assertIn('"professional_id" =', count_sql)
+        self.assertNotIn("JOIN", count_sql)
+
+    def test_filter_with_unknown_professional_returns_empty_list(self):
+        """Testa que UUID inexistente retorna lista vazia."""
+        url = "/api/v1/appointments/?professional_uuid=00000000-0000-0000-0000-000000000000"
+        response = self.client.get(url)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.json()["count"], 0)
+
+    def test_filter_with_invalid_uuid_returns_empty_list(self):
+        """Testa que UUID malformado retorna lista vazia em vez de erro."""
+        response = self.client.get("/api/v1/appointments/?professional_uuid=abc")
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.json()["count"], 0)
+
+    def test_check_query_plans_passes_with_indexes(self):
+        """Testa que as consultas de listagem usam índices."""
+        out = StringIO()
+        call_command("check_query_plans", stdout=out)
+
+        self.assertEqual(out.getvalue().count("OK"), 12)
+        self.assertNotIn("SEQ SCAN", out.getvalue())
+
+    def test_find_seq_scans_reports_sequential_scans(self):
+        """Testa a detecção de varreduras sequenciais no plano."""
+        from app.core.management.commands.check_query_plans import find_seq_scans
+
+        plan = (
+            "Limit  (cost=0.15..8.17 rows=1 width=8)\n"
+            "  ->  Seq Scan on appointments_appointment  (cost=0.00..1.04 rows=4)"
+        )
+        self.assertEqual(
+            find_seq_scans(plan),
+            ["->  Seq Scan on appointments_appointment  (cost=0.00..1.04 rows=4)"],
+        )
+        self.assertEqual(
+            find_seq_scans("Index Scan using appointment_prof_date_idx"), []
+        )
+
+
+class TestAppointmentPeriodFilter(AppointmentAPITestCase):
+    """Testes para os filtros date_from, date_to e upcoming."""
+
+    def setUp(self):
+        """Cria consultas passadas e futuras em dias distintos."""
+        super().setUp()
+        self.past = self.create_appointment(
+            date=self.tomorrow_datetime - timedelta(days=3)
+        )
+        self.tomorrow = self.create_appointment()
+        self.next_week = self.create_appointment(
+            date=self.tomorrow_datetime + timedelta(days=7)
+        )
+
+    def list_uuids(self, query):
+        """Retorna os UUIDs listados para a query string informada."""
+        response = self.client.get(f"/api/v1/appointments/?{query}")
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        return {r["uuid"] for r in response.json()["results"]}
+
+    def test_filter_by_date_range(self):
+        """Testa que date_from e date_to delimitam o período (inclusive)."""
+        start = (self.tomorrow_datetime - timedelta(days=3)).isoformat()
+        end = self.tomorrow_datetime.isoformat()
+        uuids = self.list_uuids(urlencode({"date_from": start, "date_to": end}))
+
+        self.assertEqual(uuids, {str(self.past.uuid), str(self.tomorrow.uuid)})
+
+    def test_filter_by_date_only_covers_whole_day(self):
+        """Testa que datas sem horário abrangem o dia inteiro."""
+        day = localtime(self.tomorrow_datetime).date().isoformat()
+        uuids = self.list_uuids(urlencode({"date_from": day, "date_to": day}))
+
+        self.assertEqual(uuids, {str(self.tomorrow.uuid)})
+
+    def test_filter_upcoming(self):
+        """Testa que upcoming=true exclui consultas passadas."""
+        uuids = self.list_uuids("upcoming=true")
+
+        self.assertEqual(uuids, {str(self.tomorrow.uuid), str(self.next_week.uuid)})
+
+    def test_filter_combines_with_professional(self):
+        """Testa que o período é combinado com o filtro por profissional."""
+        other = self.create_professional()
+        self.create_appointment(professional=other, date=self.tomorrow_datetime)
+        uuids = self.list_uuids(
+            urlencode({"professional_uuid": self.professional.uuid, "upcoming": "true"})
+        )
+
+        self.assertEqual(uuids, {str(self.tomorrow.uuid), str(self.next_week.uuid)})
+
+    def test_filter_with_invalid_date_returns_400(self):
+        """Testa que data inválida retorna 400."""
+        response = self.client.get("/api/v1/appointments/?date_from=2025-13-40")
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertIn("date_from", response.json())
+
+    def test_filter_with_inverted_range_returns_400(self):
+        """Testa que date_from posterior a date_to retorna 400."""
+        response = self.client.get(
+            "/api/v1/appointments/?date_from=2025-02-01&date_to=2025-01-01"
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertIn("date_to", response.json())
+
+    def test_filter_is_ignored_on_retrieve(self):
+        """Testa que os filtros de período não afetam o detalhe."""
+        response = self.client.get(
+            f"/api/v1/appointments/{self.past.uuid}/?upcoming=true"
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+
+class TestProfessionalAvailability(AppointmentAPITestCase):
+    """Testes para horários livres (GET /api/v1/professionals/{uuid}/availability/)."""
+
+    def setUp(self):
+        """Define uma janela de 13h às 17h com consultas sobrepostas."""
+        super().setUp()
+        cache.clear()
+        self.start = self.tomorrow_datetime.replace(hour=13, minute=0)
+        self.end = self.start + timedelta(hours=4)
+        # 12h30-13h30 invade o início da janela; 14h-15h e 15h-15h15 são contíguas
+        self.create_appointment(
+            date=self.start - timedelta(minutes=30), duration_minutes=60
+        )
+        self.create_appointment(
+            date=self.start + timedelta(hours=1), duration_minutes=60
+        )
+        self.create_appointment(
+            date=self.start + timedelta(hours=2), duration_minutes=15
+        )
+
+    def get_availability(self, professional=None, **params):
+        """Consulta os horários livres do profissional na janela padrão."""
+        professional = professional or self.professional
+        query = {
+            "start": self.start.isoformat(),
+            "end": self.end.isoformat(),
+            **params,
+        }
+        return self.client.get(
+            f"/api/v1/professionals/{professional.uuid}/availability/"
+            f"?{urlencode(query)}"
+        )
+
+    def slot_offsets(self, response):
+        """Converte os horários em pares de minutos desde o início da janela."""
+        return [
+            (
+                (datetime.fromisoformat(slot["start"]) - self.start).seconds // 60,
+                (datetime.fromisoformat(slot["end"]) - self.start).seconds // 60,
+            )
+            for slot in response.json()["slots"]
+        ]
+
+    def test_availability_skips_merged_busy_intervals(self):
+        """Testa que os horários livres descontam as consultas mescladas."""
+        response = self.get_availability()
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(
+            self.slot_offsets(response),
+            [(30, 60), (135, 165), (165, 195), (195, 225)],
+        )
+
+    def test_availability_respects_slot_length(self):
+        """Testa que lacunas menores que o horário solicitado são descartadas."""
+        response = self.get_availability(slot_minutes=60)
+
+        self.assertEqual(response.json()["slot_minutes"], 60)
+        self.assertEqual(self.slot_offsets(response), [(135, 195)])
+
+    def test_availability_ignores_other_professionals(self):
+        """Testa que consultas de outros profissionais não ocupam a agenda."""
+        other = self.create_professional()
+        response = self.get_availability(professional=other, slot_minutes=60)
+
+        self.assertEqual(
+            self.slot_offsets(response), [(0, 60), (60, 120), (120, 180), (180, 240)]
+        )
+
+    def test_availability_reads_window_with_single_query(self):
+        """Testa que a agenda é lida com uma consulta por intervalo."""
+        self.get_availability()
+        with CaptureQueriesContext(connection) as context:
+            self.get_availability()
+
+        appointment_queries = [
+            q["sql"] for q in context if "appointments_appointment" in q["sql"]
+        ]
+        self.assertEqual(len(appointment_queries), 1)
+        self.assertIn('"professional_id" =', appointment_queries[0])
+        self.assertIn('"period" &&', appointment_queries[0])
+
+    def test_availability_with_unknown_professional_returns_404(self):
+        """Testa que profissional inexistente retorna 404."""
+        response = self.client.get(
+            "/api/v1/professionals/00000000-0000-0000-0000-000000000000/"
+            "availability/?start=2025-01-01&end=2025-01-02"
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+    def test_availability_without_window_returns_400(self):
+        """Testa que start e end são obrigatórios."""
+        response = self.client.get(
+            f"/api/v1/professionals/{self.professional.uuid}/availability/"
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertIn("start", response.json())
+        self.assertIn("end", response.json())
+
+    def test_availability_with_window_too_large_returns_400(self):
+        """Testa que janelas maiores que 31 dias são rejeitadas."""
+        response = self.get_availability(
+            end=(self.start + timedelta(days=32)).isoformat()
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertIn("end", response.json())
+
+
+class TestAppointmentOverlap(AppointmentAPITestCase):
+    """Testes para a constraint de exclusão contra agendamentos sobrepostos."""
+
+    def setUp(self):
+        """Cria uma consulta de 14h30 às 15h30."""
+        super().setUp()
+        self.appointment = self.create_appointment(duration_minutes=60)
+
+    def post_appointment(self, date, professional=None, **extra):
+        """Agenda uma consulta via API."""
+        professional = professional or self.professional
+        return self.client.post(
+            "/api/v1/appointments/",
+            data={
+                "professional_uuid": str(professional.uuid),
+                "date": date.isoformat(),
+                **extra,
+            },
+            format="json",
+        )
+
+    def test_create_overlapping_appointment_returns_409(self):
+        """Testa que um horário sobreposto retorna 409 sem gravar."""
+        response = self.post_appointment(self.tomorrow_datetime + timedelta(minutes=30))
+
+        self.assertEqual(response.status_code, status.HTTP_409_CONFLICT)
+        self.assertIn("date", response.json())
+        self.assertEqual(Appointment.objects.count(), 1)
+
+    def test_create_adjacent_appointment_returns_201(self):
+        """Testa que consultas contíguas não são consideradas sobrepostas."""
+        response = self.post_appointment(self.tomorrow_datetime + timedelta(hours=1))
+
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+
+    def test_create_same_time_for_other_professional_returns_201(self):
+        """Testa que a exclusão vale apenas para o mesmo profissional."""
+        other = self.create_professional()
+        response = self.post_appointment(self.tomorrow_datetime, professional=other)
+
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+
+    def test_update_into_overlap_returns_409(self):
+        """Testa que mover uma consulta para horário ocupado retorna 409."""
+        other = self.create_appointment(
+            date=self.tomorrow_datetime + timedelta(hours=2)
+        )
+        response = self.client.patch(
+            f"/api/v1/appointments/{other.uuid}/",
+            data={"duration_minutes": 30, "date": self.tomorrow_datetime.isoformat()},
+            format="json",
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_409_CONFLICT)
+        other.refresh_from_db()
+        self.assertEqual(other.date, self.tomorrow_datetime + timedelta(hours=2))
+
+    def test_update_extends_period_with_duration(self):
+        """Testa que alterar a duração atualiza o período ocupado."""
+        response = self.client.patch(
+            f"/api/v1/appointments/{self.appointment.uuid}/",
+            data={"duration_minutes": 90},
+            format="json",
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.appointment.refresh_from_db()
+        self.assertEqual(
+            self.appointment.period.upper,
+            self.tomorrow_datetime + timedelta(minutes=90),
+        )
+
+    def test_batch_rejects_only_overlapping_items(self):
+        """Testa que, no lote, apenas os itens sobrepostos são rejeitados."""
+        items = [
+            {
+                "professional_uuid": str(self.professional.uuid),
+                "date": (self.tomorrow_datetime + timedelta(hours=hours)).isoformat(),
+            }
+            for hours in (2, 0, 3)
+        ]
+        response = self.client.post(
+            "/api/v1/appointments/batch/", data=items, format="json"
+        )
+        data = response.json()
+
+        self.assertEqual(response.status_code, status.HTTP_207_MULTI_STATUS)
+        self.assertEqual(data["created"], 2)
+        self.assertEqual(data["results"][1]["status"], "error")
+        self.assertIn("date", data["results"][1]["errors"])
+        self.assertEqual(Appointment.objects.count(), 3)
+
+
+class TestAppointmentBatchCreate(AppointmentAPITestCase):
+    """Testes para agendamento em lote (POST /api/v1/appointments/batch/)."""
+
+    def build_items(self, total, professional=None):
+        """Gera itens em horários distintos para o profissional informado."""
+        professional = professional or self.professional
+        return [
+            {
+                "professional_uuid": str(professional.uuid),
+                "date": (self.tomorrow_datetime + timedelta(hours=index)).isoformat(),
+            }
+            for index in range(total)
+        ]
+
+    def test_batch_create_returns_201_when_all_valid(self):
+        """Testa que um lote válido cria todas as consultas."""
+        response = self.client.post(
+            "/api/v1/appointments/batch/",
+            data=self.build_items(5),
+            format="json",
+        )
+        data = response.json()
+
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(data["created"], 5)
+        self.assertEqual(Appointment.objects.count(), 5)
+        self.assertTrue(
+            Appointment.objects.filter(uuid=data["results"][0]["uuid"]).exists()
+        )
+
+    def test_batch_create_resolves_professionals_in_single_query(self):
+        """Testa que os profissionais são resolvidos com uma única consulta."""
+        other = self.create_professional()
+        items = self.build_items(10) + self.build_items(10, professional=other)
+
+        with CaptureQueriesContext(connection) as context:
+            response = self.client.post(
+                "/api/v1/appointments/batch/",
+                data=items,
+                format="json",
+            )
+
+        self.assertEqual(response.json()["created"], 20)
+        lookups = [
+            q
+            for q in context.captured_queries
+            if 'FROM "professionals_professional"' in q["sql"]
+        ]
+        inserts = [q for q in context.captured_queries if q["sql"].startswith("INSERT")]
+        self.assertEqual(len(lookups), 1)
+        self.assertEqual(len(inserts), 1)
+
+    def test_batch_create_rejects_unknown_professional_per_item(self):
+        """Testa que um profissional inexistente invalida apenas o próprio item."""
+        items = self.build_items(3)
+        items[1]["professional_uuid"] = "00000000-0000-0000-0000-000000000000"
+
+        response = self.client.post(
+            "/api/v1/appointments/batch/",
+            data=items,
+            format="json",
+        )
+        data = response.json()
+
+        self.assertEqual(response.status_code, status.HTTP_207_MULTI_STATUS)
+        self.assertEqual(data["created"], 2)
+        self.assertEqual(data["results"][1]["status"], "error")
+        self.assertIn("professional_uuid", data["results"][1]["errors"])
+        self.assertEqual(Appointment.objects.count(), 2)
+
+    def test_batch_create_rejects_invalid_date_per_item(self):
+        """Testa que uma data inválida é reportada no item correspondente."""
+        items = self.build_items(2)
+        items[0]["date"] = "invalid-date"
+
+        response = self.client.post(
+            "/api/v1/appointments/batch/",
+            data=items,
+            format="json",
+        )
+        data = response.json()
+
+        self.assertEqual(data["created"], 1)
+        self.assertIn("date", data["results"][0]["errors"])
+
+
+class TestAppointmentCursorPagination(AppointmentAPITestCase):
+    """Testes para a paginação por cursor (GET /api/v1/appointments/?pagination=cursor)."""
+
+    def setUp(self):
+        super().setUp()
+        # Horários repetidos entre profissionais exercitam o desempate por id
+        professionals = [self.professional] + [
+            self.create_professional() for _ in range(2)
+        ]
+        self.appointments = [
+            self.create_appointment(
+                professional=professional,
+                date=self.tomorrow_datetime + timedelta(hours=hour),
+            )
+            for hour in range(9)
+            for professional in professionals
+        ]
+        self.expected = [
+            str(uuid)
+            for uuid in Appointment.objects.order_by("-date", "-id").values_list(
+                "uuid", flat=True
+            )
+        ]
+
+    def walk(self, url):
+        """Percorre os links next e devolve os UUIDs na ordem recebida."""
+        uuids = []
+        while url:
+            data = self.client.get(url).json()
+            uuids.extend(result["uuid"] for result in data["results"])
+            url = data["next"]
+        return uuids
+
+    def test_cursor_pagination_walks_all_appointments_in_order(self):
+        """Testa que os links next percorrem todas as consultas sem repetição."""
+        uuids = self.walk("/api/v1/appointments/?pagination=cursor")
+        self.assertEqual(uuids, self.expected)
+
+    def test_cursor_pagination_omits_count(self):
+        """Testa que a resposta não traz contagem total."""
+        data = self.client.get("/api/v1/appointments/?pagination=cursor").json()
+        self.assertNotIn("count", data)
+        self.assertIsNone(data["previous"])
+        self.assertEqual(len(data["results"]), 20)
+
+    def test_cursor_pagination_previous_link_returns_previous_page(self):
+        """Testa que o link previous volta para a página anterior."""
+        first = self.client.get("/api/v1/appointments/?pagination=cursor").json()
+        second = self.client.get(first["next"]).json()
+        previous = self.client.get(second["previous"]).json()
+
+        self.assertEqual(previous["results"], first["results"])
+        self.assertIsNone(second["next"])
+
+    def test_cursor_pagination_pages_run_same_queries(self):
+        """Testa que páginas seguintes custam o mesmo número de consultas."""
+        with self.assertNumQueries(3):
+            first = self.client.get("/api/v1/appointments/?pagination=cursor").json()
+        with self.assertNumQueries(3):
+            self.client.get(first["next"])
+
+    def test_cursor_pagination_with_invalid_cursor_returns_404(self):
+        """Testa que um cursor inválido retorna 404."""
+        response = self.client.get(
+            "/api/v1/appointments/?pagination=cursor&cursor=invalido"
+        )
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+    def test_default_pagination_is_unchanged(self):
+        """Testa que sem o parâmetro a paginação por página continua padrão."""
+        data = self.client.get("/api/v1/appointments/").json()
+        self.assertEqual(data["count"], len(self.expected))
+
+
+class TestAppointmentConditionalRequests(AppointmentAPITestCase):
+    """Testes para ETag, Last-Modified e requisições condicionais."""
+
+    def setUp(self):
+        super().setUp()
+        self.appointment = self.create_appointment()
+        self.detail_url = f"/api/v1/appointments/{self.appointment.uuid}/"
+
+    def test_retrieve_returns_validators(self):
+        """Testa que o detalhe traz ETag forte e Last-Modified."""
+        response = self.client.get(self.detail_url)
+
+        self.assertTrue(response["ETag"].startswith('"'))
+        self.assertIn("Last-Modified", response)
+
+    def test_retrieve_with_current_etag_returns_304_without_serializing(self):
+        """Testa que If-None-Match atual responde 304 com uma única consulta."""
+        etag = self.client.get(self.detail_url)["ETag"]
+
+        with self.assertNumQueries(1):
+            response = self.client.get(self.detail_url, HTTP_IF_NONE_MATCH=etag)
+
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+        self.assertEqual(response.content, b"")
+        self.assertEqual(response["ETag"], etag)
+
+    def test_cursor_list_validators_come_from_the_page(self):
+        """Testa que o 304 da página por cursor não conta nem agrega a listagem."""
+        url = "/api/v1/appointments/?pagination=cursor"
+        etag = self.client.get(url)["ETag"]
+
+        with CaptureQueriesContext(connection) as context:
+            response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+        self.assertEqual(len(context.captured_queries), 1)
+        self.assertIn("LIMIT 21", context.captured_queries[0]["sql"])
+
+    def test_list_etag_changes_when_page_rows_change(self):
+        """Testa que trocar uma consulta da página muda o ETag da listagem."""
+        url = "/api/v1/appointments/?pagination=cursor"
+        etag = self.client.get(url)["ETag"]
+        self.appointment.delete()
+        self.create_appointment(date=self.tomorrow_datetime + timedelta(hours=1))
+
+        response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertNotEqual(response["ETag"], etag)
+
+    def test_retrieve_with_last_modified_returns_304(self):
+        """Testa que If-Modified-Since com o Last-Modified responde 304."""
+        last_modified = self.client.get(self.detail_url)["Last-Modified"]
+
+        response = self.client.get(
+            self.detail_url, HTTP_IF_MODIFIED_SINCE=last_modified
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+
+    def test_professional_change_changes_etag(self):
+        """Testa que alterar o profissional aninhado muda o ETag da consulta."""
+        etag = self.client.get(self.detail_url)["ETag"]
+        self.professional.social_name = "Dra. Joana Santos"
+        self.professional.save()
+
+        response = self.client.get(self.detail_url, HTTP_IF_NONE_MATCH=etag)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertNotEqual(response["ETag"], etag)
+
+    def test_list_etag_changes_on_create_and_delete(self):
+        """Testa que a listagem responde 304 até uma consulta entrar ou sair."""
+        url = f"/api/v1/appointments/?professional_uuid={self.professional.uuid}"
+        etag = self.client.get(url)["ETag"]
+        self.assertEqual(
+            self.client.get(url, HTTP_IF_NONE_MATCH=etag).status_code,
+            status.HTTP_304_NOT_MODIFIED,
+        )
+
+        other = self.create_appointment(
+            date=self.tomorrow_datetime + timedelta(hours=2)
+        )
+        response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+        etag = response["ETag"]
+        other.delete()
+        response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.json()["count"], 1)
+
+    def test_update_with_current_etag_succeeds(self):
+        """Testa que If-Match com o ETag atual permite a escrita."""
+        etag = self.client.get(self.detail_url)["ETag"]
+        new_datetime = self.tomorrow_datetime + timedelta(hours=1)
+
+        response = self.client.patch(
+            self.detail_url,
+            data={"date": new_datetime.isoformat()},
+            format="json",
+            HTTP_IF_MATCH=etag,
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.appointment.refresh_from_db()
+        self.assertEqual(self.appointment.date, new_datetime)
+
+    def test_update_with_stale_etag_returns_412(self):
+        """Testa que If-Match desatualizado barra a escrita com 412."""
+        etag = self.client.get(self.detail_url)["ETag"]
+        self.client.patch(
+            self.detail_url,
+            data={"duration_minutes": 45},
+            format="json",
+        )
+
+        response = self.client.put(
+            self.detail_url,
+            data=self.appointment_data,
+            format="json",
+            HTTP_IF_MATCH=etag,
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_412_PRECONDITION_FAILED)
+
+    def test_delete_with_stale_etag_returns_412(self):
+        """Testa que If-Match desatualizado impede a exclusão."""
+        response = self.client.delete(self.detail_url, HTTP_IF_MATCH='"desatualizado"')
+
+        self.assertEqual(response.status_code, status.HTTP_412_PRECONDITION_FAILED)
+        self.assertTrue(Appointment.objects.filter(pk=self.appointment.pk).exists())
+
+
+class TestAppointmentSparseFields(AppointmentAPITestCase):
+    """Testes para os parâmetros fields e expand da listagem e do detalhe."""
+
+    def setUp(self):
+        super().setUp()
+        self.appointment = self.create_appointment()
+        self.detail_url = f"/api/v1/appointments/{self.appointment.uuid}/"
+
+    def test_list_returns_only_requested_fields_without_professional(self):
+        """Testa que sem o profissional a listagem não o consulta."""
+        with CaptureQueriesContext(connection) as context:
+            response = self.client.get("/api/v1/appointments/", {"fields": "uuid,date"})
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(
+            response.json()["results"],
+            [
+                {
+                    "uuid": str(self.appointment.uuid),
+                    "date": response.json()["results"][0]["date"],
+                }
+            ],
+        )
+        self.assertEqual(len(context.captured_queries), 2)
+        self.assertFalse(
+            any("professionals_" in query["sql"] for query in context.captured_queries)
+        )
+
+    def test_expand_adds_professional_to_fields(self):
+        """Testa que expand=professional inclui o profissional completo."""
+        full = self.client.get(self.detail_url).json()
+
+        with self.assertNumQueries(4):
+            response = self.client.get(
+                self.detail_url, {"fields": "uuid", "expand": "professional"}
+            )
+
+        self.assertEqual(
+            response.json(),
+            {"uuid": full["uuid"], "professional": full["professional"]},
+        )
+
+    def test_retrieve_without_professional_runs_fewer_queries(self):
+        """Testa que o detalhe sem o profissional dispensa endereço e contatos."""
+        with self.assertNumQueries(2):
+            response = self.client.get(
+                self.detail_url, {"fields": "date,duration_minutes"}
+            )
+
+        self.assertEqual(set(response.json()), {"date", "duration_minutes"})
+
+    def test_default_response_is_unchanged(self):
+        """Testa que sem fields a resposta traz todos os campos."""
+        response = self.client.get(self.detail_url, {"expand": "professional"})
+
+        self.assertEqual(response.json(), self.client.get(self.detail_url).json())
+
+    def test_unknown_field_returns_400(self):
+        """Testa que campos e relações desconhecidos retornam 400."""
+        fields = self.client.get("/api/v1/appointments/", {"fields": "uuid,senha"})
+        expand = self.client.get(self.detail_url, {"fields": "uuid", "expand": "date"})
+
+        self.assertEqual(fields.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertIn("fields", fields.json())
+        self.assertEqual(expand.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertIn("expand", expand.json())
@@ -0,0 +1,67 @@
+from datetime import datetime, timedelta, timezone
+
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from app.appointments.models import Appointment
+from app.professionals.models import Professional
+
+LIST_URL = "/api/v1/appointments/"
+
+
+class TestASGIHandler(APITestCase):
+    """Testes para as leituras e escritas servidas pelo handler ASGI."""
+
+    def setUp(self):
+        self.professional = Professional.objects.create(
+            social_name="Dr. João Santos", profession="Psicólogo"
+        )
+        self.date = (datetime.now(timezone.utc) + timedelta(days=1)).replace(
+            hour=14, minute=30, second=0, microsecond=0
+        )
+        self.appointment = Appointment.objects.create(
+            professional=self.professional, date=self.date
+        )
+
+    async def test_list_and_conditional_get_under_asgi(self):
+        """Testa a listagem e o 304 pelo handler assíncrono."""
+        response = await self.async_client.get(LIST_URL)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.json()["count"], 1)
+
+        response = await self.async_client.get(
+            LIST_URL, headers={"If-None-Match": response["ETag"]}
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+
+    async def test_retrieve_and_head_under_asgi(self):
+        """Testa o detalhe (GET e HEAD) pelo handler assíncrono."""
+        url = f"{LIST_URL}{self.appointment.uuid}/"
+
+        response = await self.async_client.get(url)
+        head = await self.async_client.head(url)
+        missing = await self.async_client.get(
+            f"{LIST_URL}00000000-0000-0000-0000-000000000000/"
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.json()["uuid"], str(self.appointment.uuid))
+        self.assertEqual(head.status_code, status.HTTP_200_OK)
+        self.assertEqual(head["ETag"], response["ETag"])
+        self.assertEqual(missing.status_code, status.HTTP_404_NOT_FOUND)
+
+    async def test_writes_are_dispatched_synchronously(self):
+        """Testa que as escritas funcionam pelo handler ASGI."""
+        response = await self.async_client.post(
+            LIST_URL,
+            {
+                "professional_uuid": str(self.professional.uuid),
+                "date": (self.date + timedelta(hours=2)).isoformat(),
+            },
+            content_type="application/json",
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(await Appointment.objects.acount(), 2)
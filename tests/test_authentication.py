@@ -0,0 +1,93 @@
+from datetime import timedelta
+from unittest import mock
+from urllib.parse import urlencode
+
+from django.core.cache import cache
+from django.utils import timezone
+from oauth2_provider.models import AccessToken, Application
+from rest_framework.request import Request
+from rest_framework.test import APIRequestFactory, APITestCase
+
+from app.core.authentication import CachedOAuth2Authentication
+
+TOKEN = "token-de-teste-123"
+
+
+class TestCachedOAuth2Authentication(APITestCase):
+    """Testes para o cache de tokens OAuth2 validados."""
+
+    def setUp(self):
+        self.application = Application.objects.create(
+            name="Mobile App",
+            client_type=Application.CLIENT_CONFIDENTIAL,
+            authorization_grant_type=Application.GRANT_CLIENT_CREDENTIALS,
+            client_secret="segredo",
+        )
+        self.access_token = AccessToken.objects.create(
+            application=self.application,
+            token=TOKEN,
+            scope="read write",
+            expires=timezone.now() + timedelta(hours=1),
+        )
+
+    def authenticate(self, token=TOKEN):
+        request = APIRequestFactory().get(
+            "/api/v1/professionals/", HTTP_AUTHORIZATION=f"Bearer {token}"
+        )
+        return CachedOAuth2Authentication().authenticate(Request(request))
+
+    def test_cached_token_is_validated_without_queries(self):
+        """Testa que, após a primeira validação, o token não é lido do banco."""
+        self.authenticate()
+
+        with self.assertNumQueries(0):
+            user, auth = self.authenticate()
+
+        self.assertIsNone(user)
+        self.assertEqual(auth.pk, self.access_token.pk)
+        self.assertTrue(auth.is_valid(["read", "write"]))
+
+    def test_cache_entry_does_not_outlive_token(self):
+        """Testa que a entrada expira junto com o token."""
+        self.access_token.expires = timezone.now() + timedelta(seconds=30)
+        self.access_token.save()
+
+        with mock.patch.object(cache, "set", wraps=cache.set) as cache_set:
+            self.authenticate()
+
+        timeout = cache_set.call_args.args[2]
+        self.assertLessEqual(timeout, 30)
+
+    def test_expired_cached_token_is_rejected(self):
+        """Testa que um token em cache deixa de valer quando expira."""
+        self.authenticate()
+
+        later = timezone.now() + timedelta(hours=2)
+        with mock.patch("django.utils.timezone.now", return_value=later):
+            self.assertIsNone(self.authenticate())
+
+    def test_revoked_token_is_rejected_immediately(self):
+        """Testa que revogar pelo endpoint OAuth descarta o token do cache."""
+        self.authenticate()
+
+        response = self.client.post(
+            "/oauth/revoke_token/",
+            data=urlencode(
+                {
+                    "token": TOKEN,
+                    "client_id": self.application.client_id,
+                    "client_secret": "segredo",
+                }
+            ),
+            content_type="application/x-www-form-urlencoded",
+        )
+
+        self.assertEqual(response.status_code, 200)
+        self.assertIsNone(self.authenticate())
+
+    def test_unknown_token_is_not_cached(self):
+        """Testa que tokens inválidos não são guardados."""
+        self.assertIsNone(self.authenticate("desconhecido"))
+        self.assertIsNone(
+            cache.get(CachedOAuth2Authentication.cache_key("desconhecido"))
+        )
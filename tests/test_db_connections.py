@@ -0,0 +1,28 @@
+from io import StringIO
+
+from django.core.management import call_command
+from django.core.management.base import CommandError
+from django.test import TestCase, TransactionTestCase
+
+
+class TestBenchmarkDbConnections(TransactionTestCase):
+    """Testes para o benchmark de reaproveitamento de conexões."""
+
+    def test_reports_both_modes_and_savings(self):
+        """Testa que o relatório compara conexão nova e configuração atual."""
+        out = StringIO()
+        call_command("benchmark_db_connections", requests=3, stdout=out)
+
+        output = out.getvalue()
+        self.assertIn("Conexão nova por requisição: mediana", output)
+        self.assertIn("Configuração atual (", output)
+        self.assertIn("Economia por requisição (mediana)", output)
+
+
+class TestBenchmarkDbConnectionsInTransaction(TestCase):
+    """Testes para o benchmark executado dentro de uma transação."""
+
+    def test_refuses_to_run_inside_transaction(self):
+        """Testa que o comando não fecha a conexão de uma transação aberta."""
+        with self.assertRaises(CommandError):
+            call_command("benchmark_db_connections", requests=1, stdout=StringIO())
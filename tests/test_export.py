@@ -0,0 +1,127 @@
+import csv
+import io
+import json
+from datetime import datetime, timedelta, timezone
+from unittest import mock
+
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from app.appointments.models import Appointment
+from app.professionals.models import Address, Contact, Professional
+
+APPOINTMENTS_URL = "/api/v1/appointments/"
+PROFESSIONALS_URL = "/api/v1/professionals/"
+
+
+class TestExport(APITestCase):
+    """Testes para a exportação em NDJSON e CSV."""
+
+    def setUp(self):
+        self.recife = Professional.objects.create(
+            social_name="Dra. Ana Lima", profession="Psicóloga"
+        )
+        Address.objects.create(
+            professional=self.recife,
+            street="Rua da Aurora",
+            neighborhood="Boa Vista",
+            city="Recife",
+            state="PE",
+            zip_code="50050000",
+        )
+        Contact.objects.create(professional=self.recife, kind="phone", value="81999")
+        self.empty = Professional.objects.create(
+            social_name="Dr. Bruno Reis", profession="Nutricionista"
+        )
+
+        self.date = datetime(2030, 5, 10, 14, 30, tzinfo=timezone.utc)
+        for offset, professional in enumerate([self.recife, self.empty, self.recife]):
+            Appointment.objects.create(
+                professional=professional, date=self.date + timedelta(hours=offset)
+            )
+
+    def export(self, url, **params):
+        response = self.client.get(f"{url}export/", params)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertTrue(response.streaming)
+        return response, b"".join(response.streaming_content).decode()
+
+    def test_ndjson_matches_list(self):
+        """Testa que cada linha é o item da listagem, em lotes de uma linha."""
+        listed = self.client.get(APPOINTMENTS_URL).json()["results"]
+
+        # Importar a view na coleta fixaria as permissões antes do conftest
+        with mock.patch(
+            "app.appointments.views.AppointmentViewSet.export_chunk_size", 1
+        ):
+            response, body = self.export(APPOINTMENTS_URL)
+
+        self.assertEqual(response["Content-Type"], "application/x-ndjson")
+        self.assertIn('filename="appointments.ndjson"', response["Content-Disposition"])
+        self.assertEqual([json.loads(line) for line in body.splitlines()], listed)
+
+    def test_respects_list_filters(self):
+        """Testa os filtros da listagem em consultas e profissionais."""
+        _, appointments = self.export(
+            APPOINTMENTS_URL,
+            professional_uuid=str(self.recife.uuid),
+            date_from=(self.date + timedelta(hours=1)).isoformat(),
+        )
+        _, professionals = self.export(PROFESSIONALS_URL, city="Recife")
+
+        self.assertEqual(len(appointments.splitlines()), 1)
+        self.assertEqual(
+            [json.loads(line)["uuid"] for line in professionals.splitlines()],
+            [str(self.recife.uuid)],
+        )
+
+    def test_csv_flattens_nested_objects(self):
+        """Testa as colunas do endereço, os contatos em JSON e os campos vazios."""
+        response, body = self.export(PROFESSIONALS_URL, output="csv")
+
+        rows = {row["uuid"]: row for row in csv.DictReader(io.StringIO(body))}
+        self.assertEqual(response["Content-Type"], "text/csv; charset=utf-8")
+        self.assertEqual(rows[str(self.recife.uuid)]["address.city"], "Recife")
+        self.assertEqual(
+            json.loads(rows[str(self.recife.uuid)]["contacts"]),
+            [{"kind": "phone", "value": "81999"}],
+        )
+        self.assertEqual(rows[str(self.empty.uuid)]["address.city"], "")
+
+    def test_csv_escapes_formula_cells(self):
+        """Testa que textos que uma planilha executaria recebem um apóstrofo."""
+        self.empty.social_name = '=HYPERLINK("http://x.y","z")'
+        self.empty.profession = "+Nutricionista"
+        self.empty.save()
+
+        _, body = self.export(PROFESSIONALS_URL, output="csv")
+
+        rows = {row["uuid"]: row for row in csv.DictReader(io.StringIO(body))}
+        self.assertEqual(
+            rows[str(self.empty.uuid)]["social_name"], '\'=HYPERLINK("http://x.y","z")'
+        )
+        self.assertEqual(rows[str(self.empty.uuid)]["profession"], "'+Nutricionista")
+        self.assertEqual(rows[str(self.recife.uuid)]["social_name"], "Dra. Ana Lima")
+
+    def test_csv_without_rows_has_header(self):
+        """Testa que a exportação vazia traz apenas o cabeçalho."""
+        _, body = self.export(APPOINTMENTS_URL, output="csv", date_to="2000-01-01")
+
+        (header,) = csv.reader(io.StringIO(body))
+        self.assertEqual(header[:3], ["uuid", "date", "duration_minutes"])
+        self.assertIn("professional.address.city", header)
+
+    def test_invalid_output_returns_400(self):
+        """Testa que formatos desconhecidos são recusados antes da transmissão."""
+        response = self.client.get(f"{APPOINTMENTS_URL}export/", {"output": "xlsx"})
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertIn("output", response.json())
+
+    async def test_streams_asynchronously_under_asgi(self):
+        """Testa que, sob ASGI, a exportação usa um iterador assíncrono."""
+        response = await self.async_client.get(f"{APPOINTMENTS_URL}export/")
+
+        self.assertTrue(response.is_async)
+        body = b"".join([part async for part in response.streaming_content])
+        self.assertEqual(len(body.splitlines()), 3)
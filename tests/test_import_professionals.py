@@ -0,0 +1,142 @@
+import json
+import tempfile
+import uuid
+from io import StringIO
+from pathlib import Path
+
+from django.core.management import call_command
+from rest_framework.test import APITestCase
+
+from app.professionals.models import Address, Contact, Professional
+from app.professionals.services import ProfessionalService
+
+EXPORT_URL = "/api/v1/professionals/export/"
+STATE_FILE = "profissionais.ndjson.import-state"
+
+
+def record(social_name, **extra):
+    return {
+        "social_name": social_name,
+        "profession": "Psicóloga",
+        "address": {
+            "street": "Rua da Aurora",
+            "neighborhood": "Boa Vista",
+            "city": "Recife",
+            "state": "PE",
+            "zip_code": "50050000",
+        },
+        "contacts": [{"kind": "phone", "value": "81999"}],
+        **extra,
+    }
+
+
+class TestImportProfessionals(APITestCase):
+    """Testes para o comando import_professionals."""
+
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.directory = Path(directory.name)
+
+    def write_ndjson(self, *lines):
+        path = self.directory / "profissionais.ndjson"
+        path.write_text(
+            "\n".join(
+                line if isinstance(line, str) else json.dumps(line) for line in lines
+            )
+        )
+        return path
+
+    def export_csv(self):
+        response = self.client.get(EXPORT_URL, {"output": "csv"})
+        return b"".join(response.streaming_content)
+
+    def run_import(self, path, **options):
+        out = StringIO()
+        call_command("import_professionals", str(path), stdout=out, **options)
+        return out.getvalue()
+
+    def test_imports_valid_records_and_reports_rejected(self):
+        """Testa a carga via COPY e o arquivo com os registros rejeitados."""
+        path = self.write_ndjson(
+            record("Dra. Ana Lima"), record("Dr. Sem Contato", contacts=[]), "{"
+        )
+
+        output = self.run_import(path, batch_size=2)
+
+        professional = Professional.objects.get()
+        address = Address.objects.get(professional=professional)
+        self.assertEqual(professional.social_name, "Dra. Ana Lima")
+        self.assertEqual(
+            professional.search_document,
+            ProfessionalService.build_search_document(
+                "Dra. Ana Lima", "Psicóloga", record("")["address"]
+            ),
+        )
+        self.assertIsNotNone(address.latitude)
+        self.assertEqual(Contact.objects.filter(professional=professional).count(), 1)
+        self.assertIn("1 criados, 0 já existentes, 2 rejeitados", output)
+
+        errors_path = self.directory / "profissionais.ndjson.errors.ndjson"
+        errors = [json.loads(line) for line in errors_path.read_text().splitlines()]
+        self.assertEqual([error["index"] for error in errors], [1, 2])
+        self.assertIn("contacts", errors[0]["errors"])
+        self.assertFalse((self.directory / STATE_FILE).exists())
+
+    def test_csv_export_round_trip(self):
+        """Testa que o CSV da exportação é importado de volta sem perdas."""
+        ProfessionalService.create(record("Dra. Ana Lima"))
+        ProfessionalService.create(
+            record("Dr. Bruno Reis", contacts=[{"kind": "email", "value": "b@r.c"}])
+        )
+        ProfessionalService.create(record("=Dra. Clara", profession="'Psicóloga"))
+        exported = self.export_csv()
+        self.assertIn(b"'=Dra. Clara", exported)
+        path = self.directory / "profissionais.csv"
+        path.write_bytes(exported)
+        Professional.objects.all().delete()
+
+        self.run_import(path)
+
+        self.assertEqual(
+            sorted(self.export_csv().splitlines()), sorted(exported.splitlines())
+        )
+
+    def test_rerun_skips_existing_uuids(self):
+        """Testa que registros com uuid já importados são ignorados."""
+        path = self.write_ndjson(record("Dra. Ana Lima", uuid=str(uuid.uuid4())))
+
+        self.run_import(path)
+        output = self.run_import(path)
+
+        self.assertEqual(Professional.objects.count(), 1)
+        self.assertIn("0 criados, 1 já existentes", output)
+
+    def test_resumes_from_saved_progress(self):
+        """Testa a retomada pelo progresso salvo e pelo lote em curso gravado."""
+        path = self.write_ndjson(
+            record("Dra. Ana Lima"), record("Dr. Bruno Reis"), record("Dra. Clara")
+        )
+        state_path = self.directory / STATE_FILE
+        state_path.write_text(json.dumps({"position": 1}))
+
+        self.run_import(path, batch_size=1)
+
+        self.assertEqual(
+            set(Professional.objects.values_list("social_name", flat=True)),
+            {"Dr. Bruno Reis", "Dra. Clara"},
+        )
+
+        # Interrompido após gravar o segundo lote e antes de salvar o progresso
+        marker = Professional.objects.get(social_name="Dr. Bruno Reis").uuid
+        state_path.write_text(
+            json.dumps(
+                {"position": 1, "pending": {"position": 2, "marker": str(marker)}}
+            )
+        )
+        Professional.objects.filter(social_name="Dra. Clara").delete()
+
+        output = self.run_import(path, batch_size=1)
+
+        self.assertIn("Retomando após 2 registros", output)
+        self.assertEqual(Professional.objects.count(), 2)
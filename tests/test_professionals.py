@@ -1,8 +1,16 @@
+import json
+from unittest import mock
+
 from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.db import DatabaseError, connection
+from django.test import override_settings
+from django.test.utils import CaptureQueriesContext
 from rest_framework import status
 from rest_framework.test import APITestCase
 
 from app.professionals.models import Address, Contact, Professional
+from app.professionals.services import ProfessionalService
 
 User = get_user_model()
 
@@ -394,6 +402,23 @@ class TestProfessionalDelete(ProfessionalAPITestCase):
             Contact.objects.filter(professional_id=professional_id).exists()
         )
 
+    def test_delete_professional_cascades_without_loading_related_rows(self):
+        """Testa que endereço e contatos são apagados sem serem carregados."""
+        professional = self.create_professional()
+        with CaptureQueriesContext(connection) as context:
+            self.client.delete(f"/api/v1/professionals/{professional.uuid}/")
+
+        related_selects = [
+            query["sql"]
+            for query in context
+            if query["sql"].startswith("SELECT")
+            and (
+                "professionals_address" in query["sql"].split("WHERE")[0]
+                or "professionals_contact" in query["sql"].split("WHERE")[0]
+            )
+        ]
+        self.assertEqual(related_selects, [])
+
 
 class TestProfessionalErrors(ProfessionalAPITestCase):
     """Testes para tratamento de erros na API de Profissionais."""
@@ -513,3 +538,785 @@ class TestProfessionalErrors(ProfessionalAPITestCase):
         """Testa que buscar com formato de UUID inválido retorna 404."""
         response = self.client.get("/api/v1/professionals/invalid-uuid/")
         self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+
+class TestProfessionalQueryCount(ProfessionalAPITestCase):
+    """Testes de regressão para o número de consultas ao banco por requisição."""
+
+    def test_list_professionals_runs_constant_queries(self):
+        """Testa que a listagem executa o mesmo número de consultas para 1 ou 20 itens."""
+        self.create_professional()
+        with self.assertNumQueries(4):
+            self.client.get("/api/v1/professionals/")
+
+        for _ in range(24):
+            self.create_professional()
+        with self.assertNumQueries(4):
+            response = self.client.get("/api/v1/professionals/")
+
+        self.assertEqual(len(response.json()["results"]), 20)
+
+    def test_list_professionals_reads_prefetched_relations(self):
+        """Testa que endereço e contatos vêm do cache de prefetch."""
+        for _ in range(3):
+            self.create_professional()
+        with self.assertNumQueries(4):
+            response = self.client.get("/api/v1/professionals/")
+
+        for result in response.json()["results"]:
+            self.assertEqual(result["address"]["street"], "Av. Paulista")
+            self.assertEqual(
+                [c["kind"] for c in result["contacts"]], ["email", "mobile"]
+            )
+
+    def test_retrieve_professional_runs_constant_queries(self):
+        """Testa que o detalhe executa um número fixo de consultas."""
+        professional = self.create_professional()
+        with self.assertNumQueries(4):
+            self.client.get(f"/api/v1/professionals/{professional.uuid}/")
+
+
+class TestProfessionalServiceWrites(ProfessionalAPITestCase):
+    """Testes para as escritas em lote e por diferença do ProfessionalService."""
+
+    def test_create_inserts_contacts_in_single_query(self):
+        """Testa que os contatos são inseridos com um único INSERT."""
+        with CaptureQueriesContext(connection) as context:
+            response = self.client.post(
+                "/api/v1/professionals/",
+                data=self.professional_data,
+                format="json",
+            )
+
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        contact_inserts = [
+            q
+            for q in context.captured_queries
+            if q["sql"].startswith('INSERT INTO "professionals_contact"')
+        ]
+        self.assertEqual(len(contact_inserts), 1)
+
+    def test_update_with_same_data_keeps_contacts_and_address(self):
+        """Testa que um PUT sem mudanças não reescreve contatos nem endereço."""
+        professional = self.create_professional()
+        contact_ids = set(professional.contacts.values_list("id", flat=True))
+        address_id = professional.addresses.get().id
+        data = {
+            "social_name": professional.social_name,
+            "profession": professional.profession,
+            "address": {
+                "street": "Av. Paulista",
+                "number": "1000",
+                "neighborhood": "Bela Vista",
+                "complement": "Conjunto 501",
+                "city": "São Paulo",
+                "state": "SP",
+                "zip_code": "01310100",
+            },
+            "contacts": [
+                {"kind": "email", "value": "joao.santos@email.com"},
+                {"kind": "mobile", "value": "11988888888"},
+            ],
+        }
+
+        with CaptureQueriesContext(connection) as context:
+            self.client.put(
+                f"/api/v1/professionals/{professional.uuid}/",
+                data=data,
+                format="json",
+            )
+
+        writes = [
+            q["sql"]
+            for q in context.captured_queries
+            if q["sql"].startswith(("INSERT", "DELETE"))
+            or q["sql"].startswith('UPDATE "professionals_contact"')
+            or q["sql"].startswith('UPDATE "professionals_address"')
+        ]
+        self.assertEqual(writes, [])
+        self.assertEqual(
+            set(professional.contacts.values_list("id", flat=True)), contact_ids
+        )
+        self.assertEqual(professional.addresses.get().id, address_id)
+
+    def test_update_touches_only_changed_contacts(self):
+        """Testa que apenas os contatos alterados são regravados."""
+        professional = self.create_professional()
+        email = professional.contacts.get(kind="email")
+        data = {
+            **self.professional_data,
+            "contacts": [
+                {"kind": "email", "value": "joao.santos@email.com"},
+                {"kind": "whatsapp", "value": "11977777777"},
+                {"kind": "linkedin", "value": "linkedin.com/in/joao"},
+            ],
+        }
+
+        self.client.put(
+            f"/api/v1/professionals/{professional.uuid}/",
+            data=data,
+            format="json",
+        )
+
+        contacts = {c.kind: c for c in professional.contacts.all()}
+        self.assertEqual(set(contacts), {"email", "whatsapp", "linkedin"})
+        self.assertEqual(contacts["email"].id, email.id)
+        self.assertEqual(contacts["email"].updated_at, email.updated_at)
+
+    def test_update_removes_contacts_not_sent(self):
+        """Testa que contatos ausentes no PUT são removidos."""
+        professional = self.create_professional()
+        data = {
+            **self.professional_data,
+            "contacts": [{"kind": "email", "value": "joao.santos@email.com"}],
+        }
+
+        self.client.put(
+            f"/api/v1/professionals/{professional.uuid}/",
+            data=data,
+            format="json",
+        )
+
+        self.assertEqual(
+            list(professional.contacts.values_list("kind", flat=True)), ["email"]
+        )
+
+    def test_update_rolls_back_on_failure(self):
+        """Testa que uma falha no meio da atualização não deixa o profissional sem contatos."""
+        professional = self.create_professional()
+        data = {
+            **self.professional_data,
+            "contacts": [{"kind": "phone", "value": "1133334444"}],
+            "address": dict(self.professional_data["address"]),
+        }
+
+        with mock.patch.object(
+            Contact.objects, "bulk_update", side_effect=DatabaseError
+        ):
+            with self.assertRaises(DatabaseError):
+                ProfessionalService.update(professional, data)
+
+        professional.refresh_from_db()
+        self.assertEqual(professional.social_name, "Dr. João Santos")
+        self.assertEqual(professional.contacts.count(), 2)
+        self.assertEqual(professional.addresses.get().street, "Av. Paulista")
+
+
+class TestProfessionalBatchCreate(ProfessionalAPITestCase):
+    """Testes para criação em lote (POST /api/v1/professionals/batch/)."""
+
+    def build_items(self, total):
+        """Gera itens válidos com nomes distintos."""
+        return [
+            {**self.professional_data, "social_name": f"Profissional {index}"}
+            for index in range(total)
+        ]
+
+    def test_batch_create_returns_201_when_all_valid(self):
+        """Testa que um lote totalmente válido retorna 201 com um resultado por item."""
+        response = self.client.post(
+            "/api/v1/professionals/batch/",
+            data=self.build_items(3),
+            format="json",
+        )
+        data = response.json()
+
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(data["created"], 3)
+        self.assertEqual(data["failed"], 0)
+        self.assertEqual([r["index"] for r in data["results"]], [0, 1, 2])
+        self.assertEqual(Professional.objects.count(), 3)
+        self.assertEqual(Address.objects.count(), 3)
+        self.assertEqual(Contact.objects.count(), 6)
+
+    def test_batch_create_persists_nested_data(self):
+        """Testa que endereço e contatos de cada item são gravados."""
+        response = self.client.post(
+            "/api/v1/professionals/batch/",
+            data=self.build_items(2),
+            format="json",
+        )
+        created_uuid = response.json()["results"][1]["uuid"]
+
+        professional = Professional.objects.get(uuid=created_uuid)
+        self.assertEqual(professional.social_name, "Profissional 1")
+        self.assertEqual(professional.addresses.get().zip_code, "01234567")
+        self.assertEqual(
+            sorted(professional.contacts.values_list("kind", flat=True)),
+            ["email", "whatsapp"],
+        )
+
+    def test_batch_create_invalid_item_does_not_abort_others(self):
+        """Testa que um item inválido é reportado sem impedir os demais."""
+        items = self.build_items(3)
+        items[1] = {**items[1], "contacts": []}
+
+        response = self.client.post(
+            "/api/v1/professionals/batch/",
+            data=items,
+            format="json",
+        )
+        data = response.json()
+
+        self.assertEqual(response.status_code, status.HTTP_207_MULTI_STATUS)
+        self.assertEqual(data["created"], 2)
+        self.assertEqual(data["failed"], 1)
+        self.assertEqual(data["results"][1]["status"], "error")
+        self.assertIn("contacts", data["results"][1]["errors"])
+        self.assertEqual(Professional.objects.count(), 2)
+
+    def test_batch_create_accepts_ndjson(self):
+        """Testa que o corpo NDJSON é aceito, reportando linhas malformadas."""
+        lines = [json.dumps(item) for item in self.build_items(2)]
+        body = "\n".join([lines[0], "{not json", lines[1]]) + "\n"
+
+        response = self.client.post(
+            "/api/v1/professionals/batch/",
+            data=body,
+            content_type="application/x-ndjson",
+        )
+        data = response.json()
+
+        self.assertEqual(response.status_code, status.HTTP_207_MULTI_STATUS)
+        self.assertEqual(data["created"], 2)
+        self.assertEqual(data["results"][1]["status"], "error")
+        self.assertEqual(Professional.objects.count(), 2)
+
+    def test_batch_create_reports_undecodable_ndjson_line(self):
+        """Testa que uma linha fora do UTF-8 vira erro só no seu item."""
+        lines = [json.dumps(item).encode() for item in self.build_items(2)]
+        body = b"\n".join([lines[0], b'{"social_name": "Jo\xe3o"}', lines[1]])
+
+        response = self.client.post(
+            "/api/v1/professionals/batch/",
+            data=body,
+            content_type="application/x-ndjson",
+        )
+        data = response.json()
+
+        self.assertEqual(response.status_code, status.HTTP_207_MULTI_STATUS)
+        self.assertEqual(data["created"], 2)
+        self.assertEqual(data["results"][1]["status"], "error")
+        self.assertEqual(Professional.objects.count(), 2)
+
+    def test_batch_create_inserts_in_chunks(self):
+        """Testa que cada lote grava com um INSERT por tabela."""
+        with mock.patch(
+            "app.professionals.views.ProfessionalViewSet.batch_chunk_size", 2
+        ):
+            with CaptureQueriesContext(connection) as context:
+                response = self.client.post(
+                    "/api/v1/professionals/batch/",
+                    data=self.build_items(4),
+                    format="json",
+                )
+
+        self.assertEqual(response.json()["created"], 4)
+        inserts = [q for q in context.captured_queries if q["sql"].startswith("INSERT")]
+        self.assertEqual(len(inserts), 6)
+
+    def test_batch_create_with_object_body_returns_400(self):
+        """Testa que um corpo que não é lista retorna 400."""
+        response = self.client.post(
+            "/api/v1/professionals/batch/",
+            data=self.professional_data,
+            format="json",
+        )
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+
+class TestProfessionalSearch(ProfessionalAPITestCase):
+    """Testes para a busca de profissionais (GET /api/v1/professionals/?search=)."""
+
+    def setUp(self):
+        """Cria profissionais em cidades e profissões distintas via service."""
+        super().setUp()
+        self.psychologist = self.create_searchable(
+            "Ana Souza", "Psicóloga", "Boa Viagem", "Recife"
+        )
+        self.doctor = self.create_searchable(
+            "Bruno Lima", "Médico", "Centro", "São Paulo"
+        )
+        self.nurse = self.create_searchable(
+            "Carla Psicóloga Reis", "Enfermeira", "Pituba", "Salvador"
+        )
+
+    def create_searchable(self, social_name, profession, neighborhood, city):
+        """Cria um profissional pelo service, que preenche o documento de busca."""
+        data = {
+            **self.professional_data,
+            "social_name": social_name,
+            "profession": profession,
+            "address": {
+                **self.professional_data["address"],
+                "neighborhood": neighborhood,
+                "city": city,
+            },
+        }
+        return ProfessionalService.create(data)
+
+    def search(self, term):
+        """Retorna os UUIDs encontrados, na ordem da resposta."""
+        response = self.client.get("/api/v1/professionals/", {"search": term})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        return [result["uuid"] for result in response.json()["results"]]
+
+    def test_search_matches_profession_and_city(self):
+        """Testa que profissão e cidade juntas colocam o profissional no topo."""
+        results = self.search("psicóloga em Recife")
+
+        self.assertEqual(results[0], str(self.psychologist.uuid))
+        self.assertNotIn(str(self.doctor.uuid), results)
+
+    def test_search_is_accent_insensitive(self):
+        """Testa que a busca ignora acentos no termo e nos dados."""
+        self.assertEqual(self.search("sao paulo"), [str(self.doctor.uuid)])
+        self.assertEqual(self.search("MÉDICO"), [str(self.doctor.uuid)])
+
+    def test_search_tolerates_typos(self):
+        """Testa que erros de digitação ainda encontram o profissional."""
+        self.assertEqual(self.search("Salvadr"), [str(self.nurse.uuid)])
+
+    def test_search_ranks_name_matches_above_profession(self):
+        """Testa que a ordem segue a relevância, com peso maior para o nome."""
+        self.assertEqual(
+            self.search("psicóloga"),
+            [str(self.nurse.uuid), str(self.psychologist.uuid)],
+        )
+
+    def test_search_follows_address_updates(self):
+        """Testa que o documento de busca acompanha a troca de endereço."""
+        data = {
+            **self.professional_data,
+            "social_name": "Bruno Lima",
+            "profession": "Médico",
+            "address": {**self.professional_data["address"], "city": "Recife"},
+        }
+        self.client.put(
+            f"/api/v1/professionals/{self.doctor.uuid}/", data=data, format="json"
+        )
+
+        self.assertIn(str(self.doctor.uuid), self.search("médico recife"))
+        self.assertEqual(self.search("médico são paulo"), [])
+
+    def test_search_without_matches_returns_empty_list(self):
+        """Testa que um termo sem correspondência retorna lista vazia."""
+        response = self.client.get("/api/v1/professionals/", {"search": "dentista"})
+
+        self.assertEqual(response.json()["count"], 0)
+
+
+class TestProfessionalNear(ProfessionalAPITestCase):
+    """Testes para a busca por proximidade (GET /api/v1/professionals/?near=)."""
+
+    def setUp(self):
+        """Cria profissionais em Recife, Olinda e São Paulo pela API."""
+        super().setUp()
+        self.recife = self.create_with_zip_code("50030230")
+        self.olinda = self.create_with_zip_code("53020010")
+        self.sao_paulo = self.create_with_zip_code("01310100")
+
+    def create_with_zip_code(self, zip_code, **fields):
+        """Cria um profissional com o CEP informado e retorna seu UUID."""
+        data = {
+            **self.professional_data,
+            **fields,
+            "address": {**self.professional_data["address"], "zip_code": zip_code},
+        }
+        response = self.client.post("/api/v1/professionals/", data=data, format="json")
+        return response.json()["uuid"]
+
+    def test_address_coordinates_come_from_zip_code(self):
+        """Testa que latitude e longitude são derivadas do prefixo do CEP."""
+        address = Address.objects.get(professional__uuid=self.recife)
+
+        self.assertAlmostEqual(address.latitude, -8.0476, places=3)
+        self.assertAlmostEqual(address.longitude, -34.8770, places=3)
+
+    def test_address_coordinates_follow_zip_code_updates(self):
+        """Testa que trocar o CEP recalcula as coordenadas."""
+        data = {
+            **self.professional_data,
+            "address": {**self.professional_data["address"], "zip_code": "90010000"},
+        }
+        self.client.put(
+            f"/api/v1/professionals/{self.recife}/", data=data, format="json"
+        )
+
+        address = Address.objects.get(professional__uuid=self.recife)
+        self.assertAlmostEqual(address.latitude, -30.0346, places=3)
+
+    def test_near_returns_professionals_within_radius_by_distance(self):
+        """Testa que apenas os profissionais no raio voltam, do mais próximo."""
+        response = self.client.get(
+            "/api/v1/professionals/", {"near": "-8.01,-34.86", "radius_km": 20}
+        )
+        results = response.json()["results"]
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual([r["uuid"] for r in results], [self.olinda, self.recife])
+        self.assertLessEqual(results[0]["distance_km"], results[1]["distance_km"])
+
+    def test_near_lists_professional_once_at_nearest_address(self):
+        """Testa que vários endereços no raio não repetem o profissional."""
+        olinda = Professional.objects.get(uuid=self.olinda)
+        Address.objects.create(
+            professional=olinda,
+            street="Rua da Aurora",
+            neighborhood="Boa Vista",
+            city="Recife",
+            state="PE",
+            zip_code="50050000",
+        )
+
+        response = self.client.get(
+            "/api/v1/professionals/", {"near": "-8.01,-34.86", "radius_km": 20}
+        )
+        body = response.json()
+
+        self.assertEqual(body["count"], 2)
+        self.assertEqual(
+            [r["uuid"] for r in body["results"]], [self.olinda, self.recife]
+        )
+        self.assertLessEqual(
+            body["results"][0]["distance_km"], body["results"][1]["distance_km"]
+        )
+
+    def test_near_with_search_orders_by_distance_then_relevance(self):
+        """Testa que, com search e near, a distância ordena e a relevância desempata."""
+        relevant = self.create_with_zip_code(
+            "50030230", social_name="Maria", profession="Maria"
+        )
+        searched = self.client.get("/api/v1/professionals/", {"search": "Maria"})
+        self.assertEqual(searched.json()["results"][0]["uuid"], relevant)
+
+        response = self.client.get(
+            "/api/v1/professionals/",
+            {"search": "Maria", "near": "-8.01,-34.86", "radius_km": 20},
+        )
+
+        self.assertEqual(
+            [r["uuid"] for r in response.json()["results"]],
+            [self.olinda, relevant, self.recife],
+        )
+
+    def test_near_uses_default_radius(self):
+        """Testa que sem radius_km o raio padrão de 10 km é aplicado."""
+        response = self.client.get("/api/v1/professionals/", {"near": "-23.55,-46.63"})
+
+        self.assertEqual(
+            [r["uuid"] for r in response.json()["results"]], [self.sao_paulo]
+        )
+
+    def test_near_with_invalid_coordinates_returns_400(self):
+        """Testa que coordenadas malformadas ou fora do intervalo retornam 400."""
+        for near in ["abc", "-8.05", "-95,10"]:
+            response = self.client.get("/api/v1/professionals/", {"near": near})
+            self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+            self.assertIn("near", response.json())
+
+
+@override_settings(SHARED_CACHE=True)
+class TestProfessionalFacets(ProfessionalAPITestCase):
+    """Testes para filtros e contagens por faceta."""
+
+    def setUp(self):
+        """Cria profissionais em profissões e cidades distintas pela API."""
+        super().setUp()
+        cache.clear()
+        self.recife = self.create_via_api("Psicóloga", "Recife", "PE", ["whatsapp"])
+        self.create_via_api("Psicóloga", "São Paulo", "SP", ["email", "email"])
+        self.create_via_api("Médica", "São Paulo", "SP", ["email"])
+
+    def create_via_api(self, profession, city, state, kinds):
+        """Cria um profissional com a profissão, cidade e contatos informados."""
+        data = {
+            **self.professional_data,
+            "profession": profession,
+            "address": {
+                **self.professional_data["address"],
+                "city": city,
+                "state": state,
+            },
+            "contacts": [
+                {"kind": kind, "value": f"contato-{index}"}
+                for index, kind in enumerate(kinds)
+            ],
+        }
+        with self.captureOnCommitCallbacks(execute=True):
+            response = self.client.post(
+                "/api/v1/professionals/", data=data, format="json"
+            )
+        return response.json()["uuid"]
+
+    def list_count(self, **params):
+        """Retorna o total da listagem com os filtros informados."""
+        return self.client.get("/api/v1/professionals/", params).json()["count"]
+
+    def test_facets_count_professionals_per_value(self):
+        """Testa as contagens, com o profissional contado uma vez por valor."""
+        data = self.client.get("/api/v1/professionals/facets/").json()
+
+        self.assertEqual(
+            data["profession"],
+            [{"value": "Psicóloga", "count": 2}, {"value": "Médica", "count": 1}],
+        )
+        self.assertEqual(
+            data["city"],
+            [{"value": "São Paulo", "count": 2}, {"value": "Recife", "count": 1}],
+        )
+        self.assertEqual(data["state"][0], {"value": "SP", "count": 2})
+        self.assertEqual(
+            data["kind"],
+            [{"value": "email", "count": 2}, {"value": "whatsapp", "count": 1}],
+        )
+
+    def test_facets_use_single_query_and_cache(self):
+        """Testa que as contagens vêm de uma consulta e depois do cache."""
+        with CaptureQueriesContext(connection) as context:
+            self.client.get("/api/v1/professionals/facets/")
+        self.assertEqual(len(context.captured_queries), 1)
+        self.assertIn("GROUPING SETS", context.captured_queries[0]["sql"])
+
+        with self.assertNumQueries(0):
+            self.client.get("/api/v1/professionals/facets/")
+
+    @override_settings(SHARED_CACHE=False)
+    def test_facets_are_counted_on_every_request_without_shared_cache(self):
+        """Testa que, com cache local a cada worker, as contagens não são guardadas."""
+        self.client.get("/api/v1/professionals/facets/")
+        with self.assertNumQueries(1):
+            self.client.get("/api/v1/professionals/facets/")
+
+        self.assertIsNone(cache.get(ProfessionalService.facets_cache_key))
+
+    def test_facets_are_invalidated_on_create_and_delete(self):
+        """Testa que criar e excluir profissionais descarta o cache."""
+        self.client.get("/api/v1/professionals/facets/")
+        uuid = self.create_via_api("Enfermeira", "Recife", "PE", ["phone"])
+
+        data = self.client.get("/api/v1/professionals/facets/").json()
+        self.assertIn({"value": "Enfermeira", "count": 1}, data["profession"])
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.client.delete(f"/api/v1/professionals/{uuid}/")
+
+        data = self.client.get("/api/v1/professionals/facets/").json()
+        self.assertNotIn({"value": "Enfermeira", "count": 1}, data["profession"])
+
+    def test_facets_are_invalidated_on_update(self):
+        """Testa que atualizar um profissional descarta o cache."""
+        self.client.get("/api/v1/professionals/facets/")
+        data = {**self.professional_data, "profession": "Nutricionista"}
+        with self.captureOnCommitCallbacks(execute=True):
+            self.client.put(
+                f"/api/v1/professionals/{self.recife}/", data=data, format="json"
+            )
+
+        facets = self.client.get("/api/v1/professionals/facets/").json()
+        self.assertIn({"value": "Nutricionista", "count": 1}, facets["profession"])
+
+    def test_list_filters_by_facets(self):
+        """Testa os filtros da listagem, combinados e sem duplicar profissionais."""
+        self.assertEqual(self.list_count(profession="Psicóloga"), 2)
+        self.assertEqual(self.list_count(city="São Paulo"), 2)
+        self.assertEqual(self.list_count(state="PE"), 1)
+        self.assertEqual(self.list_count(kind="email"), 2)
+        self.assertEqual(self.list_count(profession="Psicóloga", city="São Paulo"), 1)
+        self.assertEqual(self.list_count(profession="Dentista"), 0)
+
+
+@override_settings(SHARED_CACHE=True)
+class TestProfessionalResponseCache(ProfessionalAPITestCase):
+    """Testes para o cache de respostas de detalhe e listagem."""
+
+    def setUp(self):
+        super().setUp()
+        self.professional = self.create_professional()
+        self.detail_url = f"/api/v1/professionals/{self.professional.uuid}/"
+
+    def test_retrieve_is_served_from_cache(self):
+        """Testa que o segundo detalhe não consulta o banco."""
+        first = self.client.get(self.detail_url)
+        with self.assertNumQueries(0):
+            second = self.client.get(self.detail_url)
+
+        self.assertEqual(first["X-Cache"], "MISS")
+        self.assertEqual(second["X-Cache"], "HIT")
+        self.assertEqual(first.json(), second.json())
+
+    def test_retrieve_key_uses_normalized_uuid(self):
+        """Testa que o UUID em maiúsculas usa a mesma entrada do detalhe."""
+        self.client.get(self.detail_url)
+        with self.assertNumQueries(0):
+            response = self.client.get(
+                f"/api/v1/professionals/{str(self.professional.uuid).upper()}/"
+            )
+
+        self.assertEqual(response["X-Cache"], "HIT")
+
+    @override_settings(SHARED_CACHE=False)
+    def test_responses_are_not_cached_without_shared_cache(self):
+        """Testa que, com cache local a cada worker, as leituras vão ao banco."""
+        self.client.get(self.detail_url)
+        self.client.get("/api/v1/professionals/")
+
+        with self.assertNumQueries(4):
+            detail = self.client.get(self.detail_url)
+        with self.assertNumQueries(4):
+            listing = self.client.get("/api/v1/professionals/")
+
+        self.assertNotIn("X-Cache", detail)
+        self.assertNotIn("X-Cache", listing)
+        self.assertEqual(
+            self.client.get("/api/v1/professionals/cache-stats/").json()["detail"],
+            {"hits": 0, "misses": 0},
+        )
+
+    def test_list_is_cached_per_query_string(self):
+        """Testa que cada query string tem sua própria página em cache."""
+        self.client.get("/api/v1/professionals/")
+        with self.assertNumQueries(0):
+            response = self.client.get("/api/v1/professionals/")
+        self.assertEqual(response["X-Cache"], "HIT")
+
+        response = self.client.get("/api/v1/professionals/", {"profession": "Médica"})
+        self.assertEqual(response["X-Cache"], "MISS")
+        self.assertEqual(response.json()["count"], 0)
+
+    def test_contact_change_invalidates_detail_and_list(self):
+        """Testa que alterar os contatos descarta o detalhe e as páginas."""
+        self.client.get(self.detail_url)
+        self.client.get("/api/v1/professionals/")
+        self.professional_data["contacts"].append(
+            {"kind": "phone", "value": "1133334444"}
+        )
+        self.client.put(self.detail_url, data=self.professional_data, format="json")
+
+        detail = self.client.get(self.detail_url)
+        listing = self.client.get("/api/v1/professionals/")
+
+        self.assertEqual(detail["X-Cache"], "MISS")
+        self.assertEqual(len(detail.json()["contacts"]), 3)
+        self.assertEqual(listing["X-Cache"], "MISS")
+
+    def test_address_change_invalidates_detail(self):
+        """Testa que alterar o endereço descarta o detalhe em cache."""
+        self.client.get(self.detail_url)
+        self.professional_data["address"]["city"] = "Recife"
+        self.client.put(self.detail_url, data=self.professional_data, format="json")
+
+        response = self.client.get(self.detail_url)
+
+        self.assertEqual(response["X-Cache"], "MISS")
+        self.assertEqual(response.json()["address"]["city"], "Recife")
+
+    def test_delete_invalidates_detail(self):
+        """Testa que um profissional excluído não é servido do cache."""
+        self.client.get(self.detail_url)
+        self.client.delete(self.detail_url)
+
+        response = self.client.get(self.detail_url)
+
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+    def test_batch_create_invalidates_list(self):
+        """Testa que o lote, que não dispara post_save, também invalida a listagem."""
+        self.client.get("/api/v1/professionals/")
+        self.client.post(
+            "/api/v1/professionals/batch/",
+            data=[self.professional_data],
+            format="json",
+        )
+
+        response = self.client.get("/api/v1/professionals/")
+
+        self.assertEqual(response["X-Cache"], "MISS")
+        self.assertEqual(response.json()["count"], 2)
+
+    def test_cache_stats_counts_hits_and_misses(self):
+        """Testa os contadores expostos em cache-stats."""
+        for _ in range(3):
+            self.client.get(self.detail_url)
+        self.client.get("/api/v1/professionals/")
+
+        stats = self.client.get("/api/v1/professionals/cache-stats/").json()
+
+        self.assertEqual(stats["detail"], {"hits": 2, "misses": 1})
+        self.assertEqual(stats["list"], {"hits": 0, "misses": 1})
+
+
+class TestProfessionalConditionalRequests(ProfessionalAPITestCase):
+    """Testes para ETag, Last-Modified e requisições condicionais."""
+
+    def setUp(self):
+        super().setUp()
+        self.professional = self.create_professional()
+        self.detail_url = f"/api/v1/professionals/{self.professional.uuid}/"
+
+    @override_settings(SHARED_CACHE=True)
+    def test_cached_retrieve_with_current_etag_returns_304_without_queries(self):
+        """Testa que o ETag guardado no cache responde 304 sem consultar o banco."""
+        etag = self.client.get(self.detail_url)["ETag"]
+
+        with self.assertNumQueries(0):
+            response = self.client.get(self.detail_url, HTTP_IF_NONE_MATCH=etag)
+
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+        self.assertEqual(response["ETag"], etag)
+        self.assertEqual(response["X-Cache"], "HIT")
+
+    def test_uncached_list_with_current_etag_returns_304(self):
+        """Testa que, fora do cache, o 304 lê só a página, sem serializá-la."""
+        etag = self.client.get("/api/v1/professionals/")["ETag"]
+        cache.clear()
+
+        with self.assertNumQueries(2):
+            response = self.client.get(
+                "/api/v1/professionals/", HTTP_IF_NONE_MATCH=etag
+            )
+
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+
+    def test_contact_change_changes_etag(self):
+        """Testa que alterar um contato renova o updated_at e o ETag do profissional."""
+        etag = self.client.get(self.detail_url)["ETag"]
+        self.professional_data["contacts"] = self.professional_data["contacts"][:1]
+        self.client.put(self.detail_url, data=self.professional_data, format="json")
+
+        response = self.client.get(self.detail_url, HTTP_IF_NONE_MATCH=etag)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertNotEqual(response["ETag"], etag)
+        self.assertEqual(len(response.json()["contacts"]), 1)
+
+    def test_update_with_stale_etag_returns_412(self):
+        """Testa que If-Match desatualizado barra a atualização."""
+        etag = self.client.get(self.detail_url)["ETag"]
+        self.professional.profession = "Psiquiatra"
+        self.professional.save()
+
+        response = self.client.put(
+            self.detail_url,
+            data=self.professional_data,
+            format="json",
+            HTTP_IF_MATCH=etag,
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_412_PRECONDITION_FAILED)
+        self.professional.refresh_from_db()
+        self.assertEqual(self.professional.profession, "Psiquiatra")
+
+    def test_update_with_current_etag_succeeds(self):
+        """Testa que If-Match com o ETag atual permite a atualização."""
+        etag = self.client.get(self.detail_url)["ETag"]
+
+        response = self.client.put(
+            self.detail_url,
+            data=self.professional_data,
+            format="json",
+            HTTP_IF_MATCH=etag,
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.json()["social_name"], "Dr. Maria Silva")
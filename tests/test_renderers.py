@@ -0,0 +1,150 @@
+import uuid
+from datetime import date, datetime, timedelta, timezone
+from decimal import Decimal
+from io import BytesIO
+from types import SimpleNamespace
+from unittest import mock
+
+from django.utils.timezone import localtime
+from rest_framework.exceptions import ParseError
+from rest_framework.parsers import JSONParser
+from rest_framework.renderers import JSONRenderer
+from rest_framework.test import APITestCase
+
+from app.appointments.models import Appointment
+from app.core.parsers import ORJSONParser
+from app.core.renderers import ORJSONRenderer
+from app.professionals.models import Professional
+
+
+class TestORJSONRenderer(APITestCase):
+    """Testes de paridade entre o ORJSONRenderer e o JSONRenderer do DRF."""
+
+    def setUp(self):
+        self.professional = Professional.objects.create(
+            social_name="Dra. Conceição Araújo", profession="Psicóloga"
+        )
+        Appointment.objects.create(
+            professional=self.professional,
+            date=datetime(2030, 5, 10, 14, 30, tzinfo=timezone.utc),
+        )
+
+    def assert_same_bytes(self, data, accepted_media_type=None):
+        self.assertEqual(
+            ORJSONRenderer().render(data, accepted_media_type),
+            JSONRenderer().render(data, accepted_media_type),
+        )
+
+    def test_native_types_match(self):
+        """Testa UUID, datetimes (São Paulo, UTC e com microssegundos) e Decimal."""
+        moment = datetime(2030, 5, 10, 14, 30, 0, 1234, tzinfo=timezone.utc)
+        self.assert_same_bytes(
+            {
+                "uuid": uuid.uuid4(),
+                "sao_paulo": localtime(moment),
+                "utc": moment.replace(microsecond=0),
+                "date": date(2030, 5, 10),
+                "duration": timedelta(minutes=50),
+                "price": Decimal("150.50"),
+                "distance_km": 12.3,
+                "text": 'ação\u2028\u2029 "aspas"',
+                "items": (1, None, True),
+            }
+        )
+
+    def test_data_rejected_by_orjson_falls_back(self):
+        """Testa chaves que não são str e inteiros além de 64 bits."""
+        for data in [
+            {1: "um", None: "nulo", False: "não", 2.5: "meio"},
+            {"contacts": [{"kind": {"email": 1, 2: "dois"}}]},
+            {"big": 2**64, "negative": -(2**63) - 1, "nested": [10**30]},
+        ]:
+            with self.subTest(data=data):
+                self.assert_same_bytes(data)
+
+    def test_divergent_floats_fall_back(self):
+        """Testa floats que o orjson escreveria diferente, também via Decimal."""
+        for data in [
+            {"small": 1e-07},
+            {"items": [1.5e-05, -9.999999999999999e-05, 5e-324]},
+            {"price": Decimal("1E-7")},
+            {"edge": [1e-4, 1e16, 0.0, -0.0]},
+        ]:
+            with self.subTest(data=data):
+                self.assert_same_bytes(data)
+
+    def test_nan_and_infinity_raise_like_json_renderer(self):
+        """Testa que NaN e Infinity são recusados, como no JSONRenderer estrito."""
+        for data in [
+            {"value": float("nan")},
+            {"values": [1, {"value": float("-inf")}]},
+            {"price": Decimal("NaN")},
+        ]:
+            with self.subTest(data=data):
+                with self.assertRaises(ValueError) as expected:
+                    JSONRenderer().render(data)
+                with self.assertRaisesMessage(ValueError, str(expected.exception)):
+                    ORJSONRenderer().render(data)
+
+    def test_float_fields_limit_the_check(self):
+        """Testa que, com float_fields na view, só esses campos são verificados."""
+        context = {"view": SimpleNamespace(float_fields=("distance_km",))}
+        page = {"count": 2, "results": [{"distance_km": 12.3}, {"distance_km": 1e-07}]}
+
+        with mock.patch("app.core.renderers._has_divergent_float") as walk:
+            rendered = ORJSONRenderer().render(page, renderer_context=context)
+        walk.assert_not_called()
+        self.assertEqual(rendered, JSONRenderer().render(page))
+        for data in [{"distance_km": float("nan")}, [{"distance_km": float("inf")}]]:
+            with self.subTest(data=data):
+                with self.assertRaises(ValueError):
+                    ORJSONRenderer().render(data, renderer_context=context)
+
+    def test_views_without_floats_skip_the_check(self):
+        """Testa que views com float_fields vazio não percorrem os dados."""
+        with mock.patch("app.core.renderers._has_divergent_float") as walk:
+            response = self.client.get("/api/v1/appointments/")
+        walk.assert_not_called()
+        self.assertEqual(response.content, JSONRenderer().render(response.data))
+
+    def test_api_responses_match(self):
+        """Testa que as respostas da API saem iguais às do JSONRenderer."""
+        for url in ["/api/v1/appointments/", "/api/v1/professionals/"]:
+            with self.subTest(url=url):
+                response = self.client.get(url)
+
+                self.assertIsInstance(response.accepted_renderer, ORJSONRenderer)
+                self.assertEqual(response.content, JSONRenderer().render(response.data))
+
+    def test_indent_and_empty_body(self):
+        """Testa o indent pedido no Accept e o corpo vazio."""
+        self.assert_same_bytes({"a": [1, 2]}, "application/json; indent=4")
+        self.assertEqual(ORJSONRenderer().render(None), b"")
+
+
+class TestORJSONParser(APITestCase):
+    """Testes para o ORJSONParser."""
+
+    def test_parses_like_json_parser(self):
+        """Testa que o corpo é decodificado como pelo JSONParser."""
+        body = '{"social_name": "Dra. Conceição", "contacts": [1, 2.5, null]}'
+
+        self.assertEqual(
+            ORJSONParser().parse(BytesIO(body.encode())),
+            JSONParser().parse(BytesIO(body.encode())),
+        )
+
+    def test_out_of_range_number_raises_parse_error(self):
+        """Testa que 1e400 é recusado, enquanto o JSONParser o lê como infinito."""
+        body = b'{"radius_km": 1e400}'
+
+        self.assertEqual(JSONParser().parse(BytesIO(body)), {"radius_km": float("inf")})
+        with self.assertRaises(ParseError):
+            ORJSONParser().parse(BytesIO(body))
+
+    def test_invalid_body_raises_parse_error(self):
+        """Testa JSON inválido e NaN, recusados como no JSONParser estrito."""
+        for body in [b"{", b'{"a": NaN}']:
+            with self.subTest(body=body):
+                with self.assertRaises(ParseError):
+                    ORJSONParser().parse(BytesIO(body))
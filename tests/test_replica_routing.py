@@ -0,0 +1,85 @@
+from unittest import mock
+
+from django.contrib.auth import get_user_model
+from django.db import DEFAULT_DB_ALIAS
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from app.core import routers
+from app.core.routers import REPLICA_ALIAS, PrimaryReplicaRouter
+from app.professionals.models import Professional
+
+User = get_user_model()
+
+APPOINTMENTS_URL = "/api/v1/appointments/"
+PROFESSIONALS_URL = "/api/v1/professionals/"
+
+
+class TestPrimaryReplicaRouter(APITestCase):
+    """Testes para o roteador sem réplica configurada."""
+
+    def test_without_replica_everything_goes_to_primary(self):
+        """Testa que, sem DB_REPLICA_HOST, nenhuma leitura vai à réplica."""
+        router = PrimaryReplicaRouter()
+        routers.set_replica_reads(True)
+        self.addCleanup(routers.set_replica_reads, False)
+
+        self.assertIsNone(router.db_for_read(Professional))
+        self.assertEqual(router.db_for_write(Professional), DEFAULT_DB_ALIAS)
+        self.assertFalse(router.allow_migrate(REPLICA_ALIAS, "professionals"))
+
+
+class TestReplicaReads(APITestCase):
+    """Testes para o envio das leituras dos viewsets à réplica."""
+
+    def setUp(self):
+        self.user = User.objects.create_user(username="testuser", password="pass")
+        self.other = User.objects.create_user(username="other", password="pass")
+        self.client.force_authenticate(user=self.user)
+        self.routes = []
+
+        def record(router, model, **hints):
+            self.routes.append(routers.reading_from_replica())
+            # A réplica não existe nos testes; a consulta segue no primário
+            return None
+
+        patches = [
+            mock.patch.object(routers, "replica_configured", return_value=True),
+            mock.patch("app.core.viewsets.replica_configured", return_value=True),
+            mock.patch.object(
+                PrimaryReplicaRouter, "db_for_read", autospec=True, side_effect=record
+            ),
+        ]
+        for patch in patches:
+            patch.start()
+            self.addCleanup(patch.stop)
+
+    def get_routes(self, url):
+        self.routes = []
+        response = self.client.get(url)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        return self.routes
+
+    def test_safe_requests_read_from_replica(self):
+        """Testa que as leituras da listagem vão à réplica e a marca é desfeita."""
+        routes = self.get_routes(APPOINTMENTS_URL)
+
+        self.assertTrue(routes)
+        self.assertTrue(all(routes))
+        self.assertFalse(routers.reading_from_replica())
+
+    def test_client_reads_primary_after_writing(self):
+        """Testa read-your-writes: quem acabou de escrever lê do primário."""
+        self.client.delete(f"{APPOINTMENTS_URL}00000000-0000-0000-0000-000000000000/")
+
+        self.assertFalse(any(self.get_routes(APPOINTMENTS_URL)))
+
+        self.client.force_authenticate(user=self.other)
+        self.assertTrue(all(self.get_routes(APPOINTMENTS_URL)))
+
+    def test_cache_invalidation_pins_professionals_to_primary(self):
+        """Testa que, após invalidar o cache, o cache é remontado do primário."""
+        Professional.objects.create(social_name="Dr. João", profession="Psicólogo")
+
+        self.assertFalse(any(self.get_routes(PROFESSIONALS_URL)))
+        self.assertTrue(all(self.get_routes(APPOINTMENTS_URL)))
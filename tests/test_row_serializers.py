@@ -0,0 +1,107 @@
+from datetime import datetime, timedelta, timezone
+from io import StringIO
+
+from django.core.management import call_command
+from rest_framework.renderers import JSONRenderer
+from rest_framework.test import APITestCase
+
+from app.appointments.models import Appointment
+from app.appointments.serializers import (
+    AppointmentDetailSerializer,
+    AppointmentRowSerializer,
+)
+from app.professionals.models import Address, Contact, Professional
+from app.professionals.serializers import (
+    ProfessionalDetailRowSerializer,
+    ProfessionalDetailSerializer,
+    ProfessionalRowSerializer,
+    ProfessionalSerializer,
+)
+from app.professionals.services import ProfessionalService
+
+
+class TestRowSerializerParity(APITestCase):
+    """Testes de paridade entre os serializers do DRF e os RowSerializer."""
+
+    def setUp(self):
+        self.recife = Professional.objects.create(
+            social_name="Dra. Ana Lima", profession="Psicóloga"
+        )
+        Address.objects.create(
+            professional=self.recife,
+            street="Rua da Aurora",
+            number=None,
+            neighborhood="Boa Vista",
+            complement=None,
+            city="Recife",
+            state="PE",
+            zip_code="50050000",
+            latitude=-8.06,
+            longitude=-34.88,
+        )
+        Contact.objects.create(professional=self.recife, kind="phone", value="81999")
+        Contact.objects.create(professional=self.recife, kind="email", value="a@b.c")
+        # Sem endereço nem contatos
+        self.empty = Professional.objects.create(
+            social_name="Dr. Bruno Reis", profession="Nutricionista"
+        )
+
+        date = datetime(2030, 5, 10, 14, 30, tzinfo=timezone.utc)
+        for offset, professional in enumerate([self.recife, self.empty, self.recife]):
+            Appointment.objects.create(
+                professional=professional, date=date + timedelta(hours=offset)
+            )
+
+    def assert_same_output(self, serializer_class, row_serializer_class, queryset):
+        expected = serializer_class(
+            queryset.prefetch_related(*serializer_class.get_prefetches()), many=True
+        ).data
+        row_serializer = row_serializer_class()
+        actual = row_serializer.serialize(list(row_serializer.values(queryset)))
+
+        renderer = JSONRenderer()
+        self.assertEqual(renderer.render(actual), renderer.render(expected))
+
+    def test_professional_list_matches(self):
+        """Testa a listagem, com e sem endereço, contatos e campos nulos."""
+        self.assert_same_output(
+            ProfessionalSerializer,
+            ProfessionalRowSerializer,
+            Professional.objects.all(),
+        )
+
+    def test_professional_detail_matches(self):
+        """Testa o detalhe, com created_at e updated_at."""
+        self.assert_same_output(
+            ProfessionalDetailSerializer,
+            ProfessionalDetailRowSerializer,
+            Professional.objects.all(),
+        )
+
+    def test_professional_near_matches(self):
+        """Testa a listagem por proximidade, com distance_km."""
+        queryset = ProfessionalService.near(
+            Professional.objects.all(), (-8.05, -34.9), 10
+        )
+
+        self.assert_same_output(
+            ProfessionalSerializer, ProfessionalRowSerializer, queryset
+        )
+
+    def test_appointment_list_matches(self):
+        """Testa consultas com o profissional aninhado e repetido."""
+        self.assert_same_output(
+            AppointmentDetailSerializer,
+            AppointmentRowSerializer,
+            Appointment.objects.select_related("professional").order_by("-date"),
+        )
+
+    def test_benchmark_reports_both_lists(self):
+        """Testa que o benchmark compara as duas serializações nas duas listagens."""
+        out = StringIO()
+        call_command("benchmark_serializers", rows=3, repeat=2, stdout=out)
+
+        output = out.getvalue()
+        self.assertIn("profissionais: DRF", output)
+        self.assertIn("consultas: DRF", output)
+        self.assertIn("mais rápido", output)
@@ -0,0 +1,80 @@
+from unittest import mock
+
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from app.core.throttling import UserReadWriteThrottle
+
+User = get_user_model()
+
+LIST_URL = "/api/v1/professionals/"
+MISSING_URL = "/api/v1/professionals/00000000-0000-0000-0000-000000000000/"
+
+
+class TestUserReadWriteThrottle(APITestCase):
+    """Testes para o rate limiting por janela deslizante e por escopo."""
+
+    def setUp(self):
+        self.user = User.objects.create_user(username="testuser", password="pass123")
+        self.client.force_authenticate(user=self.user)
+        self.now = 6000.0  # início da janela 100 de 60 segundos
+        patches = [
+            mock.patch.object(
+                UserReadWriteThrottle,
+                "THROTTLE_RATES",
+                {"read": "4/minute", "write": "1/minute"},
+            ),
+            mock.patch.object(
+                UserReadWriteThrottle, "timer", mock.Mock(side_effect=lambda: self.now)
+            ),
+        ]
+        for patch in patches:
+            patch.start()
+            self.addCleanup(patch.stop)
+
+    def get_statuses(self, total):
+        return [self.client.get(LIST_URL).status_code for _ in range(total)]
+
+    def test_reads_over_the_rate_return_429(self):
+        """Testa que a leitura além da taxa retorna 429 com Retry-After."""
+        self.assertEqual(self.get_statuses(4), [status.HTTP_200_OK] * 4)
+
+        response = self.client.get(LIST_URL)
+
+        self.assertEqual(response.status_code, status.HTTP_429_TOO_MANY_REQUESTS)
+        self.assertIn("Retry-After", response)
+
+    def test_reads_and_writes_have_separate_rates(self):
+        """Testa que leituras e escritas são contadas em escopos separados."""
+        self.get_statuses(4)
+
+        first = self.client.delete(MISSING_URL)
+        second = self.client.delete(MISSING_URL)
+
+        self.assertEqual(first.status_code, status.HTTP_404_NOT_FOUND)
+        self.assertEqual(second.status_code, status.HTTP_429_TOO_MANY_REQUESTS)
+
+    def test_previous_window_is_weighted_by_overlap(self):
+        """Testa que a janela anterior pesa pela fração que ainda se sobrepõe."""
+        self.get_statuses(4)
+
+        # Meia janela depois da virada: 4 * 0.5 + 2 = 4 cabe; 4 * 0.5 + 3 não
+        self.now += 90
+        self.assertEqual(
+            self.get_statuses(3),
+            [status.HTTP_200_OK, status.HTTP_200_OK, status.HTTP_429_TOO_MANY_REQUESTS],
+        )
+
+    def test_rejected_requests_are_not_counted(self):
+        """Testa que requisições recusadas não ocupam a janela."""
+        self.get_statuses(7)
+
+        self.assertEqual(cache.get(f"throttle:read:{self.user.pk}:100"), 4)
+
+    def test_counters_are_integers_per_window(self):
+        """Testa que o estado por usuário é um contador, não uma lista."""
+        self.get_statuses(3)
+
+        self.assertEqual(cache.get(f"throttle:read:{self.user.pk}:100"), 3)